@@ -0,0 +1,101 @@
+# benchmarks/bench_backends.py
+"""
+Costo por frame de cada escena de SCENE_MAP con los dos backends de dibujo:
+- surface: blits por software sobre la ventana (engine/framebuffer.py)
+- texture: pygame._sdl2 Renderer/Texture (engine/texture_backend.py)
+
+Cada backend corre en un proceso nuevo; por defecto el de texturas usa el
+Renderer por software de SDL, así que se puede correr en máquinas sin GPU.
+Se mide update + dibujo + presentación, como en el bucle del juego.
+
+Uso (desde la raíz del repo):  python benchmarks/bench_backends.py [frames] [driver]
+  driver: renderer de SDL para 'texture' ('software' por defecto, 'opengl', ...)
+"""
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WARMUP_FRAMES = 10
+
+
+def _child(backend, frames, driver):
+    """Proceso hijo: recorre las escenas con un backend y escribe los tiempos en stdout."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    import main
+    from engine.scene_loader import SceneLoader
+    main.RENDER_BACKEND = backend
+    main.TEXTURE_RENDERER_DRIVER = driver
+    game = main.Game()
+    if game.backend.textured != (backend == 'texture'):
+        print(f"RESULT * error backend '{backend}' no disponible")
+        return
+
+    dt = 1 / 60
+    for key in main.SCENE_MAP:
+        try:
+            scene = game.load_scene(key)
+            SceneLoader(scene, scene.load_steps()).finish()
+            game._activate_scene(key, scene)
+
+            def frame():
+                scene.update(dt)
+                game.state.flush()
+                if game.backend.textured:
+                    scene.draw_textures(game.backend)
+                else:
+                    game.screen.fill((0, 0, 0))
+                    scene.draw(game.screen)
+                    game.backend.present()
+
+            for _ in range(WARMUP_FRAMES):
+                frame()
+            start = time.perf_counter()
+            for _ in range(frames):
+                frame()
+            per_frame = (time.perf_counter() - start) / frames
+            print(f"RESULT {key} {per_frame * 1000:.3f}", flush=True)
+        except Exception as e:
+            print(f"RESULT {key} error {type(e).__name__}: {e}", flush=True)
+
+
+def _run(backend, frames, driver):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", backend, str(frames), driver]
+    output = subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT).stdout
+    results = {}
+    for line in output.splitlines():
+        if line.startswith("RESULT "):
+            _, key, value = line.split(" ", 2)
+            results[key] = value
+    return results
+
+
+def main(frames=200, driver="software"):
+    surface = _run("surface", frames, driver)
+    texture = _run("texture", frames, driver)
+    if "*" in texture:
+        print(f"❌ {texture['*']}")
+        return
+
+    print(f"Renderer de texturas: {driver}  ({frames} frames por escena)")
+    print(f"{'escena':>14} {'surface ms':>11} {'texture ms':>11} {'relación':>9}")
+    for key in list(surface) + [k for k in texture if k not in surface]:
+        a, b = surface.get(key, "-"), texture.get(key, "-")
+        if a.startswith("error") or b.startswith("error"):
+            print(f"{key:>14}  ❌ {a if a.startswith('error') else b}")
+            continue
+        print(f"{key:>14} {float(a):>11.2f} {float(b):>11.2f} {float(a) / float(b):>8.2f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        _child(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+             sys.argv[2] if len(sys.argv) > 2 else "software")
@@ -0,0 +1,74 @@
+# benchmarks/bench_formats.py
+"""
+Formato de pantalla elegido para cada asset de ASSET_MANIFEST (engine/pixel_format.py)
+y cuánto cuesta dibujarlo comparado con cargarlo siempre con convert_alpha().
+
+Para cada variante se miden `blits` dibujos sobre una superficie del formato
+de la pantalla, con convert_alpha() y con el formato elegido.
+
+Uso (desde la raíz del repo):  python benchmarks/bench_formats.py [blits]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _blit_time(target, surface, blits):
+    target.blit(surface, (0, 0))  # la primera pasada arma el RLE de los colorkey
+    start = time.perf_counter()
+    for _ in range(blits):
+        target.blit(surface, (0, 0))
+    return (time.perf_counter() - start) / blits
+
+
+def main(blits=200):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    import pygame
+    pygame.display.init()
+    from settings import SCREEN_SIZE, decode_asset, prepare_image
+    from engine.bake import size_spec, manifest_entry
+    from engine.pixel_format import format_name
+    from main import collect_asset_manifest
+    pygame.display.set_mode(SCREEN_SIZE)
+    target = pygame.Surface(SCREEN_SIZE).convert()
+
+    seen = set()
+    total_alpha = total_chosen = 0.0
+    counts = {}
+    print(f"{'asset':<42} {'formato':>9} {'alpha ms':>9} {'elegido ms':>11} {'ahorro':>7}")
+    for entry in collect_asset_manifest():
+        subfolder, filename, size, smooth = manifest_entry(entry)
+        key = (subfolder, filename, size_spec(size, smooth))
+        if key in seen:
+            continue
+        seen.add(key)
+        image = decode_asset(subfolder, filename, size, smooth)
+        if image is None:
+            continue
+
+        alpha = image.convert_alpha()
+        chosen = prepare_image(image, subfolder, filename, size, smooth)
+        pixel_format = format_name(chosen)
+        counts[pixel_format] = counts.get(pixel_format, 0) + 1
+
+        alpha_ms = _blit_time(target, alpha, blits) * 1000
+        chosen_ms = _blit_time(target, chosen, blits) * 1000
+        total_alpha += alpha_ms
+        total_chosen += chosen_ms
+        saving = 1 - chosen_ms / alpha_ms if alpha_ms else 0.0
+        name = f"{subfolder}/{filename}@{key[2]}"
+        print(f"{name[:42]:<42} {pixel_format:>9} {alpha_ms:>9.3f} {chosen_ms:>11.3f} {saving:>7.0%}")
+
+    summary = ", ".join(f"{n} {f}" for f, n in sorted(counts.items()))
+    saving = 1 - total_chosen / total_alpha if total_alpha else 0.0
+    print(f"\nTotal ({summary}): {total_alpha:.2f} ms -> {total_chosen:.2f} ms por dibujar cada asset una vez ({saving:.0%} menos)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
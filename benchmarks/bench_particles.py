@@ -0,0 +1,50 @@
+# benchmarks/bench_particles.py
+"""
+Costo por frame del motor de partículas (engine/particles.py) según la cantidad
+de partículas: update + draw sobre una pantalla del tamaño del juego.
+
+Uso (desde la raíz del repo):  python benchmarks/bench_particles.py [frames]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(frames=300):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    import pygame
+    pygame.display.init()
+    from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    from engine.particles import AreaEmitter, BurstEmitter, FallingEmitter, square_frames
+
+    dt = 1 / 60
+    print(f"{'partículas':>11} {'ms/frame':>9} {'fps máx':>8}")
+    for count in (100, 1000, 2500, 5000, 10000):
+        bounds = (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        stars = FallingEmitter(square_frames(6, (255, 255, 255)), count // 2, bounds)
+        sparkles = AreaEmitter(bounds, count=count // 2)
+        bursts = BurstEmitter(bounds)
+
+        start = time.perf_counter()
+        for i in range(frames):
+            if i % 10 == 0:
+                bursts.trigger(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+            for emitter in (stars, sparkles, bursts):
+                emitter.update(dt)
+            screen.fill((0, 0, 0))
+            for emitter in (stars, sparkles, bursts):
+                emitter.draw(screen)
+        per_frame = (time.perf_counter() - start) / frames
+        print(f"{count:>11} {per_frame * 1000:>9.2f} {1 / per_frame:>8.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
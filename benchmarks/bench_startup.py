@@ -0,0 +1,79 @@
+# benchmarks/bench_startup.py
+"""
+Arranque en frío vs. en caliente del caché crudo de imágenes (engine/raw_cache.py).
+
+Cada medición corre en un proceso nuevo (sin cachés en memoria) y carga todas
+las entradas de ASSET_MANIFEST, como haría el juego al recorrer sus escenas.
+- frío:     el caché crudo está vacío (se decodifica PNG y se escribe el caché)
+- caliente: el caché crudo ya existe (mmap + frombuffer, sin zlib)
+
+Uso (desde la raíz del repo):  python benchmarks/bench_startup.py [repeticiones]
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _child(cache_dir):
+    """Proceso hijo: carga todos los assets y escribe el tiempo en stdout."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    import pygame
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    import settings
+    from main import collect_asset_manifest
+    from engine.prefetch import manifest_key
+    settings.raw_cache.cache_dir = cache_dir
+    entries = collect_asset_manifest()
+
+    start = time.perf_counter()
+    for entry in entries:
+        settings.load_asset(*manifest_key(entry))
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed:.6f} {settings.raw_cache.hits} {settings.raw_cache.misses}")
+
+
+def _run(cache_dir):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", cache_dir],
+        check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(out[0]), int(out[1]), int(out[2])
+
+
+def main(repeats=3):
+    cold, warm = [], []
+    for _ in range(repeats):
+        cache_dir = tempfile.mkdtemp(prefix="egresaditos-raw-")
+        try:
+            cold.append(_run(cache_dir))
+            warm.append(_run(cache_dir))
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print(f"{'modo':<10}{'mediana (s)':>14}{'hits':>8}{'misses':>8}")
+    for name, runs in (("frío", cold), ("caliente", warm)):
+        median = statistics.median(r[0] for r in runs)
+        print(f"{name:<10}{median:>14.3f}{runs[-1][1]:>8}{runs[-1][2]:>8}")
+    cold_median = statistics.median(r[0] for r in cold)
+    warm_median = statistics.median(r[0] for r in warm)
+    if warm_median > 0:
+        print(f"aceleración: {cold_median / warm_median:.1f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        _child(sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,106 @@
+# engine/asset_manager.py
+
+from engine.prefetch import manifest_key
+
+
+class AssetManager:
+    """
+    Tiempo de vida de los assets por conteo de referencias.
+
+    Cada dueño (normalmente una clave de SCENE_MAP) adquiere las entradas de su
+    ASSET_MANIFEST al entrar y las libera al salir. Mientras una entrada tenga
+    referencias queda fijada en `image_cache` (el LRU no la descarta); cuando
+    llega a cero se quita del caché junto con sus variantes escaladas. Así los
+    assets compartidos (p. ej. las partes por defecto del Player) siguen en
+    memoria y los propios de una escena se liberan.
+    """
+    def __init__(self, image_cache, transform_cache, load_asset):
+        self.image_cache = image_cache
+        self.transform_cache = transform_cache
+        self.load_asset = load_asset
+        self.refs = {}    # clave -> cantidad de dueños
+        self.owners = {}  # dueño -> set de claves
+
+    def acquire(self, owner, entries, preload=False):
+        """
+        Registra que `owner` usa `entries` (lista ASSET_MANIFEST). Llamarlo dos
+        veces con el mismo dueño no suma referencias. Con `preload=True` además
+        carga las entradas que no estén en memoria.
+        """
+        held = self.owners.setdefault(owner, set())
+        for entry in entries:
+            key = manifest_key(entry)
+            if key not in held:
+                held.add(key)
+                self.refs[key] = self.refs.get(key, 0) + 1
+                self.image_cache.pinned.add(key)
+            if preload:
+                self.load_asset(*key)
+
+    def release(self, owner):
+        """Suelta todas las entradas de `owner`; las que quedan sin dueño se liberan."""
+        freed = 0
+        for key in self.owners.pop(owner, set()):
+            self.refs[key] -= 1
+            if self.refs[key] > 0:
+                continue
+            del self.refs[key]
+            freed += self._free(key)
+        return freed
+
+    def is_held(self, owner):
+        return owner in self.owners
+
+    def _free(self, key):
+        """Quita una entrada (y lo derivado de ella) de los cachés. Devuelve los bytes liberados."""
+        self.image_cache.pinned.discard(key)
+        self.image_cache.unstage(key)
+        freed = 0
+        entry = self.image_cache.entries.get(key)
+        if entry is not None:
+            surface, size = entry
+            freed += size
+            self.transform_cache.invalidate_source(surface)
+            self.image_cache.invalidate(key)
+
+        # El original a resolución completa (usado para escalar) tampoco hace falta
+        # si ninguna otra variante del mismo archivo sigue en uso
+        subfolder, filename = key[:2]
+        if not any(k[0] == subfolder and k[1] == filename for k in self.refs):
+            original = self.image_cache.entries.get((subfolder, filename, None))
+            if original is not None:
+                freed += original[1]
+                self.transform_cache.invalidate_source(original[0])
+                self.image_cache.invalidate((subfolder, filename, None))
+        return freed
+
+    def footprint(self, owner):
+        """Memoria residente de las entradas de `owner`: (total, exclusiva) en bytes."""
+        total = exclusive = 0
+        for key in self.owners.get(owner, ()):
+            entry = self.image_cache.entries.get(key)
+            if entry is None:
+                continue
+            total += entry[1]
+            if self.refs.get(key) == 1:
+                exclusive += entry[1]
+        return total, exclusive
+
+    def report(self):
+        """Huella de memoria por dueño: {dueño: {'assets', 'resident', 'bytes', 'exclusive_bytes'}}."""
+        result = {}
+        for owner, keys in self.owners.items():
+            total, exclusive = self.footprint(owner)
+            result[owner] = {
+                "assets": len(keys),
+                "resident": sum(1 for k in keys if k in self.image_cache.entries),
+                "bytes": total,
+                "exclusive_bytes": exclusive,
+            }
+        return result
+
+    def print_report(self):
+        for owner, info in self.report().items():
+            print(f"  {owner:<14} {info['resident']}/{info['assets']} assets  "
+                  f"{info['bytes'] / (1024 * 1024):6.1f} MB  "
+                  f"(exclusivos {info['exclusive_bytes'] / (1024 * 1024):.1f} MB)")
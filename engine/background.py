@@ -0,0 +1,91 @@
+# engine/background.py
+
+import pygame
+
+from settings import BACKGROUND_CHUNK_WIDTH, SCREEN_WIDTH
+from engine.render_queue import LAYER_BACKGROUND
+
+
+class BackgroundLayer:
+    """
+    Una capa del fondo cortada en franjas verticales de `chunk_width` píxeles.
+
+    Las franjas son subsuperficies de la imagen original (no copian píxeles) y
+    se calculan una sola vez. `parallax` es cuánto se mueve la capa respecto de
+    la cámara: 1.0 = con el mundo, 0.5 = a mitad de velocidad (más lejos).
+    Con `repeat=True` la capa se repite a lo ancho sin fin.
+    """
+    def __init__(self, image, parallax=1.0, y=0, repeat=False, chunk_width=BACKGROUND_CHUNK_WIDTH):
+        self.image = image
+        self.parallax = parallax
+        self.y = y
+        self.repeat = repeat
+        self.chunk_width = max(1, int(chunk_width))
+        self.width, self.height = image.get_size()
+
+        self.chunks = []
+        for x in range(0, self.width, self.chunk_width):
+            w = min(self.chunk_width, self.width - x)
+            self.chunks.append(image.subsurface(pygame.Rect(x, 0, w, self.height)))
+
+    def _blit_items(self, camera_x, view_width):
+        """(franja, posición) de las franjas que caen dentro de la pantalla."""
+        if not self.chunks:
+            return []
+        offset = int(camera_x * self.parallax)
+        cw = self.chunk_width
+
+        first = offset // cw
+        last = (offset + view_width - 1) // cw
+        if not self.repeat:
+            first = max(first, 0)
+            last = min(last, len(self.chunks) - 1)
+
+        n = len(self.chunks)
+        return [(self.chunks[i % n], (i * cw - offset, self.y)) for i in range(first, last + 1)]
+
+    def draw(self, screen, camera_x):
+        """Dibuja solo las franjas que caen dentro de la pantalla."""
+        items = self._blit_items(camera_x, screen.get_width())
+        if items:
+            screen.blits(items, doreturn=False)
+
+
+class ScrollingBackground:
+    """
+    Fondo de una habitación que se desplaza con la cámara, con capas opcionales
+    de parallax. Cada frame cuesta lo mismo sin importar lo ancho que sea el
+    fondo: solo se dibujan las franjas visibles de cada capa.
+
+    Las capas se dibujan en el orden en que se agregan (la primera es la de más atrás).
+    """
+    def __init__(self, image=None, chunk_width=BACKGROUND_CHUNK_WIDTH):
+        self.chunk_width = chunk_width
+        self.layers = []
+        if image is not None:
+            self.add_layer(image)
+
+    def add_layer(self, image, parallax=1.0, y=0, repeat=False):
+        layer = BackgroundLayer(image, parallax, y, repeat, self.chunk_width)
+        self.layers.append(layer)
+        return layer
+
+    @property
+    def width(self):
+        """Ancho del mundo: el de la capa más ancha que se mueve con la cámara."""
+        widths = [layer.width for layer in self.layers if layer.parallax == 1.0]
+        return max(widths) if widths else 0
+
+    @property
+    def height(self):
+        return max((layer.height for layer in self.layers), default=0)
+
+    def draw(self, screen, camera_x=0):
+        """`camera_x` es la x del mundo que queda en el borde izquierdo de la pantalla."""
+        for layer in self.layers:
+            layer.draw(screen, camera_x)
+
+    def render(self, queue, camera_x=0, layer=LAYER_BACKGROUND, view_width=SCREEN_WIDTH):
+        """Encola las franjas visibles en una RenderQueue (todas las capas del fondo en `layer`)."""
+        for bg_layer in self.layers:
+            queue.submit_many(bg_layer._blit_items(camera_x, view_width), layer)
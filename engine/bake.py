@@ -0,0 +1,227 @@
+# engine/bake.py
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+from engine.pixel_format import classify
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+# ==============================
+# ESPECIFICACIONES DE TAMAÑO
+# ==============================
+def size_spec(size, smooth=True):
+    """
+    Convierte un tamaño de manifiesto en un texto estable:
+    - int (altura, mantiene la proporción) -> 'h200'
+    - (ancho, alto)                        -> '330x120'
+    Las variantes escaladas sin filtrar (`smooth=False`) llevan '-nearest':
+    son otra imagen y no pueden compartir archivo con la suavizada.
+    """
+    if isinstance(size, int):
+        spec = f"h{size}"
+    else:
+        spec = f"{int(size[0])}x{int(size[1])}"
+    return spec if smooth else spec + "-nearest"
+
+
+def target_size(source_size, size):
+    """Calcula el tamaño final de una variante a partir del tamaño original."""
+    if isinstance(size, int):
+        aspect_ratio = source_size[0] / source_size[1]
+        return (int(size * aspect_ratio), size)
+    return (int(size[0]), int(size[1]))
+
+
+def baked_filename(filename, size, smooth=True):
+    stem = os.path.splitext(filename)[0]
+    return f"{stem}@{size_spec(size, smooth)}.png"
+
+
+def scale_variant(image, size, smooth=True):
+    """
+    Escala una imagen recién decodificada a una variante del manifiesto.
+    Es el mismo escalado al hornear, al precargar y al cargar en juego, así
+    una variante es idéntica venga de donde venga.
+    """
+    final_size = target_size(image.get_size(), size)
+    if not smooth:
+        return pygame.transform.scale(image, final_size)
+    # smoothscale necesita 24/32 bits (los GIF vienen con paleta de 8 bits)
+    if image.get_bitsize() not in (24, 32):
+        converted = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        converted.blit(image, (0, 0))
+        image = converted
+    return pygame.transform.smoothscale(image, final_size)
+
+
+def manifest_entry(entry):
+    """
+    Normaliza una entrada de ASSET_MANIFEST a (subfolder, filename, size, smooth).
+    El cuarto elemento es opcional; si falta, el filtro es el de quien carga la
+    variante: las alturas (load_image) se escalan sin filtrar y los tamaños
+    (get_scaled) se suavizan. False pide la variante sin filtrar de un tamaño
+    (la que da `get_scaled(..., smooth=False)`).
+    """
+    subfolder, filename, size = entry[:3]
+    smooth = entry[3] if len(entry) > 3 else not isinstance(size, int)
+    return subfolder, filename, size, bool(smooth)
+
+
+# ==============================
+# LECTURA DEL MANIFIESTO (EN JUEGO)
+# ==============================
+class BakedAssets:
+    """
+    Índice de variantes pre-escaladas generadas por `python main.py bake`.
+
+    El manifiesto se lee una sola vez. Una variante solo se usa si su archivo
+    existe y es más nuevo que el original; si no, se ignora y el juego vuelve
+    a la carga normal.
+    """
+    def __init__(self, baked_path, assets_path):
+        self.baked_path = baked_path
+        self.assets_path = assets_path
+        self.entries = None  # (subfolder, filename, spec) -> ruta relativa
+        self.formats = {}    # misma clave -> (formato, colorkey) (ver engine/pixel_format.py)
+        self._resolved = {}  # misma clave -> ruta válida o None
+
+    def _load_manifest(self):
+        self.entries = {}
+        self.formats = {}
+        manifest_path = os.path.join(self.baked_path, MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            return
+        try:
+            with open(manifest_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠ Manifiesto de assets horneados inválido ({manifest_path}): {e}")
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            return
+        for entry in data.get("assets", []):
+            key = (entry["subfolder"], entry["filename"], entry["spec"])
+            self.entries[key] = entry["file"]
+            if "format" in entry:
+                colorkey = entry.get("colorkey")
+                self.formats[key] = (entry["format"], tuple(colorkey) if colorkey else None)
+
+    def find(self, subfolder, filename, size, smooth=True):
+        """Devuelve la ruta de la variante horneada vigente, o None."""
+        if size is None:
+            return None
+        key = (subfolder, filename, size_spec(size, smooth))
+        if key in self._resolved:
+            return self._resolved[key]
+
+        if self.entries is None:
+            self._load_manifest()
+
+        path = None
+        relative = self.entries.get(key)
+        if relative is not None:
+            baked = os.path.join(self.baked_path, relative)
+            source = os.path.join(self.assets_path, subfolder, filename)
+            try:
+                if os.path.getmtime(baked) >= os.path.getmtime(source):
+                    path = baked
+            except OSError:
+                path = None
+
+        self._resolved[key] = path
+        return path
+
+    def pixel_format(self, subfolder, filename, size, smooth=True):
+        """
+        (formato, colorkey) guardado al hornear la variante, o None si no hay
+        una variante vigente.
+        """
+        if self.find(subfolder, filename, size, smooth) is None:
+            return None
+        return self.formats.get((subfolder, filename, size_spec(size, smooth)))
+
+    def discard(self, subfolder, filename, size, smooth=True):
+        """Marca una variante como no disponible (p. ej. archivo corrupto)."""
+        self._resolved[(subfolder, filename, size_spec(size, smooth))] = None
+
+    def reset(self):
+        """Olvida el manifiesto leído (p. ej. después de volver a hornear)."""
+        self.entries = None
+        self._resolved.clear()
+
+
+# ==============================
+# HORNEADO (FUERA DEL JUEGO)
+# ==============================
+def _bake_one(job):
+    """Trabajo de un proceso del pool: decodifica, escala y guarda una variante."""
+    source, size, smooth, out_path = job
+    image = pygame.image.load(source)
+
+    source_size = image.get_size()
+    scaled = scale_variant(image, size, smooth)
+    final_size = scaled.get_size()
+    pixel_format, colorkey = classify(scaled)
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    pygame.image.save(scaled, out_path)
+    return source_size, final_size, pixel_format, colorkey
+
+
+def bake_assets(entries, assets_path, baked_path, workers=None):
+    """
+    Genera las variantes a resolución de pantalla de `entries`
+    (lista de (subfolder, filename, size[, smooth])) usando un pool de procesos,
+    y escribe el manifiesto en `baked_path`. Devuelve la lista del manifiesto.
+    """
+    unique = []
+    seen = set()
+    for entry in entries:
+        subfolder, filename, size, smooth = manifest_entry(entry)
+        key = (subfolder, filename, size_spec(size, smooth))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append((subfolder, filename, size, smooth))
+
+    jobs = []
+    for subfolder, filename, size, smooth in unique:
+        source = os.path.join(assets_path, subfolder, filename)
+        if not os.path.exists(source):
+            print(f"⚠ Image not found → {source}")
+            continue
+        relative = os.path.join(subfolder, baked_filename(filename, size, smooth))
+        jobs.append((subfolder, filename, size, smooth, source, relative))
+
+    manifest = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            _bake_one,
+            [(source, size, smooth, os.path.join(baked_path, relative))
+             for _, _, size, smooth, source, relative in jobs]
+        )
+        for (subfolder, filename, size, smooth, source, relative), result in zip(jobs, results):
+            source_size, final_size, pixel_format, colorkey = result
+            manifest.append({
+                "subfolder": subfolder,
+                "filename": filename,
+                "spec": size_spec(size, smooth),
+                "file": relative,
+                "source_size": list(source_size),
+                "size": list(final_size),
+                "format": pixel_format,
+                "colorkey": list(colorkey) if colorkey else None,
+            })
+            print(f"✔ {source} → {relative} {final_size[0]}x{final_size[1]} ({pixel_format})")
+
+    os.makedirs(baked_path, exist_ok=True)
+    with open(os.path.join(baked_path, MANIFEST_NAME), 'w') as f:
+        json.dump({"version": MANIFEST_VERSION, "assets": manifest}, f, indent=4)
+
+    return manifest
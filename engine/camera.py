@@ -0,0 +1,100 @@
+# engine/camera.py
+
+import math
+
+import pygame
+
+
+class Camera:
+    """
+    Cámara 2D compartida por las escenas que se desplazan.
+
+    (x, y) es el punto del mundo que queda en la esquina superior izquierda de
+    la pantalla. Se mantiene dentro del mundo (`set_world_size`); si el mundo es
+    más chico que la pantalla en algún eje, queda centrado en ese eje.
+
+    Con `smoothing` > 0 la cámara se acerca a su objetivo de forma exponencial
+    (más alto = más rápido); con 0 lo sigue exactamente.
+
+    Todo lo que vive en el mundo (fondo, personaje, props, hotspots) se dibuja
+    con `world_to_screen` / `blit`, que omiten lo que queda fuera de la vista.
+    La UI fija (botones, narrador) se sigue dibujando en coordenadas de pantalla.
+    """
+    def __init__(self, view_size, world_size=None, smoothing=0.0):
+        self.view_width, self.view_height = view_size
+        self.world_width, self.world_height = world_size or view_size
+        self.smoothing = smoothing
+        self.x = 0.0
+        self.y = 0.0
+        self.target_x = 0.0
+        self.target_y = 0.0
+
+    # ------------------------------------------------------------
+    # MUNDO Y SEGUIMIENTO
+    # ------------------------------------------------------------
+    def set_world_size(self, width, height):
+        self.world_width, self.world_height = width, height
+        self.x, self.y = self._clamp(self.x, self.y)
+        self.target_x, self.target_y = self._clamp(self.target_x, self.target_y)
+
+    def _clamp(self, x, y):
+        def clamp_axis(value, view, world):
+            if world <= view:
+                return (world - view) / 2  # mundo más chico que la vista: centrado
+            return max(0.0, min(value, world - view))
+        return (clamp_axis(x, self.view_width, self.world_width),
+                clamp_axis(y, self.view_height, self.world_height))
+
+    def center_on(self, world_pos):
+        """Centra la cámara en `world_pos` de inmediato (sin suavizado)."""
+        self.target_x, self.target_y = self._clamp(world_pos[0] - self.view_width / 2,
+                                                   world_pos[1] - self.view_height / 2)
+        self.x, self.y = self.target_x, self.target_y
+
+    def follow(self, world_pos, dt):
+        """Apunta la cámara a `world_pos` y avanza el suavizado `dt` segundos."""
+        self.target_x, self.target_y = self._clamp(world_pos[0] - self.view_width / 2,
+                                                   world_pos[1] - self.view_height / 2)
+        if self.smoothing <= 0:
+            self.x, self.y = self.target_x, self.target_y
+            return
+        blend = 1.0 - math.exp(-self.smoothing * dt)
+        self.x += (self.target_x - self.x) * blend
+        self.y += (self.target_y - self.y) * blend
+
+    # ------------------------------------------------------------
+    # TRANSFORMACIONES
+    # ------------------------------------------------------------
+    @property
+    def view_rect(self):
+        """Rectángulo visible, en coordenadas del mundo."""
+        return pygame.Rect(int(self.x), int(self.y), self.view_width, self.view_height)
+
+    def world_to_screen(self, pos):
+        return (int(pos[0] - int(self.x)), int(pos[1] - int(self.y)))
+
+    def screen_to_world(self, pos):
+        return (pos[0] + int(self.x), pos[1] + int(self.y))
+
+    def apply(self, rect):
+        """Copia de un rectángulo del mundo, pasado a coordenadas de pantalla."""
+        return pygame.Rect(rect).move(-int(self.x), -int(self.y))
+
+    # ------------------------------------------------------------
+    # CULLING
+    # ------------------------------------------------------------
+    def is_visible(self, rect, margin=0):
+        """True si el rectángulo (del mundo) toca la vista."""
+        return self.view_rect.inflate(margin * 2, margin * 2).colliderect(rect)
+
+    def visible(self, items, rect_of=lambda item: item.rect):
+        """Filtra los elementos del mundo cuyo rectángulo toca la vista."""
+        view = self.view_rect
+        return [item for item in items if view.colliderect(rect_of(item))]
+
+    def blit(self, screen, surface, world_rect):
+        """Dibuja `surface` en `world_rect` si se ve. Devuelve True si se dibujó."""
+        if not self.is_visible(world_rect):
+            return False
+        screen.blit(surface, self.apply(world_rect))
+        return True
@@ -0,0 +1,193 @@
+# engine/dialogue.py
+
+from collections import deque
+
+import pygame
+
+from engine.render_queue import LAYER_UI
+from engine.text import wrap_text
+from settings import px, text_cache, DIALOGUE_CHARS_PER_SECOND, DIALOGUE_FAST_FORWARD
+
+
+class DialogueBox:
+    """
+    Caja de diálogo con efecto máquina de escribir.
+
+    Cada pasaje (`say`) se parte en renglones que entran en `text_rect` y en
+    páginas de los renglones que entran de alto. Los caracteres aparecen de a
+    `speed` por segundo: cada uno nuevo se dibuja una sola vez sobre la
+    superficie de su renglón, que se conserva mientras dure la página (no se
+    vuelve a renderizar el texto parcial en cada frame). Los glifos salen de
+    la hoja de glifos de la fuente (ver engine/text.py).
+
+    `skip` muestra la página entera si se estaba escribiendo, o pasa a la
+    siguiente página o pasaje. Con `fast_forward(True)` se escribe más rápido.
+    Si el pasaje tiene segundos (`say(texto, secs)`), al terminar cada página
+    se espera ese tiempo y se avanza sola.
+    """
+    def __init__(self, font, text_rect, color=(255, 255, 255), frame=None, speed=DIALOGUE_CHARS_PER_SECOND):
+        self.font = font
+        self.text_rect = pygame.Rect(text_rect)
+        self.glyphs = text_cache.atlas(font, color)
+        self.line_height = font.get_linesize()
+        self.lines_per_page = max(1, self.text_rect.height // self.line_height)
+        self.speed = speed
+        self.speed_factor = 1
+
+        self.frame = None
+        self.frame_area = None
+        if frame is not None:
+            self.set_frame(frame)
+
+        # Un renglón por superficie; se reutilizan de página en página
+        self.line_surfaces = [
+            pygame.Surface((self.text_rect.width, self.line_height), pygame.SRCALPHA)
+            for _ in range(self.lines_per_page)
+        ]
+        self.changed = set()  # índices de renglones modificados desde el último render
+
+        self.passages = deque()  # (texto, segundos o None)
+        self.pages = []          # renglones del pasaje actual, agrupados por página
+        self.page = 0
+        self.hold = None         # segundos del pasaje actual
+        self.timer = 0
+        self.line = 0            # renglón que se está escribiendo
+        self.char = 0            # caracteres ya escritos de ese renglón
+        self.pending = 0.0       # fracción de carácter acumulada
+        self.active = False
+
+    def set_frame(self, image):
+        """Imagen de la caja (dialogue.png, del tamaño de la pantalla); solo se dibuja la zona visible."""
+        self.frame = image
+        self.frame_area = image.get_bounding_rect()
+
+    # ------------------------------------------------------------
+    # PASAJES
+    # ------------------------------------------------------------
+    def say(self, text, secs=None):
+        self.passages.append((text, secs))
+        if not self.active:
+            self._next_passage()
+
+    def clear(self):
+        self.passages.clear()
+        self.active = False
+        self.pages = []
+
+    def _next_passage(self):
+        if not self.passages:
+            self.active = False
+            self.pages = []
+            return
+        text, self.hold = self.passages.popleft()
+        lines = wrap_text(self.font, text, self.text_rect.width)
+        n = self.lines_per_page
+        self.pages = [lines[i:i + n] for i in range(0, len(lines), n)]
+        self.active = True
+        self._show_page(0)
+
+    def _show_page(self, page):
+        self.page = page
+        self.line = self.char = 0
+        self.pending = 0.0
+        self.timer = 0
+        for i, surface in enumerate(self.line_surfaces):
+            surface.fill((0, 0, 0, 0))
+            self.changed.add(i)
+
+    @property
+    def page_done(self):
+        return self.active and self.line >= len(self.pages[self.page])
+
+    @property
+    def has_more(self):
+        """True si después de esta página queda otra página u otro pasaje."""
+        return self.page + 1 < len(self.pages) or bool(self.passages)
+
+    # ------------------------------------------------------------
+    # ESCRITURA
+    # ------------------------------------------------------------
+    def _reveal(self, count):
+        """Escribe los próximos `count` caracteres de la página (un blit por glifo)."""
+        lines = self.pages[self.page]
+        while count > 0 and self.line < len(lines):
+            text = lines[self.line]
+            end = min(len(text), self.char + count)
+            if end > self.char:
+                self.glyphs.draw_range(self.line_surfaces[self.line], text, self.char, end, (0, 0))
+                self.changed.add(self.line)
+            count -= end - self.char
+            self.char = end
+            if self.char >= len(text):
+                self.line += 1
+                self.char = 0
+
+    def skip(self):
+        """Completa la página; si ya estaba completa, avanza."""
+        if not self.active:
+            return
+        if not self.page_done:
+            self._reveal(sum(len(l) for l in self.pages[self.page]))
+        elif self.page + 1 < len(self.pages):
+            self._show_page(self.page + 1)
+        else:
+            self._next_passage()
+
+    def fast_forward(self, enabled):
+        self.speed_factor = DIALOGUE_FAST_FORWARD if enabled else 1
+
+    def update(self, dt):
+        if not self.active:
+            return
+        if not self.page_done:
+            self.pending += self.speed * self.speed_factor * dt
+            count = int(self.pending)
+            if count:
+                self.pending -= count
+                self._reveal(count)
+        elif self.hold is not None:
+            self.timer += dt
+            if self.timer >= self.hold:
+                self.skip()
+
+    # ------------------------------------------------------------
+    # DIBUJO
+    # ------------------------------------------------------------
+    def _indicator(self):
+        """Triángulo que avisa que hay más texto (abajo a la derecha del texto)."""
+        x, y = self.text_rect.right - px(12), self.text_rect.bottom - px(6)
+        half, height = px(8), px(10)
+        return [(x - half, y - height), (x + half, y - height), (x, y)]
+
+    def draw(self, surf):
+        if not self.active:
+            return
+        if self.frame is not None:
+            surf.blit(self.frame, self.frame_area, self.frame_area)
+        x, y = self.text_rect.topleft
+        for i, surface in enumerate(self.line_surfaces[:len(self.pages[self.page])]):
+            surf.blit(surface, (x, y + i * self.line_height))
+        if self.page_done and self.has_more:
+            pygame.draw.polygon(surf, self.glyphs.color, self._indicator())
+        self.changed.clear()
+
+    def render(self, queue, layer=LAYER_UI):
+        """Igual que draw, pero encolado en una RenderQueue (ver engine/render_queue.py)."""
+        if not self.active:
+            return
+        # Los renglones se escriben sobre la misma superficie: se avisa cuáles cambiaron
+        for i in self.changed:
+            queue.mark_changed(self.line_surfaces[i])
+        self.changed.clear()
+
+        if self.frame is not None:
+            queue.submit(self.frame, self.frame_area.topleft, layer, self.frame_area)
+        x, y = self.text_rect.topleft
+        for i, surface in enumerate(self.line_surfaces[:len(self.pages[self.page])]):
+            queue.submit(surface, (x, y + i * self.line_height), layer)
+        if self.page_done and self.has_more:
+            points = self._indicator()
+            color = self.glyphs.color
+            left, top = points[0]
+            queue.submit_draw(lambda s: pygame.draw.polygon(s, color, points), layer,
+                              pygame.Rect(left, top, points[1][0] - left + 1, points[2][1] - top + 1))
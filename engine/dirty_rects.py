@@ -0,0 +1,63 @@
+# engine/dirty_rects.py
+
+import pygame
+
+
+class DirtyRegion:
+    """
+    Zonas de la pantalla que cambiaron desde el último frame.
+
+    Las escenas con `dirty_rects = True` avisan con `Scene.mark_dirty(rect)`
+    qué parte cambió; el juego redibuja solo esas zonas (con clip) y las
+    envía con `pygame.display.update(rects)`. Si las zonas cubren más de
+    `max_coverage` de la pantalla, conviene más un frame completo.
+    """
+    def __init__(self, screen_rect, max_coverage=0.5):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.max_coverage = max_coverage
+        self.rects = []
+        self.full = True  # el primer frame siempre es completo
+
+    def add(self, rect=None):
+        """Marca `rect` como cambiado (None = toda la pantalla)."""
+        if rect is None:
+            self.full = True
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.w and rect.h:
+            self.rects.append(rect)
+
+    def take(self):
+        """
+        Devuelve las zonas a redibujar y vacía la región:
+        - None: hay que redibujar todo.
+        - []:   nada cambió.
+        - lista de rectángulos sin solapamientos entre sí.
+        """
+        full, rects = self.full, self.rects
+        self.full = False
+        self.rects = []
+        if full:
+            return None
+
+        merged = _merge(rects)
+        screen_area = self.screen_rect.w * self.screen_rect.h
+        if sum(r.w * r.h for r in merged) > screen_area * self.max_coverage:
+            return None
+        return merged
+
+
+def _merge(rects):
+    """Une los rectángulos que se tocan hasta que no quede ninguno solapado."""
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
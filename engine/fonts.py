@@ -0,0 +1,115 @@
+# engine/fonts.py
+
+import io
+
+import pygame
+
+# Estilos que se pueden pedir (se aplican con set_bold / set_italic / set_underline)
+STYLES = ("bold", "italic", "underline")
+
+
+def _style_key(style):
+    """Normaliza el estilo a una tupla ordenada: 'bold italic', ('italic',) ... -> ('bold', 'italic')."""
+    if not style:
+        return ()
+    if isinstance(style, str):
+        style = style.replace(",", " ").split()
+    style = set(style)
+    unknown = style.difference(STYLES)
+    if unknown:
+        raise ValueError(f"Estilo de fuente desconocido: {', '.join(sorted(unknown))}")
+    return tuple(s for s in STYLES if s in style)
+
+
+class FontRegistry:
+    """
+    Registro central de fuentes: una sola pygame.font.Font por (cara, tamaño, estilo).
+
+    Las escenas piden la fuente con `get` en lugar de crear pygame.font.Font
+    en cada constructor: volver a una escena no vuelve a leer el archivo de la
+    fuente, y como el objeto es el mismo, los textos que ya estaban en
+    settings.text_cache se siguen encontrando (la clave incluye la fuente).
+
+    La cara es None (la fuente por defecto de pygame) o la ruta de un .ttf/.otf;
+    el archivo se lee una sola vez y los distintos tamaños se crean desde
+    esos bytes. Las fuentes devueltas son compartidas: no se les debe cambiar
+    el estilo (para eso se pide otra con `style`).
+    """
+    def __init__(self):
+        self.fonts = {}  # (cara, tamaño, estilo) -> pygame.font.Font
+        self.faces = {}  # ruta -> bytes del archivo
+        self.hits = 0
+        self.misses = 0
+
+    def _load_face(self, face):
+        data = self.faces.get(face)
+        if data is None:
+            with open(face, "rb") as f:
+                data = f.read()
+            self.faces[face] = data
+        return data
+
+    def get(self, face=None, size=24, style=None):
+        """La fuente (cara, tamaño, estilo); se carga la primera vez que se pide."""
+        key = (face, int(size), _style_key(style))
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+        self.misses += 1
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if face is None:
+            font = pygame.font.Font(None, key[1])
+        else:
+            # pygame lee el archivo a medida que lo necesita: cada tamaño recibe su propio BytesIO
+            font = pygame.font.Font(io.BytesIO(self._load_face(face)), key[1])
+        for s in key[2]:
+            getattr(font, "set_" + s)(True)
+        self.fonts[key] = font
+        return font
+
+    def resolve(self, font):
+        """
+        Acepta una pygame.font.Font (se devuelve tal cual), un tamaño (fuente por
+        defecto) o una tupla (cara, tamaño[, estilo]). Lo usan Button y TextBox.
+        """
+        if font is None or isinstance(font, pygame.font.Font):
+            return font
+        if isinstance(font, (int, float)):
+            return self.get(None, font)
+        return self.get(*font)
+
+    def preload(self, specs):
+        """Carga de antemano las fuentes de `specs` (tuplas para `resolve`)."""
+        for spec in specs:
+            try:
+                self.resolve(spec)
+            except (OSError, pygame.error, ValueError) as e:
+                print(f"⚠ No se pudo precargar la fuente {spec}: {e}")
+
+    # ------------------------------------------------------------
+    # MÉTRICAS (sin renderizar)
+    # ------------------------------------------------------------
+    def line_height(self, face=None, size=24, style=None):
+        """Alto recomendado entre renglones (font.get_linesize)."""
+        return self.get(face, size, style).get_linesize()
+
+    def metrics(self, face=None, size=24, style=None):
+        """Métricas verticales de la fuente, útiles para ubicar texto sin renderizarlo."""
+        font = self.get(face, size, style)
+        return {
+            "height": font.get_height(),
+            "line_height": font.get_linesize(),
+            "ascent": font.get_ascent(),
+            "descent": font.get_descent(),
+        }
+
+    def stats(self):
+        return {
+            "fonts": len(self.fonts),
+            "faces": len(self.faces),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,74 @@
+# engine/frame_stats.py
+
+import bisect
+
+# Límites (ms) de los casilleros del histograma; el último casillero es "más que eso"
+BUCKET_EDGES_MS = (2, 4, 8, 12, 16.7, 20, 33.3, 50, 100, 250, 500)
+
+
+class FrameHistogram:
+    """Histograma de tiempos (en segundos) con casilleros fijos en milisegundos."""
+    def __init__(self, edges_ms=BUCKET_EDGES_MS):
+        self.edges_ms = edges_ms
+        self.counts = [0] * (len(edges_ms) + 1)
+        self.total = 0.0
+        self.frames = 0
+        self.worst = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect.bisect_left(self.edges_ms, seconds * 1000.0)] += 1
+        self.total += seconds
+        self.frames += 1
+        self.worst = max(self.worst, seconds)
+
+    def labels(self):
+        labels = [f"<={edge:g}ms" for edge in self.edges_ms]
+        labels.append(f">{self.edges_ms[-1]:g}ms")
+        return labels
+
+
+class FrameStats:
+    """
+    Tiempos por frame del bucle principal, separados en frames activos
+    (animación, transición) y en espera (escena quieta, ver Scene.is_idle).
+
+    - interval: tiempo entre un frame y el siguiente (incluye la espera).
+    - work:     tiempo que el frame usó la CPU (eventos, update, draw, present).
+
+    `busy_ratio` (work / interval) aproxima qué fracción del tiempo el juego
+    tiene la CPU ocupada, que es lo que más pesa en el consumo del kiosco.
+    """
+    MODES = ("active", "idle")
+
+    def __init__(self):
+        self.interval = {mode: FrameHistogram() for mode in self.MODES}
+        self.work = {mode: FrameHistogram() for mode in self.MODES}
+
+    def add(self, mode, interval, work):
+        self.interval[mode].add(interval)
+        self.work[mode].add(work)
+
+    def report(self):
+        """{modo: {'frames', 'seconds', 'busy_ratio', 'worst_ms', 'interval', 'work'}}"""
+        result = {}
+        for mode in self.MODES:
+            interval, work = self.interval[mode], self.work[mode]
+            result[mode] = {
+                "frames": interval.frames,
+                "seconds": interval.total,
+                "busy_ratio": work.total / interval.total if interval.total else 0.0,
+                "worst_ms": interval.worst * 1000.0,
+                "interval": dict(zip(interval.labels(), interval.counts)),
+                "work": dict(zip(work.labels(), work.counts)),
+            }
+        return result
+
+    def print_report(self):
+        for mode, info in self.report().items():
+            if not info["frames"]:
+                continue
+            print(f"  {mode:<7} {info['frames']} frames en {info['seconds']:.1f} s  "
+                  f"CPU ocupada {info['busy_ratio'] * 100:.0f}%  peor {info['worst_ms']:.1f} ms")
+            for name in ("interval", "work"):
+                buckets = "  ".join(f"{label} {count}" for label, count in info[name].items() if count)
+                print(f"    {name:<8} {buckets}")
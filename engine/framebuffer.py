@@ -0,0 +1,63 @@
+# engine/framebuffer.py
+
+import math
+
+import pygame
+
+# Eventos del mouse que traen coordenadas de ventana
+MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+class Framebuffer:
+    """
+    Superficie donde dibuja el juego.
+
+    Con la escala de render en 1.0 es directamente la superficie de la ventana.
+    Si es más chica (settings.RENDER_SCALE), se agranda a la ventana una sola
+    vez por frame en `present`, y las coordenadas del mouse se pasan de la
+    ventana al framebuffer con `map_event` para que los hit tests sigan andando.
+    """
+    partial_updates = True  # admite display.update por zonas (rectángulos sucios)
+    textured = False
+
+    def __init__(self, window, size):
+        self.window = window
+        self.window_size = window.get_size()
+        self.size = (int(size[0]), int(size[1]))
+        self.scaled = self.size != self.window_size
+        if self.scaled:
+            self.surface = pygame.Surface(self.size).convert()
+        else:
+            self.surface = window
+        self.scale_x = self.window_size[0] / self.size[0]
+        self.scale_y = self.window_size[1] / self.size[1]
+
+    def present(self, rects=None):
+        """Muestra el frame. Con `rects` (coordenadas del framebuffer) solo se actualizan esas zonas."""
+        if self.scaled:
+            pygame.transform.scale(self.surface, self.window_size, self.window)
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update([self.to_window_rect(r) for r in rects])
+
+    def to_window_rect(self, rect):
+        if not self.scaled:
+            return rect
+        left = math.floor(rect[0] * self.scale_x)
+        top = math.floor(rect[1] * self.scale_y)
+        right = math.ceil((rect[0] + rect[2]) * self.scale_x)
+        bottom = math.ceil((rect[1] + rect[3]) * self.scale_y)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def map_event(self, event):
+        """Devuelve el evento con las coordenadas del mouse en píxeles del framebuffer."""
+        if not self.scaled or event.type not in MOUSE_EVENTS:
+            return event
+        data = dict(event.dict)
+        x, y = event.pos
+        data['pos'] = (int(x / self.scale_x), int(y / self.scale_y))
+        if 'rel' in data:
+            rx, ry = data['rel']
+            data['rel'] = (int(rx / self.scale_x), int(ry / self.scale_y))
+        return pygame.event.Event(event.type, data)
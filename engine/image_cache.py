@@ -0,0 +1,216 @@
+# engine/image_cache.py
+
+from collections import OrderedDict
+import threading
+
+import pygame
+
+
+def surface_bytes(surface):
+    """Memoria aproximada (en bytes) que ocupa una superficie decodificada."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class ImageCache:
+    """
+    Caché LRU de superficies ya decodificadas, compartida por todo el proceso.
+
+    Las claves son tuplas (subfolder, filename, scale_height). Cuando la suma de
+    bytes supera el presupuesto se descartan primero las entradas usadas hace más
+    tiempo. Las superficies devueltas son COMPARTIDAS: no se deben modificar
+    (fill, set_alpha, blit encima...), sino copiar o transformar antes.
+
+    Otros hilos pueden dejar superficies decodificadas "en espera" con `stage`
+    (ver engine/prefetch.py); se convierten al formato de pantalla en el hilo
+    principal la primera vez que se piden, con `convert(clave, superficie)`
+    (por defecto convert_alpha). Las superficies en espera cuentan para el
+    presupuesto: si no entran, `stage` las rechaza.
+    """
+    def __init__(self, max_bytes, convert=None):
+        self.max_bytes = max_bytes
+        self.convert = convert
+        self.entries = OrderedDict()  # clave -> (surface, bytes)
+        self.staged = {}              # clave -> (superficie sin convertir, bytes) (precarga)
+        self.staged_lock = threading.Lock()
+        self.pinned = set()           # claves en uso que el LRU no puede descartar
+        self.current_bytes = 0
+        self.staged_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.staged_hits = 0
+
+    def get(self, key):
+        """Devuelve la superficie cacheada o None, contabilizando hit/miss."""
+        entry = self.entries.get(key)
+        if entry is None:
+            staged = self._pop_staged(key)
+            if staged is not None:
+                self.staged_hits += 1
+                if self.convert is not None:
+                    return self.put(key, self.convert(key, staged))
+                return self.put(key, staged.convert_alpha())
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surface):
+        """Guarda una superficie y aplica el presupuesto de memoria."""
+        size = surface_bytes(surface)
+        if size > self.max_bytes:
+            # Más grande que todo el presupuesto: no se cachea
+            self.unstage(key)
+            return surface
+
+        self.invalidate(key)
+        with self.staged_lock:
+            # Si el hilo de precarga dejó esta misma clave en espera, ya no hace falta
+            self._pop_staged(key, locked=True)
+            self.entries[key] = (surface, size)
+            self.current_bytes += size
+
+        if self.current_bytes + self.staged_bytes > self.max_bytes:
+            self._evict()
+        return surface
+
+    def _evict(self):
+        """Descarta las entradas menos usadas (salvo las fijadas) hasta entrar en el presupuesto."""
+        for evicted_key in list(self.entries):
+            if self.current_bytes + self.staged_bytes <= self.max_bytes:
+                break
+            if evicted_key in self.pinned:
+                continue
+            _, evicted_size = self.entries.pop(evicted_key)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+            self._on_remove(evicted_key)
+
+    def stage(self, key, surface):
+        """
+        Deja una superficie decodificada en espera (se puede llamar desde otro hilo).
+        Devuelve False si no se guardó: la clave ya está cacheada o no entra en
+        el presupuesto (la precarga no descarta entradas para hacerse lugar).
+        """
+        size = surface_bytes(surface)
+        with self.staged_lock:
+            if key in self.entries:
+                return False
+            previous = self.staged.get(key)
+            freed = previous[1] if previous is not None else 0
+            if self.current_bytes + self.staged_bytes - freed + size > self.max_bytes:
+                return False
+            self.staged[key] = (surface, size)
+            self.staged_bytes += size - freed
+        return True
+
+    def unstage(self, key):
+        """Descarta una superficie en espera. Devuelve True si existía."""
+        return self._pop_staged(key) is not None
+
+    def _pop_staged(self, key, locked=False):
+        """Saca una superficie en espera y descuenta sus bytes. Devuelve la superficie o None."""
+        if not locked:
+            with self.staged_lock:
+                return self._pop_staged(key, locked=True)
+        staged = self.staged.pop(key, None)
+        if staged is None:
+            return None
+        self.staged_bytes -= staged[1]
+        return staged[0]
+
+    def has(self, key):
+        """True si la clave está cacheada o en espera (no cuenta como hit/miss)."""
+        return key in self.entries or key in self.staged
+
+    def invalidate(self, subfolder_or_key, filename=None):
+        """
+        Elimina entradas del caché.
+        - invalidate(key): elimina esa clave exacta.
+        - invalidate(subfolder, filename): elimina todas las escalas de ese archivo.
+        Devuelve la cantidad de entradas eliminadas.
+        """
+        if filename is None:
+            keys = [subfolder_or_key] if subfolder_or_key in self.entries else []
+        else:
+            keys = [k for k in self.entries if k[0] == subfolder_or_key and k[1] == filename]
+
+        for key in keys:
+            _, size = self.entries.pop(key)
+            self.current_bytes -= size
+            self._on_remove(key)
+        return len(keys)
+
+    def clear(self):
+        """Vacía el caché (los contadores de estadísticas se mantienen)."""
+        for key in list(self.entries):
+            self._on_remove(key)
+        self.entries.clear()
+        self.current_bytes = 0
+
+    def _on_remove(self, key):
+        """Gancho para subclases: se llama cuando una entrada sale del caché."""
+        pass
+
+    def stats(self):
+        """Resumen de uso del caché."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.current_bytes + self.staged_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "staged": len(self.staged),
+            "staged_bytes": self.staged_bytes,
+            "staged_hits": self.staged_hits,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class TransformCache(ImageCache):
+    """
+    Caché LRU de superficies reescaladas (scale / smoothscale).
+
+    La clave es (id de la superficie origen, tamaño destino, filtro). Cada entrada
+    mantiene una referencia a su origen para que el id no pueda reutilizarse
+    mientras la entrada exista. Igual que en ImageCache, las superficies
+    devueltas son compartidas entre escenas.
+    """
+    def __init__(self, max_bytes):
+        super().__init__(max_bytes)
+        self.sources = {}  # clave -> superficie origen
+
+    def scale(self, source, size, smooth=True):
+        """Devuelve `source` escalada a `size`, calculándola solo la primera vez."""
+        size = (int(size[0]), int(size[1]))
+        if source.get_size() == size:
+            return source
+
+        key = (id(source), size, smooth)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        # smoothscale solo acepta superficies de 24 o 32 bits
+        if smooth and source.get_bitsize() in (24, 32):
+            scaled = pygame.transform.smoothscale(source, size)
+        else:
+            scaled = pygame.transform.scale(source, size)
+
+        self.put(key, scaled)
+        if key in self.entries:
+            self.sources[key] = source
+        return scaled
+
+    def invalidate_source(self, source):
+        """Elimina todas las variantes escaladas de una superficie origen."""
+        keys = [k for k in self.entries if k[0] == id(source)]
+        for key in keys:
+            self.invalidate(key)
+        return len(keys)
+
+    def _on_remove(self, key):
+        self.sources.pop(key, None)
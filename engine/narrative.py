@@ -0,0 +1,263 @@
+# engine/narrative.py
+
+import io
+import json
+import os
+import struct
+
+# Cabecera: magic, versión, mtime del JSON original (ns), cantidad de secciones
+HEADER = struct.Struct("<4sHQI")
+MAGIC = b"EGNR"
+VERSION = 1
+# Entrada del índice (después del nombre): offset y largo de la sección, cantidad de líneas
+INDEX_ENTRY = struct.Struct("<III")
+# Cada línea de una sección: condición (-1 = siempre), segundos, flags, largo del texto
+LINE = struct.Struct("<hfBH")
+
+FLAG_ONCE = 1      # se dice una sola vez por partida
+FLAG_TEMPLATE = 2  # el texto tiene campos del estado ({player_name})
+
+DEFAULT_SECS = 3.0
+
+
+# ==============================
+# COMPILADOR (JSON -> BINARIO)
+# ==============================
+def _compile_condition(cond, fields):
+    """
+    Normaliza el "if" de una línea a una tupla de (campo, negado, valor), o a
+    True/False si se puede resolver sin el estado.
+    {"has_backpack": false, "!breakfast_choice": null} -> ((... ), (...))
+    """
+    if cond is None or cond is True:
+        return True
+    if cond is False:
+        return False
+    if not isinstance(cond, dict):
+        raise ValueError(f"condición inválida: {cond!r}")
+    tests = []
+    for key, value in cond.items():
+        negated = key.startswith("!")
+        field = key[1:] if negated else key
+        if fields is not None and field not in fields:
+            raise ValueError(f"campo desconocido en una condición: {field}")
+        tests.append((field, negated, value))
+    return tuple(sorted(tests, key=repr)) if tests else True
+
+
+def compile_script(data, mtime=0, fields=None):
+    """
+    Compila un guion ({"scenes": {"ROOM": [línea, ...], ...}}) al formato binario.
+
+    Cada línea es un texto o un dict {"text", "secs", "if", "once"}. Las
+    condiciones iguales se guardan una sola vez (tabla de condiciones) y las
+    que no dependen del estado se resuelven acá: una línea con "if": false no
+    llega al binario. Con `fields` se valida que las condiciones usen campos
+    existentes del estado.
+    """
+    conditions = []  # tabla: índice -> tupla de tests
+    condition_ids = {}
+    sections = []
+    for name, lines in data.get("scenes", {}).items():
+        body = bytearray()
+        count = 0
+        for line in lines:
+            if isinstance(line, str):
+                line = {"text": line}
+            cond = _compile_condition(line.get("if"), fields)
+            if cond is False:
+                continue
+            if cond is True:
+                cond_id = -1
+            else:
+                cond_id = condition_ids.get(cond)
+                if cond_id is None:
+                    cond_id = condition_ids[cond] = len(conditions)
+                    conditions.append(cond)
+            text = line["text"].encode("utf-8")
+            flags = FLAG_ONCE if line.get("once") else 0
+            if "{" in line["text"]:
+                flags |= FLAG_TEMPLATE
+            body += LINE.pack(cond_id, float(line.get("secs", DEFAULT_SECS)), flags, len(text))
+            body += text
+            count += 1
+        sections.append((name.encode("utf-8"), bytes(body), count))
+
+    table = json.dumps([[list(t) for t in cond] for cond in conditions], ensure_ascii=False).encode("utf-8")
+
+    # Índice con offsets absolutos: primero se calcula dónde empieza cada sección
+    index_size = sum(2 + len(name) + INDEX_ENTRY.size for name, _, _ in sections)
+    offset = HEADER.size + 4 + len(table) + index_size
+    out = bytearray(HEADER.pack(MAGIC, VERSION, mtime, len(sections)))
+    out += struct.pack("<I", len(table)) + table
+    for name, body, count in sections:
+        out += struct.pack("<H", len(name)) + name + INDEX_ENTRY.pack(offset, len(body), count)
+        offset += len(body)
+    for _, body, _ in sections:
+        out += body
+    return bytes(out)
+
+
+def compile_file(source, target, fields=None):
+    """Compila el JSON `source` y lo escribe en `target`. Devuelve los bytes compilados."""
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    compiled = compile_script(data, os.stat(source).st_mtime_ns, fields)
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    tmp_path = target + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(compiled)
+    os.replace(tmp_path, target)
+    return compiled
+
+
+# ==============================
+# LECTURA (EN JUEGO)
+# ==============================
+class NarrativeScript:
+    """
+    Guion compilado (narrative/script.json -> build/narrative/script.bin).
+
+    Al abrirlo solo se leen la cabecera, la tabla de condiciones y el índice
+    de secciones; cada sección (una por escena) se decodifica la primera vez
+    que se pide con `lines`. Si el binario falta o es más viejo que el JSON se
+    vuelve a compilar; si no se puede escribir, se usa compilado en memoria.
+
+    Las condiciones se evalúan una vez por versión del GameState (ver
+    game/state.py), no una vez por línea.
+    """
+    def __init__(self, source, compiled_path):
+        self.source = source
+        self.compiled_path = compiled_path
+        self.index = None       # sección -> (offset, largo, cantidad de líneas)
+        self.conditions = ()
+        self.sections = {}      # sección ya decodificada -> lista de líneas
+        self.seen = set()       # (sección, número de línea) de las líneas "once" ya dichas
+        self._data = None       # bytes compilados si no se pudieron escribir en disco
+        self._evaluated = (None, None)  # (id del estado, versión) -> resultados
+        self._results = ()
+        self._warned = set()
+
+    # ------------------------------------------------------------
+    # APERTURA
+    # ------------------------------------------------------------
+    def _open(self):
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        return open(self.compiled_path, "rb")
+
+    def _is_current(self):
+        try:
+            mtime = os.stat(self.source).st_mtime_ns
+            with open(self.compiled_path, "rb") as f:
+                magic, version, compiled_mtime, _ = HEADER.unpack(f.read(HEADER.size))
+        except (OSError, struct.error):
+            return False
+        return magic == MAGIC and version == VERSION and compiled_mtime == mtime
+
+    def _load_index(self):
+        self.index = {}
+        if not self._is_current():
+            try:
+                compiled = compile_file(self.source, self.compiled_path)
+            except OSError as e:
+                # Sin permiso de escritura: se compila en memoria
+                try:
+                    with open(self.source, "r", encoding="utf-8") as f:
+                        compiled = compile_script(json.load(f))
+                    self._data = compiled
+                except (OSError, ValueError) as e2:
+                    print(f"⚠ No se pudo leer el guion {self.source}: {e2}")
+                    return
+                print(f"⚠ No se pudo guardar el guion compilado ({e}). Se usa en memoria.")
+            except ValueError as e:
+                print(f"⚠ Guion {self.source} inválido: {e}")
+                return
+            else:
+                print(f"✔ Guion compilado en '{self.compiled_path}' ({len(compiled)} bytes).")
+
+        with self._open() as f:
+            _, _, _, count = HEADER.unpack(f.read(HEADER.size))
+            (table_size,) = struct.unpack("<I", f.read(4))
+            self.conditions = tuple(
+                tuple((field, negated, value) for field, negated, value in cond)
+                for cond in json.loads(f.read(table_size).decode("utf-8"))
+            )
+            for _ in range(count):
+                (name_size,) = struct.unpack("<H", f.read(2))
+                name = f.read(name_size).decode("utf-8")
+                self.index[name] = INDEX_ENTRY.unpack(f.read(INDEX_ENTRY.size))
+
+    # ------------------------------------------------------------
+    # SECCIONES
+    # ------------------------------------------------------------
+    def lines(self, section):
+        """Líneas de `section`: lista de (condición, segundos, flags, texto). Vacía si no existe."""
+        if self.index is None:
+            self._load_index()
+        lines = self.sections.get(section)
+        if lines is not None:
+            return lines
+        entry = self.index.get(section)
+        if entry is None:
+            return []
+
+        offset, size, count = entry
+        with self._open() as f:
+            f.seek(offset)
+            body = f.read(size)
+        lines = []
+        pos = 0
+        for _ in range(count):
+            cond_id, secs, flags, text_size = LINE.unpack_from(body, pos)
+            pos += LINE.size
+            lines.append((cond_id, secs, flags, body[pos:pos + text_size].decode("utf-8")))
+            pos += text_size
+        self.sections[section] = lines
+        return lines
+
+    def evaluate(self, state):
+        """Resultado de cada condición de la tabla para `state` (se recalcula si el estado cambió)."""
+        if self.index is None:
+            self._load_index()
+        key = (id(state), getattr(state, "version", None))
+        if key == self._evaluated and key[1] is not None:
+            return self._results
+        results = []
+        for cond in self.conditions:
+            ok = True
+            for field, negated, value in cond:
+                if not hasattr(state, field) and field not in self._warned:
+                    self._warned.add(field)
+                    print(f"⚠ El guion usa el campo '{field}', que no existe en el estado.")
+                if (getattr(state, field, None) == value) == negated:
+                    ok = False
+                    break
+            results.append(ok)
+        self._evaluated = key
+        self._results = results
+        return results
+
+    def active_lines(self, section, state):
+        """
+        (texto, segundos) de las líneas de `section` que corresponden a `state`,
+        con los campos del estado ya reemplazados. Las líneas "once" se marcan
+        como dichas.
+        """
+        lines = self.lines(section)  # primero: abre el índice y la tabla de condiciones
+        results = self.evaluate(state) if state is not None else ()
+        active = []
+        for number, (cond_id, secs, flags, text) in enumerate(lines):
+            if cond_id >= 0 and (state is None or not results[cond_id]):
+                continue
+            if flags & FLAG_ONCE:
+                if (section, number) in self.seen:
+                    continue
+                self.seen.add((section, number))
+            if flags & FLAG_TEMPLATE and state is not None:
+                try:
+                    text = text.format_map(vars(state))
+                except (KeyError, ValueError, IndexError) as e:
+                    print(f"⚠ Línea del guion con campo inválido ({e}): {text}")
+            active.append((text, secs))
+        return active
@@ -1,36 +1,103 @@
+from collections import deque
+
 import pygame
+from engine.render_queue import LAYER_UI
+from settings import text_cache
+
+# Cuántas líneas de la cola se dejan renderizadas de antemano
+PRERENDER_AHEAD = 2
+TEXT_COLOR = (30, 30, 30)
 
 class Narrator:
-    def __init__(self, font):
+    """
+    Muestra líneas de texto de a una, cada una durante sus segundos.
+
+    Las líneas pueden venir de `say` o del guion compilado (engine/narrative.py):
+    `enter(sección, estado)` encola las líneas de esa sección que corresponden
+    al estado. Mientras se muestra una línea, las siguientes PRERENDER_AHEAD se
+    renderizan de a una por frame, así el cambio de línea no cuesta nada.
+
+    Con `box` (engine/dialogue.py) las líneas se muestran en la caja de
+    diálogo, escribiéndose de a una letra; `skip` adelanta el texto.
+    """
+    def __init__(self, font, script=None, box=None):
         self.font = font
-        self.queue = []
+        self.script = script
+        self.box = box
+        self.queue = deque()  # [texto, segundos, superficies o None]
         self.timer = 0
         self.current = None
 
     def say(self, text, secs=3.0):
-        self.queue.append((text, secs))
+        if self.box is not None:
+            self.box.say(text, secs)
+            return
+        self.queue.append([text, secs, None])
         if not self.current:
             self._next()
 
+    def enter(self, section, state=None):
+        """Encola las líneas de `section` del guion (se decodifica la primera vez)."""
+        if self.script is None:
+            return
+        for text, secs in self.script.active_lines(section, state):
+            self.say(text, secs)
+
+    def clear(self):
+        self.queue.clear()
+        self.current = None
+        if self.box is not None:
+            self.box.clear()
+
+    def skip(self):
+        """Adelanta la línea actual (en la caja: completa la página o pasa a la siguiente)."""
+        if self.box is not None:
+            self.box.skip()
+        elif self.current:
+            self._next()
+
     def _next(self):
         if self.queue:
-            self.current = self.queue.pop(0)
+            self.current = self.queue.popleft()
             self.timer = self.current[1]
         else:
             self.current = None
 
+    def _rendered(self, line):
+        if line[2] is None:
+            line[2] = [text_cache.render(self.font, l, TEXT_COLOR) for l in line[0].split("\n")]
+        return line[2]
+
     def update(self, dt):
+        if self.box is not None:
+            self.box.update(dt)
+            return
         if self.current:
             self.timer -= dt
             if self.timer <= 0:
                 self._next()
 
+        # Renderizar de antemano la próxima línea que falte (una por frame)
+        for i in range(min(PRERENDER_AHEAD, len(self.queue))):
+            if self.queue[i][2] is None:
+                self._rendered(self.queue[i])
+                break
+
     def draw(self, surf, pos):
-        if self.current:
-            text = self.current[0]
-            lines = text.split("\n")
+        if self.box is not None:
+            self.box.draw(surf)
+        elif self.current:
             y = pos[1]
-            for l in lines:
-                s = self.font.render(l, True, (30,30,30))
+            for s in self._rendered(self.current):
                 surf.blit(s, (pos[0], y))
-                y += s.get_height() + 2
\ No newline at end of file
+                y += s.get_height() + 2
+
+    def render(self, queue, pos, layer=LAYER_UI):
+        """Igual que draw, pero encolado en una RenderQueue (ver engine/render_queue.py)."""
+        if self.box is not None:
+            self.box.render(queue, layer)
+        elif self.current:
+            y = pos[1]
+            for s in self._rendered(self.current):
+                queue.submit(s, (pos[0], y), layer)
+                y += s.get_height() + 2
@@ -0,0 +1,266 @@
+# engine/particles.py
+
+import math
+
+import numpy as np
+import pygame
+
+from engine.render_queue import LAYER_EFFECTS
+
+# Cantidad de niveles de transparencia pre-renderizados por sprite (el último es opaco)
+ALPHA_LEVELS = 16
+# Cuadros por segundo de los sprites animados
+ANIMATION_FPS = 12
+
+
+def square_frames(size, color):
+    """Un sprite cuadrado de un solo color (las chispas y destellos de siempre)."""
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    surf.fill((*color, 255))
+    return [surf]
+
+
+class ParticleSystem:
+    """
+    Motor de partículas con estructura de arreglos (NumPy).
+
+    Posición, velocidad, edad y vida de cada partícula viven en arreglos y se
+    actualizan todos juntos. Cada sprite se pre-renderiza una vez por cuadro de
+    animación y por nivel de transparencia (ALPHA_LEVELS); al dibujar, el alpha
+    de cada partícula se cuantiza a un nivel y todo se dibuja con un solo
+    `Surface.blits`, sin crear superficies por partícula.
+
+    - vida = inf: la partícula no muere ni se desvanece.
+    - wrap: al salir por abajo de `bounds` reaparece arriba en una x al azar.
+    """
+    def __init__(self, bounds, capacity=64):
+        self.bounds = pygame.Rect(bounds)
+        self.count = 0
+
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.age = np.zeros(capacity, np.float32)
+        self.life = np.zeros(capacity, np.float32)
+        self.sprite = np.zeros(capacity, np.int32)
+        self.wrap = np.zeros(capacity, np.bool_)
+
+        # Tabla plana de superficies: base[sprite] + cuadro * (ALPHA_LEVELS - 1) + (nivel - 1)
+        self.surfaces = []
+        self.sprite_base = np.zeros(0, np.int32)
+        self.sprite_frames = np.zeros(0, np.int32)
+        self.sprite_offset = np.zeros((0, 2), np.float32)
+
+    def __len__(self):
+        return self.count
+
+    # ------------------------------------------------------------
+    # SPRITES
+    # ------------------------------------------------------------
+    def add_sprite(self, frames, anchor='topleft'):
+        """
+        Registra un sprite (lista de cuadros) y devuelve su id.
+        Con anchor='center' la posición de la partícula es el centro del sprite.
+        """
+        base = len(self.surfaces)
+        for frame in frames:
+            for level in range(1, ALPHA_LEVELS):
+                if level == ALPHA_LEVELS - 1:
+                    self.surfaces.append(frame)
+                    continue
+                faded = frame.copy()
+                alpha = round(255 * level / (ALPHA_LEVELS - 1))
+                faded.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                self.surfaces.append(faded)
+
+        if anchor == 'center':
+            w, h = frames[0].get_size()
+            offset = (-w / 2, -h / 2)
+        else:
+            offset = (0.0, 0.0)
+
+        self.sprite_base = np.append(self.sprite_base, np.int32(base))
+        self.sprite_frames = np.append(self.sprite_frames, np.int32(len(frames)))
+        self.sprite_offset = np.vstack([self.sprite_offset, np.array([offset], np.float32)])
+        return len(self.sprite_base) - 1
+
+    # ------------------------------------------------------------
+    # EMISIÓN
+    # ------------------------------------------------------------
+    def _grow(self, needed):
+        capacity = len(self.x)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in ('x', 'y', 'vx', 'vy', 'age', 'life', 'sprite', 'wrap'):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def emit(self, x, y, vx=0.0, vy=0.0, life=math.inf, sprite=0, wrap=False, age=0.0):
+        """
+        Agrega partículas. Cada argumento puede ser un escalar o un arreglo;
+        se agregan tantas partículas como el largo del arreglo más largo.
+        """
+        columns = np.broadcast_arrays(
+            np.atleast_1d(x), np.atleast_1d(y), np.atleast_1d(vx), np.atleast_1d(vy),
+            np.atleast_1d(life), np.atleast_1d(sprite), np.atleast_1d(wrap), np.atleast_1d(age)
+        )
+        n = len(columns[0])
+        if n == 0:
+            return
+        self._grow(self.count + n)
+        start, end = self.count, self.count + n
+        for name, column in zip(('x', 'y', 'vx', 'vy', 'life', 'sprite', 'wrap', 'age'), columns):
+            getattr(self, name)[start:end] = column
+        self.count = end
+
+    def clear(self):
+        self.count = 0
+
+    # ------------------------------------------------------------
+    # ACTUALIZACIÓN
+    # ------------------------------------------------------------
+    def update(self, dt):
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n] * dt
+        y += self.vy[:n] * dt
+        age = self.age[:n]
+        age += dt
+
+        # Las que salen por abajo reaparecen arriba
+        wrapped = self.wrap[:n] & (y > self.bounds.bottom)
+        if wrapped.any():
+            y[wrapped] = self.bounds.top - 30
+            x[wrapped] = np.random.randint(self.bounds.left, self.bounds.right + 1, int(wrapped.sum()))
+
+        # Compactar las vivas al principio de los arreglos
+        alive = age < self.life[:n]
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for name in ('x', 'y', 'vx', 'vy', 'age', 'life', 'sprite', 'wrap'):
+                arr = getattr(self, name)
+                arr[:len(keep)] = arr[keep]
+            self.count = len(keep)
+
+    # ------------------------------------------------------------
+    # DIBUJO
+    # ------------------------------------------------------------
+    def _blit_items(self):
+        """Lista de (superficie, posición) de las partículas visibles."""
+        n = self.count
+        if n == 0:
+            return []
+        age = self.age[:n]
+        sprite = self.sprite[:n]
+
+        # alpha en [0, 1] -> nivel 1..ALPHA_LEVELS-1 (0 = invisible)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha = np.clip(1.0 - age / self.life[:n], 0.0, 1.0)
+        level = np.ceil(alpha * (ALPHA_LEVELS - 1)).astype(np.int32)
+        visible = level > 0
+
+        frame = (age * ANIMATION_FPS).astype(np.int32) % self.sprite_frames[sprite]
+        index = self.sprite_base[sprite] + frame * (ALPHA_LEVELS - 1) + level - 1
+        offset = self.sprite_offset[sprite]
+        xs = (self.x[:n] + offset[:, 0]).astype(np.int32)
+        ys = (self.y[:n] + offset[:, 1]).astype(np.int32)
+
+        if not visible.all():
+            index, xs, ys = index[visible], xs[visible], ys[visible]
+
+        surfaces = self.surfaces
+        return [(surfaces[i], (px, py)) for i, px, py in zip(index.tolist(), xs.tolist(), ys.tolist())]
+
+    def draw(self, screen):
+        items = self._blit_items()
+        if items:
+            screen.blits(items, doreturn=False)
+
+    def render(self, queue, layer=LAYER_EFFECTS):
+        """Encola las partículas en una RenderQueue (ver engine/render_queue.py)."""
+        queue.submit_many(self._blit_items(), layer)
+
+
+# =====================================================================
+# EMISORES (comportamientos de StarField, SparkBurst y SparkleEmitter)
+# =====================================================================
+class Emitter:
+    """Base de los emisores: cada uno maneja su propio ParticleSystem."""
+    system = None
+
+    def update(self, dt):
+        self.system.update(dt)
+
+    def draw(self, screen):
+        self.system.draw(screen)
+
+    def render(self, queue, layer=LAYER_EFFECTS):
+        self.system.render(queue, layer)
+
+
+class FallingEmitter(Emitter):
+    """Partículas eternas que caen y reaparecen arriba (cielo de estrellas)."""
+    def __init__(self, frames, count, bounds, speed=(20, 70)):
+        self.system = ParticleSystem(bounds, capacity=count)
+        sprite = self.system.add_sprite(frames, anchor='center')
+        b = self.system.bounds
+        self.system.emit(
+            x=np.random.randint(b.left, b.right + 1, count),
+            y=np.random.randint(b.top - 200, b.bottom + 1, count),
+            vy=np.random.uniform(speed[0], speed[1], count),
+            sprite=sprite,
+            wrap=True
+        )
+
+
+class BurstEmitter(Emitter):
+    """Ráfaga de partículas cortas que suben y se desvanecen alrededor de un punto."""
+    def __init__(self, bounds, amount=14, spread=10, sizes=(2, 3, 4), color=(255, 255, 255),
+                 speed=(-30, -60), lifetime=0.3):
+        self.system = ParticleSystem(bounds)
+        self.sprites = np.array([self.system.add_sprite(square_frames(s, color)) for s in sizes])
+        self.amount = amount
+        self.spread = spread
+        self.speed = speed
+        self.lifetime = lifetime
+
+    def trigger(self, x, y):
+        n = self.amount
+        self.system.emit(
+            x=x + np.random.randint(-self.spread, self.spread + 1, n),
+            y=y + np.random.randint(-self.spread, self.spread + 1, n),
+            vy=np.random.uniform(self.speed[0], self.speed[1], n),
+            life=self.lifetime,
+            sprite=np.random.choice(self.sprites, n)
+        )
+
+
+class AreaEmitter(Emitter):
+    """Mantiene `count` partículas que nacen al azar dentro de un área, suben y se desvanecen."""
+    def __init__(self, area_rect, count=10, sizes=(3, 4, 5, 6), color=(255, 255, 255),
+                 speed=(-10, -30), lifetime=(1.4, 2.3)):
+        self.area = pygame.Rect(area_rect)
+        self.system = ParticleSystem(self.area, capacity=count)
+        self.sprites = np.array([self.system.add_sprite(square_frames(s, color)) for s in sizes])
+        self.base_count = count
+        self.speed = speed
+        self.lifetime = lifetime
+
+    def update(self, dt):
+        missing = self.base_count - len(self.system)
+        if missing > 0:
+            a = self.area
+            self.system.emit(
+                x=np.random.randint(a.left, a.right + 1, missing),
+                y=np.random.randint(a.top, a.bottom + 1, missing),
+                vy=np.random.uniform(self.speed[0], self.speed[1], missing),
+                life=np.random.uniform(self.lifetime[0], self.lifetime[1], missing),
+                sprite=np.random.choice(self.sprites, missing)
+            )
+        self.system.update(dt)
@@ -0,0 +1,80 @@
+# engine/pixel_format.py
+
+import numpy as np
+import pygame
+
+# Formatos de pantalla, del más barato de dibujar al más caro
+FORMAT_OPAQUE = "opaque"      # convert(): sin transparencia, blit directo
+FORMAT_COLORKEY = "colorkey"  # convert() + colorkey con RLEACCEL: transparencia todo o nada
+FORMAT_ALPHA = "alpha"        # convert_alpha(): mezcla por píxel
+FORMATS = (FORMAT_OPAQUE, FORMAT_COLORKEY, FORMAT_ALPHA)
+
+# Colores que se prueban como colorkey: el primero que no aparezca en la imagen
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 0), (1, 254, 3), (254, 1, 253))
+
+# Tolerancia del análisis: smoothscale redondea el alpha (un 255 puede quedar en
+# 253), así que desde OPAQUE_MIN se toma como opaco y hasta TRANSPARENT_MAX como
+# transparente. La diferencia no se nota en pantalla.
+OPAQUE_MIN = 250
+TRANSPARENT_MAX = 5
+
+
+def _rgba(surface):
+    """La misma imagen como superficie RGBA de 32 bits (no necesita pantalla)."""
+    if surface.get_flags() & pygame.SRCALPHA and surface.get_bitsize() == 32:
+        return surface
+    rgba = pygame.Surface(surface.get_size(), pygame.SRCALPHA, 32)
+    rgba.blit(surface, (0, 0))
+    return rgba
+
+
+def classify(surface, allow_colorkey=True):
+    """
+    Analiza el canal alpha de una imagen y devuelve (formato, colorkey):
+    - FORMAT_OPAQUE:   todos los píxeles son opacos.
+    - FORMAT_COLORKEY: cada píxel es opaco o transparente (sin medias tintas) y hay un
+                       color de COLORKEY_CANDIDATES que no usa la imagen.
+    - FORMAT_ALPHA:    hay transparencias parciales (bordes suavizados, sombras).
+    colorkey es None salvo con FORMAT_COLORKEY. Se puede llamar sin pantalla
+    (p. ej. desde los procesos de `python main.py bake`).
+    """
+    if not surface.get_flags() & pygame.SRCALPHA and surface.get_colorkey() is None:
+        return FORMAT_OPAQUE, None
+
+    rgba = _rgba(surface)
+    alpha = pygame.surfarray.array_alpha(rgba)
+    if alpha.size == 0 or alpha.min() >= OPAQUE_MIN:
+        return FORMAT_OPAQUE, None
+    if not allow_colorkey or np.any((alpha > TRANSPARENT_MAX) & (alpha < OPAQUE_MIN)):
+        return FORMAT_ALPHA, None
+
+    visible = pygame.surfarray.array3d(rgba)[alpha >= OPAQUE_MIN]
+    for key in COLORKEY_CANDIDATES:
+        if not np.any(np.all(visible == key, axis=1)):
+            return FORMAT_COLORKEY, key
+    return FORMAT_ALPHA, None
+
+
+def apply_format(surface, pixel_format, colorkey=None):
+    """Convierte `surface` al formato de pantalla indicado (necesita pygame.display)."""
+    if pixel_format == FORMAT_OPAQUE:
+        return surface.convert()
+    if pixel_format == FORMAT_COLORKEY and colorkey is not None:
+        # Los píxeles opacos conservan su color; los transparentes pasan al color clave
+        keyed = surface.convert()
+        transparent = pygame.surfarray.array_alpha(_rgba(surface)) <= TRANSPARENT_MAX
+        pixels = pygame.surfarray.pixels3d(keyed)
+        pixels[transparent] = colorkey
+        del pixels
+        keyed.set_colorkey(colorkey, pygame.RLEACCEL)
+        return keyed
+    return surface.convert_alpha()
+
+
+def format_name(surface):
+    """Formato de una superficie ya convertida (para reportes)."""
+    if surface.get_colorkey() is not None:
+        return FORMAT_COLORKEY
+    if surface.get_flags() & pygame.SRCALPHA:
+        return FORMAT_ALPHA
+    return FORMAT_OPAQUE
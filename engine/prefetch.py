@@ -0,0 +1,145 @@
+# engine/prefetch.py
+
+import queue
+import threading
+
+from engine.bake import manifest_entry
+
+
+def manifest_key(entry):
+    """
+    Clave de image_cache para una entrada (subfolder, filename, size[, smooth])
+    de ASSET_MANIFEST: (subfolder, filename, size), o con un False al final si
+    la variante es sin filtrar (igual que en load_image y get_scaled).
+    """
+    subfolder, filename, size, smooth = manifest_entry(entry)
+    if not isinstance(size, int):
+        size = (int(size[0]), int(size[1]))
+    if not smooth:
+        return (subfolder, filename, size, False)
+    return (subfolder, filename, size)
+
+
+class Prefetcher:
+    """
+    Precarga en un hilo secundario los assets de las escenas a las que se puede
+    ir desde la actual (`next_scenes`), mientras la escena actual está en pantalla.
+
+    El hilo solo decodifica y escala (`decode_asset`); las superficies quedan en
+    espera dentro de `image_cache` y se convierten al formato de pantalla en el
+    hilo principal la primera vez que la escena las pide. Lo que queda en espera cuenta
+    para el presupuesto de image_cache: si no entra, no se precarga.
+
+    Métricas:
+    - scene_hits:    la escena destino ya estaba precargada al iniciar la transición.
+    - scene_misses:  la escena destino no se había pedido o no había terminado.
+    - assets_decoded / assets_wasted: assets precargados y los que se descartaron
+      sin usarse porque el jugador fue a otra escena.
+    """
+    def __init__(self, image_cache, decode_asset, manifest_for):
+        self.image_cache = image_cache
+        self.decode_asset = decode_asset
+        self.manifest_for = manifest_for  # scene_key -> lista ASSET_MANIFEST
+
+        self.jobs = queue.Queue()
+        self.lock = threading.Lock()
+        self.pending = set()    # escenas en cola o en proceso
+        self.done = {}          # scene_key -> claves precargadas por esa escena
+        self.generation = 0     # se incrementa en cada transición para cancelar trabajo viejo
+        self.target_key = None  # destino de la última transición
+
+        self.scene_hits = 0
+        self.scene_misses = 0
+        self.assets_decoded = 0
+        self.assets_wasted = 0
+
+        self.thread = threading.Thread(target=self._worker, name="prefetch", daemon=True)
+        self.thread.start()
+
+    # ------------------------------------------------------------
+    # HILO PRINCIPAL
+    # ------------------------------------------------------------
+    def prefetch(self, scene_keys):
+        """Encola la precarga de las escenas indicadas (las repetidas se ignoran)."""
+        for scene_key in scene_keys:
+            with self.lock:
+                if scene_key in self.pending or scene_key in self.done:
+                    continue
+                self.pending.add(scene_key)
+                generation = self.generation
+            try:
+                entries = [manifest_key(e) for e in self.manifest_for(scene_key)]
+            except Exception as e:
+                print(f"⚠ No se pudo leer el manifiesto de {scene_key} para precargar: {e}")
+                with self.lock:
+                    self.pending.discard(scene_key)
+                continue
+            self.jobs.put((generation, scene_key, entries))
+
+    def on_transition(self, target_key, count=True):
+        """
+        Llamar al iniciar una transición hacia `target_key`: registra hit/miss,
+        cancela el trabajo pendiente y descarta lo precargado para otras escenas.
+        Con `count=False` no se registra hit/miss (p. ej. la escena ya estaba en el pool).
+        """
+        with self.lock:
+            if count:
+                if target_key in self.done:
+                    self.scene_hits += 1
+                else:
+                    self.scene_misses += 1
+
+            target_keys = self.done.get(target_key, set())
+            for scene_key, keys in self.done.items():
+                if scene_key == target_key:
+                    continue
+                for key in keys - target_keys:
+                    if self.image_cache.unstage(key):
+                        self.assets_wasted += 1
+
+            self.done.clear()
+            self.pending.clear()
+            self.generation += 1
+            self.target_key = target_key
+
+    def stats(self):
+        """Resumen de las métricas de precarga."""
+        total = self.scene_hits + self.scene_misses
+        return {
+            "scene_hits": self.scene_hits,
+            "scene_misses": self.scene_misses,
+            "scene_hit_rate": self.scene_hits / total if total else 0.0,
+            "assets_decoded": self.assets_decoded,
+            "assets_used": self.image_cache.staged_hits,
+            "assets_wasted": self.assets_wasted,
+        }
+
+    # ------------------------------------------------------------
+    # HILO SECUNDARIO
+    # ------------------------------------------------------------
+    def _worker(self):
+        while True:
+            generation, scene_key, entries = self.jobs.get()
+            prefetched = set()
+            for key in entries:
+                if generation != self.generation:
+                    break  # hubo una transición: este trabajo ya no sirve
+                if self.image_cache.has(key):
+                    continue
+                surface = self.decode_asset(*key)
+                if surface is None:
+                    continue
+                if not self.image_cache.stage(key, surface):
+                    continue  # ya se cargó en el hilo principal, o no entra en el presupuesto
+                prefetched.add(key)
+                self.assets_decoded += 1
+
+            with self.lock:
+                if generation == self.generation:
+                    self.pending.discard(scene_key)
+                    self.done[scene_key] = prefetched
+                elif scene_key != self.target_key:
+                    # Llegó tarde y el jugador fue a otra escena: no se va a usar
+                    for key in prefetched:
+                        if self.image_cache.unstage(key):
+                            self.assets_wasted += 1
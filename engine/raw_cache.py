@@ -0,0 +1,114 @@
+# engine/raw_cache.py
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+import pygame
+
+# Cabecera: magic, versión, mtime del original (ns), ancho, alto
+HEADER = struct.Struct("<4sHQII")
+MAGIC = b"EGRW"
+VERSION = 1
+
+
+class RawImageCache:
+    """
+    Caché en disco de píxeles RGBA ya decodificados y ya escalados.
+
+    Cada variante (ruta original + tamaño) se guarda en un archivo propio con una
+    cabecera mínima y los píxeles crudos. Al leerla se mapea el archivo en memoria
+    y se envuelve con pygame.image.frombuffer, sin pasar por zlib. Si el mtime
+    guardado no coincide con el del original, la entrada se considera vencida.
+    """
+    def __init__(self, cache_dir, enabled=True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _entry_path(self, source, spec):
+        digest = hashlib.sha1(f"{source}|{spec}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".rgba")
+
+    def load(self, source, spec, convert=True):
+        """
+        Devuelve la superficie guardada para (source, spec), o None.
+        Con `convert=False` devuelve una copia RGBA sin convertir al formato de
+        pantalla (apta para hilos secundarios). `convert` también puede ser una
+        función que recibe los píxeles mapeados y devuelve la superficie final.
+        """
+        if not self.enabled:
+            return None
+        path = self._entry_path(source, spec)
+        try:
+            mtime = os.stat(source).st_mtime_ns
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    magic, version, cached_mtime, width, height = HEADER.unpack_from(mapped)
+                    if magic != MAGIC or version != VERSION or cached_mtime != mtime:
+                        self.misses += 1
+                        return None
+                    with memoryview(mapped) as view:
+                        with view[HEADER.size:HEADER.size + width * height * 4] as pixels:
+                            raw = pygame.image.frombuffer(pixels, (width, height), "RGBA")
+                            if callable(convert):
+                                image = convert(raw)
+                            else:
+                                image = raw.convert_alpha() if convert else raw.copy()
+                            del raw
+        except (OSError, ValueError, BufferError, struct.error, pygame.error):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return image
+
+    def store(self, source, spec, surface):
+        """Guarda los píxeles de `surface` como variante de (source, spec)."""
+        if not self.enabled:
+            return
+        path = self._entry_path(source, spec)
+        try:
+            mtime = os.stat(source).st_mtime_ns
+            if surface.get_colorkey() is not None:
+                # El caché guarda RGBA: el color clave pasa a ser transparencia
+                surface = surface.convert_alpha()
+            width, height = surface.get_size()
+            pixels = pygame.image.tobytes(surface, "RGBA")
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Escribir a un temporal propio y renombrar: nunca queda una entrada a
+            # medias, aunque el hilo de precarga y el principal guarden la misma
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(HEADER.pack(MAGIC, VERSION, mtime, width, height))
+                    f.write(pixels)
+                os.replace(tmp_path, path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self.writes += 1
+        except (OSError, pygame.error) as e:
+            print(f"⚠ No se pudo escribir el caché crudo de {source}: {e}")
+
+    def clear(self):
+        """Borra todas las entradas del disco."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".rgba") or name.endswith(".tmp"):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    def stats(self):
+        """Resumen de uso del caché."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,122 @@
+# engine/render_queue.py
+
+from operator import itemgetter
+
+# Capas de dibujo (menor = más atrás). Se pueden usar valores intermedios,
+# p. ej. LAYER_BACKGROUND + 1 para efectos detrás del personaje.
+LAYER_BACKGROUND = 0
+LAYER_WORLD = 10
+LAYER_EFFECTS = 20
+LAYER_UI = 30
+LAYER_OVERLAY = 40
+
+
+class RenderQueue:
+    """
+    Cola de dibujo de una escena.
+
+    Durante `render` la escena encola elementos (superficie, destino, capa,
+    área) en cualquier orden; `flush` los ordena por capa (respetando el orden
+    de llegada dentro de cada capa) y los dibuja con un solo `Surface.blits`.
+
+    Al vaciarse, descarta los elementos que no tocan el área de recorte del
+    destino (la pantalla, o la zona sucia que se está redibujando, ver
+    engine/dirty_rects.py). Lo que no es un blit (pygame.draw...) se encola con
+    `submit_draw` y se ejecuta en su lugar, partiendo el lote en dos.
+    """
+    def __init__(self):
+        self.items = []  # (capa, superficie o None, destino o función, área)
+        self.changed = []  # superficies redibujadas desde el último frame (ver mark_changed)
+        # Estadísticas del último flush
+        self.drawn = 0
+        self.culled = 0
+        self.batches = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def submit(self, surface, dest, layer=LAYER_WORLD, area=None):
+        """Encola un blit. `dest` es un punto (x, y) o un Rect; `area` es opcional."""
+        self.items.append((layer, surface, dest, area))
+
+    def submit_many(self, blits, layer=LAYER_WORLD):
+        """Encola varios (superficie, destino) en la misma capa."""
+        self.items.extend((layer, surface, dest, None) for surface, dest in blits)
+
+    def submit_draw(self, draw, layer=LAYER_UI, rect=None):
+        """
+        Encola una función `draw(target)` para lo que no es un blit (rectángulos, líneas...).
+        `rect` es opcional: la zona donde dibuja, para descartarla si no se ve.
+        """
+        self.items.append((layer, None, draw, rect))
+
+    def mark_changed(self, surface):
+        """
+        Avisa que `surface` se modificó después de haberse dibujado (p. ej. un
+        renglón que se va escribiendo). Con superficies no hace falta; el
+        backend de texturas la vuelve a subir (ver engine/texture_backend.py).
+        """
+        self.changed.append(surface)
+
+    def take_changed(self):
+        """Vacía y devuelve la lista de superficies marcadas con mark_changed."""
+        changed = self.changed
+        self.changed = []
+        return changed
+
+    def clear(self):
+        self.items.clear()
+        self.changed.clear()
+
+    def take(self):
+        """
+        Vacía la cola y devuelve sus elementos en orden de capa, como
+        (superficie o None, destino o función, área). Para dibujar con otro
+        backend (ver engine/texture_backend.py).
+        """
+        items = self.items
+        items.sort(key=itemgetter(0))
+        taken = [item[1:] for item in items]
+        items.clear()
+        return taken
+
+    def flush(self, target):
+        """Dibuja todo lo encolado sobre `target`, en orden de capa, y vacía la cola."""
+        items = self.items
+        items.sort(key=itemgetter(0))
+        clip = target.get_clip()
+        clip_left, clip_top, clip_right, clip_bottom = clip.left, clip.top, clip.right, clip.bottom
+
+        drawn = culled = batches = 0
+        batch = []
+        for _, surface, dest, area in items:
+            if surface is None:
+                if area is not None and not clip.colliderect(area):
+                    culled += 1
+                    continue
+                if batch:
+                    target.blits(batch, doreturn=False)
+                    batches += 1
+                    batch = []
+                dest(target)
+                drawn += 1
+                continue
+
+            x, y = dest[0], dest[1]
+            if area is None:
+                w, h = surface.get_size()
+            else:
+                w, h = area[2], area[3]
+            if x >= clip_right or y >= clip_bottom or x + w <= clip_left or y + h <= clip_top:
+                culled += 1
+                continue
+            batch.append((surface, dest) if area is None else (surface, dest, area))
+            drawn += 1
+
+        if batch:
+            target.blits(batch, doreturn=False)
+            batches += 1
+
+        items.clear()
+        self.changed.clear()
+        self.drawn, self.culled, self.batches = drawn, culled, batches
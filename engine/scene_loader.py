@@ -0,0 +1,46 @@
+# engine/scene_loader.py
+
+import time
+
+
+class SceneLoader:
+    """
+    Avanza por partes la carga de una escena (su generador `load_steps`).
+
+    Cada `yield` del generador marca un punto donde se puede pausar; el valor
+    cedido puede ser el progreso (0.0 a 1.0) o None. `advance` ejecuta pasos
+    hasta agotar el presupuesto de tiempo del frame, así la transición sigue
+    animándose mientras la escena se carga.
+    """
+    def __init__(self, scene, steps=None):
+        self.scene = scene
+        self.steps = steps
+        self.done = steps is None
+        self.progress = 1.0 if self.done else 0.0
+        self.step_count = 0
+        self.elapsed = 0.0
+
+    def advance(self, budget):
+        """Ejecuta pasos durante como máximo `budget` segundos. Devuelve True al terminar."""
+        if self.done:
+            return True
+        start = time.perf_counter()
+        deadline = start + budget
+        try:
+            while True:
+                value = next(self.steps)
+                self.step_count += 1
+                if isinstance(value, (int, float)):
+                    self.progress = max(0.0, min(1.0, float(value)))
+                if time.perf_counter() >= deadline:
+                    break
+        except StopIteration:
+            self.done = True
+            self.progress = 1.0
+        finally:
+            self.elapsed += time.perf_counter() - start
+        return self.done
+
+    def finish(self):
+        """Completa la carga de una vez (sin presupuesto)."""
+        return self.advance(float('inf'))
@@ -1,6 +1,8 @@
 import pygame
 import importlib
-from settings import SCREEN_SIZE, CAPTION, FPS
+from settings import SCREEN_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, CAPTION, FPS, DIRTY_RECTS_MAX_COVERAGE
+from engine.dirty_rects import DirtyRegion
+from engine.render_queue import RenderQueue
 from game.state import GameState
 
 # ======================================================
@@ -9,9 +11,29 @@ from game.state import GameState
 
 class Scene:
     """Clase base para todas las escenas del juego."""
+
+    # Si es True, al salir la escena se suspende en el pool de escenas
+    # en lugar de destruirse (ver engine/scene_pool.py)
+    keep_alive = False
+
+    # Claves de SCENE_MAP a las que se puede ir desde esta escena; sus assets
+    # se precargan en segundo plano (ver engine/prefetch.py)
+    next_scenes = ()
+
+    # Si es True, la escena avisa con mark_dirty() qué zonas cambiaron y el
+    # juego solo redibuja esas zonas (ver engine/dirty_rects.py)
+    dirty_rects = False
+
+    # Transición al entrar a esta escena: 'fade', 'crossfade' o 'wipe', y su
+    # duración en segundos (None = TRANSITION_EFFECT / TRANSITION_DURATION)
+    transition = None
+    transition_duration = None
+
     def __init__(self, game):
         self.game = game
         self.next_scene = None # Usado para solicitar un cambio de escena
+        self.dirty = DirtyRegion((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), DIRTY_RECTS_MAX_COVERAGE)
+        self.render_queue = RenderQueue()
 
     def handle_input(self, event): 
         """Maneja los eventos (mouse, teclado)."""
@@ -22,9 +44,60 @@ class Scene:
         pass
         
     def draw(self, screen): 
-        """Dibuja todos los elementos en la pantalla."""
+        """
+        Dibuja todos los elementos en la pantalla. Por defecto llama a render()
+        para encolar todo y lo dibuja ordenado por capa en un solo blits.
+        """
+        self.render(self.render_queue)
+        self.render_queue.flush(screen)
+
+    def render(self, queue):
+        """Encola (superficie, destino, capa, área) en `queue` (ver engine/render_queue.py)."""
+        pass
+
+    def draw_textures(self, backend):
+        """
+        Dibuja la escena con el backend de texturas (engine/texture_backend.py).
+        Lo que se encola en render() se dibuja con texturas; si la escena
+        redefine draw(), se dibuja por software y se sube como un solo frame.
+        """
+        if type(self).draw is Scene.draw:
+            self.render(self.render_queue)
+            backend.present_queue(self.render_queue)
+        else:
+            backend.surface.fill((0, 0, 0))
+            self.draw(backend.surface)
+            backend.present()
+
+    def load_steps(self):
+        """
+        Generador opcional con la carga pesada de la escena (imágenes, etc.).
+        Cada `yield` es un punto de pausa: el juego lo avanza unos pocos
+        milisegundos por frame durante la transición (ver engine/scene_loader.py).
+        Puede ceder el progreso (0.0 a 1.0). Por defecto no hay nada que cargar.
+        """
+        return
+        yield
+
+    def on_enter(self):
+        """Se llama cada vez que la escena pasa a ser la actual (también al volver del pool)."""
+        pass
+
+    def on_exit(self):
+        """Se llama cuando la escena deja de ser la actual."""
         pass
     
+    def is_idle(self):
+        """
+        True si la escena está quieta esperando input (sin animaciones). Mientras
+        lo esté, el juego deja de dibujar a FPS y espera eventos (ahorra CPU).
+        """
+        return False
+
+    def mark_dirty(self, rect=None):
+        """Avisa que `rect` cambió y hay que redibujarlo (None = toda la pantalla)."""
+        self.dirty.add(rect)
+
     def change_scene(self, next_scene_key):
         """Método llamado por las escenas para iniciar una transición."""
         self.next_scene = next_scene_key
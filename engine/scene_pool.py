@@ -0,0 +1,64 @@
+# engine/scene_pool.py
+
+from collections import OrderedDict
+
+
+class ScenePool:
+    """
+    Guarda escenas suspendidas para reutilizarlas en lugar de reconstruirlas.
+
+    Solo se guardan las escenas que lo piden (`keep_alive = True`). Al volver a
+    una escena guardada se la saca del pool y se llama a su `on_enter`, que
+    refresca lo que haya cambiado mientras estaba suspendida (p. ej. el outfit).
+    Si el pool supera `max_size`, se descarta la escena usada hace más tiempo.
+    """
+    def __init__(self, max_size=3, on_evict=None):
+        self.max_size = max_size
+        self.on_evict = on_evict  # callback(scene_key, scene) al descartar una escena
+        self.scenes = OrderedDict()  # clave de SCENE_MAP -> escena suspendida
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def suspend(self, scene_key, scene):
+        """
+        Guarda una escena que acaba de salir de pantalla (si lo permite).
+        Devuelve True si quedó guardada.
+        """
+        if self.max_size <= 0 or not getattr(scene, 'keep_alive', False):
+            return False
+        self.scenes[scene_key] = scene
+        self.scenes.move_to_end(scene_key)
+        while len(self.scenes) > self.max_size:
+            evicted_key, evicted = self.scenes.popitem(last=False)
+            self.evictions += 1
+            print(f"Pool de escenas: descartando {evicted_key}")
+            if self.on_evict:
+                self.on_evict(evicted_key, evicted)
+        return scene_key in self.scenes
+
+    def resume(self, scene_key):
+        """Saca del pool la escena guardada para `scene_key`, o devuelve None."""
+        scene = self.scenes.pop(scene_key, None)
+        if scene is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return scene
+
+    def discard(self, scene_key):
+        """Olvida una escena guardada (p. ej. si ya no es válida)."""
+        self.scenes.pop(scene_key, None)
+
+    def clear(self):
+        self.scenes.clear()
+
+    def stats(self):
+        """Resumen de uso del pool."""
+        return {
+            "scenes": list(self.scenes),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
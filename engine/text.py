@@ -0,0 +1,204 @@
+# engine/text.py
+
+from collections import OrderedDict
+
+import pygame
+
+from engine.image_cache import ImageCache
+
+# Ancho de las hojas de glifos (se agregan filas hacia abajo a medida que hacen falta)
+ATLAS_WIDTH = 512
+# Cantidad de textos cuya distribución (x de cada carácter) recuerda cada hoja
+LAYOUT_CACHE_SIZE = 64
+
+
+def _color_key(color):
+    """pygame.Color no se puede usar como clave: se normaliza a (r, g, b, a)."""
+    return tuple(pygame.Color(color))
+
+
+def wrap_text(font, text, width):
+    """
+    Parte `text` en renglones que entran en `width` píxeles, cortando entre
+    palabras (una palabra más larga que el renglón se corta por letras).
+    Los saltos de línea del texto se respetan.
+    """
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = word if not line else line + " " + word
+            if font.size(candidate)[0] <= width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            # Palabra que no entra sola en un renglón: se corta donde haga falta
+            while font.size(word)[0] > width and len(word) > 1:
+                cut = len(word) - 1
+                while cut > 1 and font.size(word[:cut])[0] > width:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+            line = word
+        lines.append(line)
+    return lines
+
+
+class GlyphAtlas:
+    """
+    Hoja de glifos de una fuente en un color: cada carácter se renderiza una
+    sola vez y los textos se arman con blits de sus glifos (área de la hoja).
+
+    Sirve para textos que cambian seguido (el nombre que se escribe, el
+    diálogo que va apareciendo): no se crea una superficie por cada variante
+    del texto. La x de cada carácter sale de font.size del texto hasta ahí
+    (respeta kerning y avances fraccionarios), así que mide lo mismo que
+    font.render.
+
+    La hoja que ya se entregó (blit_items) no se modifica: al agregar glifos
+    se trabaja sobre una copia, así el backend de texturas nunca ve una
+    textura vieja (ver engine/texture_backend.py).
+    """
+    def __init__(self, font, color, antialias=True, width=ATLAS_WIDTH):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.line_height = font.get_height()
+        self.sheet = pygame.Surface((width, self.line_height), pygame.SRCALPHA)
+        self.glyphs = {}  # carácter -> (área en la hoja, desplazamiento)
+        self.layouts = OrderedDict()  # texto -> x de cada carácter y ancho total
+        self.cursor = [0, 0]
+        self.shared = False
+        self.hits = 0
+        self.misses = 0
+
+    def _glyph(self, char):
+        glyph = self.glyphs.get(char)
+        if glyph is not None:
+            self.hits += 1
+            return glyph
+        self.misses += 1
+
+        image = self.font.render(char, self.antialias, self.color)
+        w = image.get_width()
+        sheet_w, sheet_h = self.sheet.get_size()
+        x, y = self.cursor
+        if x + w > sheet_w:
+            x, y = 0, y + self.line_height
+        if y + self.line_height > sheet_h:
+            grown = pygame.Surface((sheet_w, sheet_h * 2), pygame.SRCALPHA)
+            grown.blit(self.sheet, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.sheet = grown
+        elif self.shared:
+            self.sheet = self.sheet.copy()
+        self.shared = False
+
+        # La hoja es transparente: BLEND_RGBA_MAX copia el glifo tal cual
+        self.sheet.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        self.cursor = [x + w, y]
+
+        # Un glifo que sobresale a la izquierda (minx < 0) se renderiza corrido
+        # a la derecha: se compensa al ubicarlo
+        metrics = self.font.metrics(char)[0]
+        offset = max(0, -metrics[0]) if metrics else 0
+        glyph = (pygame.Rect(x, y, w, self.line_height), offset)
+        self.glyphs[char] = glyph
+        return glyph
+
+    def _layout(self, text):
+        """x de cada carácter de `text` (la última es el ancho total)."""
+        layout = self.layouts.get(text)
+        if layout is not None:
+            self.layouts.move_to_end(text)
+            return layout
+        layout = [self.font.size(text[:i])[0] for i in range(len(text) + 1)]
+        self.layouts[text] = layout
+        if len(self.layouts) > LAYOUT_CACHE_SIZE:
+            self.layouts.popitem(last=False)
+        return layout
+
+    def size(self, text):
+        """(ancho, alto) que ocupa `text`, sin dibujarlo."""
+        return self._layout(text)[-1], self.line_height
+
+    def blit_items(self, text, pos):
+        """Lista de (hoja, destino, área) para Surface.blits o RenderQueue.submit."""
+        glyphs = [self._glyph(c) for c in text]
+        layout = self._layout(text)
+        self.shared = True
+        x, y = pos
+        items = []
+        for (area, offset), char_x in zip(glyphs, layout):
+            if area.width:
+                items.append((self.sheet, (x + char_x - offset, y), area))
+        return items
+
+    def draw(self, surface, text, pos):
+        items = self.blit_items(text, pos)
+        if items:
+            surface.blits(items, doreturn=False)
+
+    def draw_range(self, surface, text, start, end, pos):
+        """
+        Dibuja solo los caracteres [start, end) de `text`, en el lugar que
+        ocupan dentro del texto completo (para revelarlo de a poco, ver
+        engine/dialogue.py). `surface` puede ser transparente.
+        """
+        layout = self._layout(text)
+        x, y = pos
+        for i in range(start, min(end, len(text))):
+            area, offset = self._glyph(text[i])
+            if area.width:
+                surface.blit(self.sheet, (x + layout[i] - offset, y), area, special_flags=pygame.BLEND_RGBA_MAX)
+
+    def render(self, text):
+        """El texto armado en una superficie nueva (como font.render)."""
+        w, h = self.size(text)
+        surface = pygame.Surface((max(w, 1), h), pygame.SRCALPHA)
+        for sheet, dest, area in self.blit_items(text, (0, 0)):
+            surface.blit(sheet, dest, area, special_flags=pygame.BLEND_RGBA_MAX)
+        return surface
+
+
+class TextCache(ImageCache):
+    """
+    Servicio de texto: caché LRU (por bytes) de superficies de font.render.
+
+    La clave es (fuente, texto, color, antialias); la fuente ya identifica
+    cara y tamaño. Las superficies devueltas son compartidas, igual que en
+    ImageCache: no se deben modificar.
+
+    Para textos que cambian en cada tecla se usa `atlas` (GlyphAtlas), que
+    arma el texto con glifos cacheados en lugar de llenar el LRU de variantes.
+    """
+    def __init__(self, max_bytes):
+        super().__init__(max_bytes)
+        self.atlases = {}  # (fuente, color, antialias) -> GlyphAtlas
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, _color_key(color), antialias)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        return self.put(key, font.render(text, antialias, color))
+
+    def atlas(self, font, color, antialias=True):
+        key = (font, _color_key(color), antialias)
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(font, color, antialias)
+        return atlas
+
+    def stats(self):
+        stats = super().stats()
+        glyph_hits = sum(a.hits for a in self.atlases.values())
+        glyph_misses = sum(a.misses for a in self.atlases.values())
+        stats.update({
+            "atlases": len(self.atlases),
+            "glyphs": sum(len(a.glyphs) for a in self.atlases.values()),
+            "glyph_hits": glyph_hits,
+            "glyph_misses": glyph_misses,
+            "glyph_hit_rate": glyph_hits / (glyph_hits + glyph_misses) if glyph_hits + glyph_misses else 0.0,
+        })
+        return stats
@@ -0,0 +1,91 @@
+# engine/text_layout.py
+
+from engine.text import wrap_text
+
+
+class TextLayout:
+    """
+    Texto editable de varios párrafos acomodado a un ancho (p. ej. la carta
+    de scenes/write_letter.py).
+
+    Cada párrafo (separado por "\\n") guarda sus renglones ya partidos y una
+    superficie renderizada por renglón. `set_text` compara el texto nuevo con
+    el anterior y solo vuelve a acomodar los párrafos que cambiaron; dentro de
+    ellos, los renglones que quedaron iguales reutilizan su superficie. Así,
+    escribir al final de una carta larga cuesta lo mismo que en una corta:
+    un párrafo acomodado y uno o dos renglones renderizados por tecla.
+    """
+    def __init__(self, font, width, color, antialias=True):
+        self.font = font
+        self.width = width
+        self.color = color
+        self.antialias = antialias
+        self.line_height = font.get_linesize()
+        self.paragraphs = []  # [(texto del párrafo, [(renglón, superficie), ...]), ...]
+        self.lines = []       # todos los (renglón, superficie), en orden
+        # Estadísticas
+        self.relayouts = 0    # párrafos acomodados
+        self.renders = 0      # renglones renderizados
+        self.reused = 0       # renglones que reutilizaron su superficie
+
+    def _layout_paragraph(self, text, reuse):
+        self.relayouts += 1
+        lines = []
+        for line in wrap_text(self.font, text, self.width):
+            surface = reuse.get(line)
+            if surface is None:
+                surface = self.font.render(line, self.antialias, self.color)
+                self.renders += 1
+            else:
+                self.reused += 1
+            lines.append((line, surface))
+        return (text, lines)
+
+    def set_text(self, text):
+        """Acomoda `text`; devuelve False si no cambió ningún párrafo."""
+        new = text.split("\n")
+        old = self.paragraphs
+
+        # Los párrafos iguales al principio y al final se conservan tal cual
+        limit = min(len(old), len(new))
+        start = 0
+        while start < limit and old[start][0] == new[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[len(old) - 1 - end][0] == new[len(new) - 1 - end]:
+            end += 1
+        if start == len(old) == len(new):
+            return False
+
+        replaced = old[start:len(old) - end]
+        reuse = {line: surface for _, lines in replaced for line, surface in lines}
+        middle = [self._layout_paragraph(p, reuse) for p in new[start:len(new) - end]]
+        self.paragraphs = old[:start] + middle + old[len(old) - end:]
+        self.lines = [line for _, lines in self.paragraphs for line in lines]
+        return True
+
+    @property
+    def height(self):
+        return len(self.lines) * self.line_height
+
+    def end_position(self):
+        """(x, y) del final del texto (donde va el cursor), relativo al origen del texto."""
+        if not self.lines:
+            return 0, 0
+        last = self.lines[-1][0]
+        return self.font.size(last)[0], (len(self.lines) - 1) * self.line_height
+
+    def visible(self, scroll, height):
+        """(superficie, y) de los renglones que entran enteros entre `scroll` y `scroll + height`."""
+        first = max(0, -(-scroll // self.line_height))
+        last = min(len(self.lines), (scroll + height) // self.line_height)
+        return [(self.lines[i][1], i * self.line_height - scroll) for i in range(first, last)]
+
+    def stats(self):
+        return {
+            "paragraphs": len(self.paragraphs),
+            "lines": len(self.lines),
+            "relayouts": self.relayouts,
+            "renders": self.renders,
+            "reused": self.reused,
+        }
@@ -1,7 +1,7 @@
 # engine/textbox.py
 
 import pygame
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, text_cache, fonts
 
 class TextBox:
     def __init__(self, x, y, w, h, font, max_length=15, initial_text=''):
@@ -9,7 +9,8 @@ class TextBox:
         self.color = (255, 255, 255) # Blanco para el texto
         self.box_color = (30, 30, 30) # Gris oscuro para el fondo
         self.active_color = (50, 50, 50) # Color cuando está activo
-        self.font = font
+        self.font = fonts.resolve(font) # Font o (cara, tamaño[, estilo]), ver engine/fonts.py
+        self.glyphs = text_cache.atlas(self.font, self.color) # el texto cambia con cada tecla
         self.text = initial_text
         self.max_length = max_length
         self.active = False # Indica si está listo para recibir input
@@ -41,9 +42,6 @@ class TextBox:
         # Dibujar el borde
         pygame.draw.rect(screen, self.color, self.rect, 2) 
 
-        # Renderizar el texto
-        txt_surface = self.font.render(self.text, True, self.color)
-        
-        # Dibujar el texto y centrarlo verticalmente
-        text_y = self.rect.centery - txt_surface.get_height() // 2
-        screen.blit(txt_surface, (self.rect.x + 5, text_y))
\ No newline at end of file
+        # Dibujar el texto (armado con glifos cacheados) y centrarlo verticalmente
+        text_y = self.rect.centery - self.glyphs.line_height // 2
+        self.glyphs.draw(screen, self.text, (self.rect.x + 5, text_y))
\ No newline at end of file
@@ -0,0 +1,164 @@
+# engine/texture_backend.py
+
+import weakref
+
+import pygame
+from pygame._sdl2.video import Renderer, Texture, Window, get_drivers
+
+
+class TextureBackend:
+    """
+    Backend de dibujo con texturas (pygame._sdl2.video), alternativa a
+    engine/framebuffer.py (settings.RENDER_BACKEND = 'texture').
+
+    Lo que las escenas encolan en su RenderQueue se dibuja con el Renderer de
+    SDL: cada superficie se sube una sola vez como textura y se reutiliza
+    mientras exista (las subsuperficies, como las franjas del fondo, usan la
+    textura de su superficie raíz). Así el alpha de los sprites grandes lo
+    mezcla el Renderer (la GPU si hay) en lugar de la CPU.
+
+    Lo que no pasa por la cola (escenas que redefinen draw(), transiciones,
+    barra de carga) se dibuja como siempre en `surface` y se sube entera con
+    `present`. Las superficies no deben modificarse después de dibujarlas:
+    si se reutiliza una, hay que llamar a `invalidate`.
+
+    Con driver='software' usa el Renderer por software de SDL (sirve en
+    máquinas sin GPU); con None, el que elija SDL.
+    """
+    partial_updates = False  # cada frame se presenta completo
+    textured = True
+
+    def __init__(self, caption, window_size, size, driver=None):
+        # La ventana de pygame.display queda oculta: solo hace falta para
+        # convert()/convert_alpha(). La del juego es la del Renderer.
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = Window(caption, size=window_size)
+        try:
+            self.renderer = Renderer(self.window, index=self._driver_index(driver))
+        except (pygame.error, RuntimeError):
+            self.window.destroy()
+            raise
+
+        self.size = (int(size[0]), int(size[1]))
+        self.view = pygame.Rect((0, 0), self.size)
+        if self.size != tuple(window_size):
+            # El Renderer agranda el frame a la ventana y convierte el mouse solo
+            self.renderer.logical_size = self.size
+
+        self.surface = pygame.Surface(self.size).convert()
+        self.frame_texture = Texture(self.renderer, self.size, streaming=True)
+        self.scratch = pygame.Surface(self.size, pygame.SRCALPHA)
+        self.textures = {}  # id(superficie raíz) -> Texture
+        self._finalizers = {}  # id(superficie raíz) -> weakref.finalize (uno por superficie)
+
+        # Estadísticas del último frame dibujado con present_queue
+        self.drawn = 0
+        self.culled = 0
+        self.uploads = 0
+
+    @staticmethod
+    def _driver_index(driver):
+        if driver is None:
+            return -1
+        names = [info.name for info in get_drivers()]
+        if driver not in names:
+            raise pygame.error(f"no existe el renderer '{driver}' (disponibles: {', '.join(names)})")
+        return names.index(driver)
+
+    # ------------------------------------------------------------
+    # TEXTURAS
+    # ------------------------------------------------------------
+    def texture_for(self, surface):
+        """(textura, desplazamiento) de `surface`. La textura se crea la primera vez."""
+        root = surface.get_abs_parent()
+        key = id(root)
+        texture = self.textures.get(key)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, root)
+            self.textures[key] = texture
+            # Al liberarse la superficie se libera su textura. Se registra una sola vez
+            # por superficie: al invalidarla (mark_changed) solo se cambia la textura
+            if key not in self._finalizers:
+                self._finalizers[key] = weakref.finalize(root, self._forget, key)
+            self.uploads += 1
+        return texture, surface.get_abs_offset()
+
+    def invalidate(self, surface):
+        """Descarta la textura de `surface` (se volvió a dibujar sobre ella)."""
+        self.textures.pop(id(surface.get_abs_parent()), None)
+
+    def _forget(self, key):
+        self.textures.pop(key, None)
+        self._finalizers.pop(key, None)
+
+    # ------------------------------------------------------------
+    # PRESENTACIÓN
+    # ------------------------------------------------------------
+    def present(self, rects=None):
+        """Sube `surface` entera y la muestra (`rects` se ignora: el Renderer no hace updates parciales)."""
+        self.frame_texture.update(self.surface)
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self.frame_texture.draw()
+        self.renderer.present()
+
+    def present_queue(self, queue):
+        """Dibuja lo encolado en `queue` con texturas, en orden de capa, y lo muestra."""
+        renderer = self.renderer
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+
+        view = self.view
+        drawn = culled = 0
+        self.uploads = 0
+        for surface in queue.take_changed():
+            self.invalidate(surface)
+        for surface, dest, area in queue.take():
+            if surface is None:
+                if area is not None and not view.colliderect(area):
+                    culled += 1
+                    continue
+                self._draw_callback(dest, area)
+                drawn += 1
+                continue
+
+            if area is None:
+                w, h = surface.get_size()
+                sx = sy = 0
+            else:
+                sx, sy, w, h = area
+            rect = pygame.Rect(dest[0], dest[1], w, h)
+            if not view.colliderect(rect):
+                culled += 1
+                continue
+
+            texture, (ox, oy) = self.texture_for(surface)
+            alpha = surface.get_alpha()
+            texture.alpha = 255 if alpha is None else alpha
+            texture.draw(srcrect=(ox + sx, oy + sy, w, h), dstrect=rect)
+            drawn += 1
+
+        renderer.present()
+        self.drawn, self.culled = drawn, culled
+
+    def _draw_callback(self, draw, rect=None):
+        """
+        Lo que no es un blit (pygame.draw...) se dibuja en una superficie auxiliar
+        y se sube solo la zona `rect` (sin `rect` se busca lo dibujado, más lento).
+        """
+        if rect is not None:
+            bounds = pygame.Rect(rect).clip(self.view)
+            self.scratch.fill((0, 0, 0, 0), bounds)
+            draw(self.scratch)
+        else:
+            self.scratch.fill((0, 0, 0, 0))
+            draw(self.scratch)
+            bounds = self.scratch.get_bounding_rect()
+        if bounds.width and bounds.height:
+            texture = Texture.from_surface(self.renderer, self.scratch.subsurface(bounds))
+            texture.draw(dstrect=bounds)
+            self.uploads += 1
+
+    def map_event(self, event):
+        """SDL ya entrega el mouse en coordenadas del frame (logical_size)."""
+        return event
@@ -0,0 +1,132 @@
+# engine/transitions.py
+
+import pygame
+
+EFFECTS = ('fade', 'crossfade', 'wipe')
+
+
+class TransitionCompositor:
+    """
+    Dibuja las transiciones entre escenas a partir de dos capturas fijas.
+
+    Al empezar la transición se dibuja la escena saliente una sola vez en
+    `outgoing`; al activar la entrante se dibuja una vez en `incoming`. Mientras
+    dura el efecto solo se combinan esas capturas con `overlay` (negro), así que
+    cada frame cuesta uno o dos blits sin importar qué tan pesada sea la escena.
+    Las tres superficies se crean una sola vez y se reutilizan.
+
+    Efectos:
+    - fade:      la saliente se oscurece a negro y la entrante aparece desde negro.
+    - crossfade: la saliente se funde directamente sobre la entrante.
+    - wipe:      una cortina negra cubre la saliente de izquierda a derecha y
+                 luego descubre la entrante en el mismo sentido.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.outgoing = pygame.Surface(size).convert()
+        self.incoming = pygame.Surface(size).convert()
+        self.overlay = pygame.Surface(size).convert()
+        self.overlay.fill((0, 0, 0))
+
+        self.effect = 'fade'
+        self.duration = 1.0
+        self.phase = None   # 'out' (tapando la saliente), 'in' (mostrando la entrante) o None
+        self.elapsed = 0.0
+
+    @property
+    def active(self):
+        return self.phase is not None
+
+    @property
+    def covered(self):
+        """
+        True si la saliente ya quedó tapada del todo por negro (fase de salida
+        terminada). Con crossfade nunca pasa: la saliente queda a la vista hasta
+        fundirse con la entrante, así que encima no se puede dibujar nada.
+        """
+        if self.effect == 'crossfade':
+            return False
+        return self.phase == 'out' and self.elapsed >= self._phase_duration()
+
+    def _phase_duration(self):
+        if self.effect == 'crossfade':
+            # No hay nada que tapar: todo el tiempo es la fusión de las dos capturas
+            return 0.0 if self.phase == 'out' else self.duration
+        return self.duration / 2
+
+    def _progress(self):
+        duration = self._phase_duration()
+        if duration <= 0:
+            return 1.0
+        return min(1.0, self.elapsed / duration)
+
+    # ------------------------------------------------------------
+    # CICLO DE LA TRANSICIÓN
+    # ------------------------------------------------------------
+    def begin(self, scene, effect, duration):
+        """Captura la escena saliente y empieza la fase de salida."""
+        if effect not in EFFECTS:
+            print(f"⚠ Transición desconocida '{effect}'. Usando 'fade'.")
+            effect = 'fade'
+        self.effect = effect
+        self.duration = max(0.0, duration)
+        self.outgoing.fill((0, 0, 0))
+        if scene is not None:
+            scene.draw(self.outgoing)
+        self.phase = 'out'
+        self.elapsed = 0.0
+
+    def capture_incoming(self, scene):
+        """Captura la escena entrante (ya activada) y empieza la fase de entrada."""
+        self.incoming.fill((0, 0, 0))
+        if scene is not None:
+            scene.draw(self.incoming)
+        self.phase = 'in'
+        self.elapsed = 0.0
+
+    def advance(self, dt):
+        """Avanza la fase actual. Devuelve True cuando terminó."""
+        if self.phase is None:
+            return True
+        self.elapsed += dt
+        if self.elapsed < self._phase_duration():
+            return False
+        if self.phase == 'in':
+            self.phase = None
+        return True
+
+    # ------------------------------------------------------------
+    # DIBUJO (uno o dos blits por frame)
+    # ------------------------------------------------------------
+    def draw(self, screen):
+        if self.phase is None:
+            return
+        t = self._progress()
+        w, h = self.size
+
+        if self.effect == 'crossfade':
+            if self.phase == 'out':
+                screen.blit(self.outgoing, (0, 0))
+                return
+            screen.blit(self.incoming, (0, 0))
+            self.outgoing.set_alpha(int(255 * (1 - t)))
+            screen.blit(self.outgoing, (0, 0))
+            self.outgoing.set_alpha(None)
+
+        elif self.effect == 'wipe':
+            if self.phase == 'out':
+                screen.blit(self.outgoing, (0, 0))
+                screen.blit(self.overlay, (0, 0), (0, 0, int(w * t), h))
+            else:
+                edge = int(w * t)
+                screen.blit(self.incoming, (0, 0))
+                screen.blit(self.overlay, (edge, 0), (edge, 0, w - edge, h))
+
+        else:  # fade
+            if self.phase == 'out':
+                screen.blit(self.outgoing, (0, 0))
+                self.overlay.set_alpha(int(255 * t))
+            else:
+                screen.blit(self.incoming, (0, 0))
+                self.overlay.set_alpha(int(255 * (1 - t)))
+            screen.blit(self.overlay, (0, 0))
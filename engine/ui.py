@@ -1,4 +1,6 @@
 import pygame
+from engine.render_queue import LAYER_UI
+from settings import text_cache, fonts
 
 class Button:
     def __init__(self, image=None, pos=None, callback=None,
@@ -11,6 +13,9 @@ class Button:
 
         2) Botón rectangular con texto:
             Button(rect=(x,y,w,h), text="Play", font=font, callback=fn)
+
+        `font` puede ser una pygame.font.Font o una especificación para el
+        registro de fuentes: (cara, tamaño[, estilo]) o solo el tamaño.
         """
 
         self.callback = callback
@@ -26,14 +31,17 @@ class Button:
         elif rect is not None and text is not None and font is not None:
             self.mode = "text"
             self.rect = pygame.Rect(rect)
-            self.text = text
-            self.font = font
-            # Renderizar el texto (fuera de update/draw)
-            self.text_surface = self.font.render(self.text, True, (20, 20, 20))
+            self.font = fonts.resolve(font)
+            self.set_text(text)
 
         else:
             raise ValueError("Button mal creado. Faltan argumentos.")
 
+    def set_text(self, text):
+        """Cambia el texto del botón (la superficie sale del caché de textos)."""
+        self.text = text
+        self.text_surface = text_cache.render(self.font, text, (20, 20, 20))
+
     # -------------------------
     # UPDATE (vacío por seguridad)
     # -------------------------
@@ -62,6 +70,19 @@ class Button:
             txt_rect = self.text_surface.get_rect(center=self.rect.center)
             surf.blit(self.text_surface, txt_rect)
 
+    def render(self, queue, layer=LAYER_UI):
+        """Igual que draw, pero encolado en una RenderQueue (ver engine/render_queue.py)."""
+        if self.mode == "image":
+            queue.submit(self.image, self.rect.topleft, layer)
+
+        elif self.mode == "text":
+            color = (200, 200, 200) if self.hover else (220, 220, 220)
+            rect = self.rect.copy()
+            queue.submit_draw(lambda surf: pygame.draw.rect(surf, color, rect, border_radius=8), layer, rect)
+
+            txt_rect = self.text_surface.get_rect(center=self.rect.center)
+            queue.submit(self.text_surface, txt_rect.topleft, layer)
+
     # -------------------------
     # EVENTOS (DEJANDO LA LLAMADA A CALLBACK A LA ESCENA)
     # -------------------------
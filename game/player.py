@@ -1,30 +1,83 @@
 import pygame
 import os
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image, get_asset_path
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image, get_asset_path, PLAYER_COMPOSITE_CACHE_BUDGET, px
+from engine.image_cache import ImageCache
+from engine.render_queue import LAYER_WORLD
 
 # Altura base del personaje, crucial para calcular posiciones
-CHARACTER_HEIGHT = 200 
+CHARACTER_HEIGHT = px(200)
+
+def _part_manifest(subfolder, scale_height):
+    """Todas las imágenes de una carpeta de partes, a la altura con la que se dibujan."""
+    folder = get_asset_path(subfolder)
+    if not os.path.isdir(folder):
+        return []
+    return [(subfolder, name, scale_height) for name in sorted(os.listdir(folder)) if name.endswith('.png')]
+
+# Partes por defecto: las usan varias escenas como respaldo, así que quedan
+# siempre en memoria (ver engine/asset_manager.py)
+DEFAULT_BODY = 'cat body.png'
+DEFAULT_HEAD = 'cat head.png'
+SHARED_ASSET_MANIFEST = [
+    ("bodies", DEFAULT_BODY, CHARACTER_HEIGHT),
+    ("heads", DEFAULT_HEAD, CHARACTER_HEIGHT // 2),
+]
+
+# Partes del personaje a los tamaños que usa _load_parts (ver `python main.py bake`)
+ASSET_MANIFEST = (
+    _part_manifest("bodies", CHARACTER_HEIGHT)
+    + _part_manifest("clothes", CHARACTER_HEIGHT)
+    + _part_manifest("heads", CHARACTER_HEIGHT // 2)
+    + _part_manifest("hats", CHARACTER_HEIGHT // 3)
+)
+
+# Imágenes compuestas por outfit, compartidas por todos los Player de todas las escenas.
+# Clave: (body, head, hat, clothes, altura)
+composite_cache = ImageCache(PLAYER_COMPOSITE_CACHE_BUDGET)
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, body, head, hat=None):
+    def __init__(self, body, head, hat=None, clothes=None):
         super().__init__()
         
         # Assets actuales
         self.body_asset = body 
         self.head_asset = head 
         self.hat_asset = hat 
+        self.clothes_asset = clothes
         
         self.x = 0
         self.y = 0 
         
         # Diccionario para guardar las imágenes cargadas
         self.parts = {}
-        self._load_parts()
         
         # Imagen compuesta inicial y su rectángulo
-        self.image = self._create_composite_image()
+        self.outfit_key = None
+        self._refresh_image()
         self.rect = self.image.get_rect()
 
+    def _get_outfit_key(self):
+        return (self.body_asset, self.head_asset, self.hat_asset, self.clothes_asset, CHARACTER_HEIGHT)
+
+    def _refresh_image(self):
+        """
+        Actualiza self.image solo si el outfit cambió desde la última vez.
+        La imagen compuesta sale de `composite_cache` si algún Player ya la armó.
+        Devuelve True si la imagen cambió.
+        """
+        key = self._get_outfit_key()
+        if key == self.outfit_key:
+            return False
+
+        image = composite_cache.get(key)
+        if image is None:
+            self._load_parts()
+            image = composite_cache.put(key, self._create_composite_image())
+
+        self.outfit_key = key
+        self.image = image
+        return True
+
     def _load_parts(self):
         """Carga y reescala las imágenes de las partes del cuerpo y la ropa."""
         # Lógica de carga para el cuerpo (busca en 'clothes' si es una prenda, o 'bodies' si es base)
@@ -42,12 +95,18 @@ class Player(pygame.sprite.Sprite):
         else:
             self.parts['hat'] = None
 
+        # Carga de la ropa (si existe), se dibuja sobre el cuerpo
+        if self.clothes_asset:
+            self.parts['clothes'] = load_image("clothes", self.clothes_asset, scale_height=CHARACTER_HEIGHT)
+        else:
+            self.parts['clothes'] = None
+
     def _create_composite_image(self):
         """Combina las partes cargadas en una sola superficie para dibujar."""
         body_img = self.parts.get('body')
         if not body_img:
             # Fallback en caso de error de carga
-            return pygame.Surface((100, CHARACTER_HEIGHT))
+            return pygame.Surface((px(100), CHARACTER_HEIGHT))
 
         width = body_img.get_width()
         height = body_img.get_height()
@@ -57,6 +116,11 @@ class Player(pygame.sprite.Sprite):
         # Dibujar Body
         body_rect = body_img.get_rect(midbottom=(width // 2, height))
         composite.blit(body_img, body_rect)
+
+        # Dibujar Clothes (mismo lienzo que el cuerpo)
+        clothes_img = self.parts.get('clothes')
+        if clothes_img:
+            composite.blit(clothes_img, clothes_img.get_rect(midbottom=(width // 2, height)))
         
         # Dibujar Head
         head_img = self.parts.get('head')
@@ -72,13 +136,35 @@ class Player(pygame.sprite.Sprite):
 
         return composite
 
+    def set_outfit(self, body, head, hat=None, clothes=None):
+        """Cambia las partes del personaje; la imagen se recompone solo si el outfit cambió."""
+        self.body_asset = body
+        self.head_asset = head
+        self.hat_asset = hat
+        self.clothes_asset = clothes
+        if self._refresh_image():
+            self.rect = self.image.get_rect(midbottom=self.rect.midbottom)
+
     def update(self, dt):
         """Actualiza el estado (y las partes si han cambiado)."""
-        # Verificamos si los assets externos han cambiado y regeneramos la imagen si es necesario
-        self._load_parts() 
-        self.image = self._create_composite_image()
+        # Solo se recompone si alguno de los assets cambió (ver composite_cache)
+        self._refresh_image()
         
-    def draw(self, screen):
-        """Dibuja el jugador en la pantalla."""
+    def draw(self, screen, camera=None):
+        """
+        Dibuja el jugador en la pantalla. Con `camera`, (x, y) son coordenadas
+        del mundo y no se dibuja si queda fuera de la vista.
+        """
+        self.rect.midbottom = (int(self.x), int(self.y))
+        if camera is None:
+            screen.blit(self.image, self.rect)
+        else:
+            camera.blit(screen, self.image, self.rect)
+
+    def render(self, queue, camera=None, layer=LAYER_WORLD):
+        """Igual que draw, pero encolado en una RenderQueue (ver engine/render_queue.py)."""
         self.rect.midbottom = (int(self.x), int(self.y))
-        screen.blit(self.image, self.rect)
\ No newline at end of file
+        if camera is None:
+            queue.submit(self.image, self.rect.topleft, layer)
+        elif camera.is_visible(self.rect):
+            queue.submit(self.image, camera.apply(self.rect).topleft, layer)
\ No newline at end of file
@@ -3,8 +3,53 @@
 import json
 import os
 
+# Partes del outfit que se pueden cambiar con set_outfit_part
+OUTFIT_PARTS = ('body', 'head', 'hat', 'clothes')
+OUTFIT_FIELDS = tuple('outfit_' + part for part in OUTFIT_PARTS)
+
+
 class GameState:
+    """
+    Estado de la partida, observable por campo.
+
+    Cualquier asignación a un campo público (`state.has_backpack = True`) que
+    cambie su valor queda registrada como pendiente e incrementa `version`.
+    Las notificaciones se envían en lote con `flush()`, que el Game llama una
+    vez por frame: cada suscriptor recibe un dict {campo: (anterior, nuevo)}
+    con los campos que le interesan. Si un campo vuelve a su valor original
+    dentro del mismo frame, no se notifica.
+
+    Los atributos que empiezan con "_" son internos y no se guardan.
+    """
     def __init__(self):
+        object.__setattr__(self, '_listeners', [])  # lista de (campos o None, callback)
+        object.__setattr__(self, '_pending', {})    # campo -> valor antes del primer cambio del frame
+        object.__setattr__(self, '_version', 0)
+        self.reset()
+        self._pending.clear()
+
+    def __setattr__(self, name, value):
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+            return
+
+        missing = object()
+        old = self.__dict__.get(name, missing)
+        if old is not missing and old == value and type(old) is type(value):
+            return
+
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_version', self._version + 1)
+        if name not in self._pending:
+            self._pending[name] = None if old is missing else old
+
+    @property
+    def version(self):
+        """Contador que aumenta con cada cambio; sirve como clave de caché."""
+        return self._version
+
+    def reset(self):
+        """Vuelve todos los campos a sus valores iniciales (los suscriptores se mantienen)."""
         # ==================================
         # 1. ESTADO DEL PERSONAJE Y VESTUARIO
         # ==================================
@@ -30,9 +75,66 @@ class GameState:
         self.has_pan_dulce = False
         self.has_sidra = False
         self.has_backpack = False
+
+        # Carta de WRITE_LETTER y los stickers que se le pegaron
+        self.letter = ""
+        self.letter_stickers = []
         
         # ... (Resto del estado) ...
 
+    # ==================================
+    # SUSCRIPCIONES
+    # ==================================
+    def subscribe(self, callback, fields=None):
+        """
+        Registra `callback(changed)` para los campos indicados (None = todos).
+        `changed` es un dict {campo: (valor_anterior, valor_nuevo)}.
+        """
+        if isinstance(fields, str):
+            fields = (fields,)
+        self._listeners.append((frozenset(fields) if fields is not None else None, callback))
+
+    def unsubscribe(self, callback):
+        """Quita todas las suscripciones de `callback`."""
+        self._listeners[:] = [(f, cb) for f, cb in self._listeners if cb != callback]
+
+    def flush(self):
+        """
+        Notifica los cambios acumulados desde el último flush.
+        Devuelve el dict de cambios enviados (vacío si no hubo ninguno).
+        """
+        if not self._pending:
+            return {}
+
+        changed = {}
+        for name, old in self._pending.items():
+            new = getattr(self, name, None)
+            if old != new or type(old) is not type(new):
+                changed[name] = (old, new)
+        self._pending.clear()
+
+        if not changed:
+            return changed
+
+        for fields, callback in list(self._listeners):
+            if fields is None:
+                callback(changed)
+                continue
+            relevant = {name: change for name, change in changed.items() if name in fields}
+            if relevant:
+                callback(relevant)
+        return changed
+
+    # ==================================
+    # VESTUARIO
+    # ==================================
+    def set_outfit_part(self, part, asset_name):
+        """Cambia una parte del outfit ('body', 'head', 'hat' o 'clothes')."""
+        if part not in OUTFIT_PARTS:
+            print(f"⚠ Parte de outfit desconocida: {part}")
+            return
+        setattr(self, 'outfit_' + part, asset_name)
+
     def get_outfit_assets(self):
         """Devuelve los assets que el Player debe dibujar."""
         return {
@@ -44,7 +146,7 @@ class GameState:
     
     # --- Funciones de guardado y carga (save/load se mantienen) ---
     def save(self, filename="savegame.json"):
-        data = self.__dict__.copy()
+        data = {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
         try:
             with open(filename, 'w') as f:
                 json.dump(data, f, indent=4)
@@ -60,8 +162,11 @@ class GameState:
             with open(filename, 'r') as f:
                 data = json.load(f)
             
-            self.__dict__.update(data)
+            # Se asigna campo por campo para que los suscriptores se enteren
+            for name, value in data.items():
+                if not name.startswith('_'):
+                    setattr(self, name, value)
             print("✅ Progreso cargado con éxito.")
         except Exception as e:
             print(f"❌ Error al cargar el juego: {e}")
-            self.__init__()
\ No newline at end of file
+            self.reset()
\ No newline at end of file
@@ -1,36 +1,32 @@
 import pygame
 import importlib
 import os # Importar el módulo os para manejar rutas de archivos
+import sys
+import time
 
 # Importaciones necesarias
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, CAPTION, FPS
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_SIZE, WINDOW_SIZE, CAPTION, FPS, px, ASSETS_PATH, BAKED_PATH, SCENE_POOL_SIZE, PREFETCH_ENABLED
+from settings import SCENE_LOAD_BUDGET_MS, DIRTY_RECTS_ENABLED
+from settings import IDLE_PACING_ENABLED, IDLE_WAIT_TIMEOUT_MS, FRAME_STATS_REPORT
+from settings import TRANSITION_EFFECT, TRANSITION_DURATION
+from settings import RENDER_BACKEND, TEXTURE_RENDERER_DRIVER
+from settings import NARRATIVE_SCRIPT_PATH, NARRATIVE_COMPILED_PATH
+from settings import image_cache, transform_cache, decode_asset, load_asset, fonts, FONT_PRELOAD
 from game.state import GameState
-
-# ======================================================
-# CLASE BASE DE ESCENA (Fundamental para el Game Manager)
-# ======================================================
-
-class Scene:
-    """Clase base para todas las escenas del juego."""
-    def __init__(self, game):
-        self.game = game
-        self.next_scene = None # Usado para solicitar un cambio de escena
-
-    def handle_input(self, event): 
-        """Maneja los eventos (mouse, teclado)."""
-        pass
-        
-    def update(self, dt): 
-        """Actualiza la lógica del juego (movimiento, colisiones)."""
-        pass
-        
-    def draw(self, screen): 
-        """Dibuja todos los elementos en la pantalla."""
-        pass
-    
-    def change_scene(self, next_scene_key):
-        """Método llamado por las escenas para iniciar una transición."""
-        self.next_scene = next_scene_key
+from game.player import SHARED_ASSET_MANIFEST
+from engine.bake import bake_assets
+from engine.narrative import compile_file
+from engine.scene_pool import ScenePool
+from engine.prefetch import Prefetcher
+from engine.scene_loader import SceneLoader
+from engine.asset_manager import AssetManager
+from engine.frame_stats import FrameStats
+from engine.transitions import TransitionCompositor
+from engine.framebuffer import Framebuffer
+from engine.texture_backend import TextureBackend
+# Clase base de las escenas: el ciclo de vida (load_steps, on_enter/on_exit,
+# render, transiciones...) se define solo en engine/scene_manager.py
+from engine.scene_manager import Scene
 
 # Mapeo de CLAVES (UPPERCASE) a la RUTA DEL MÓDULO (para importlib)
 # Se asume que la función load_scene construirá el nombre de la clase (ej: TitleScene)
@@ -58,27 +54,61 @@ class Game:
         pygame.mixer.init() 
         print(f"Mezclador de audio inicializado. Frecuencia: {pygame.mixer.get_init()[0]}Hz, Canales: {pygame.mixer.get_init()[2]}")
         
-        # Usamos SCREEN_WIDTH/HEIGHT
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(CAPTION)
+        # La ventana tiene el tamaño de diseño; las escenas dibujan en el framebuffer
+        # (SCREEN_WIDTH/HEIGHT), más chico si RENDER_SCALE < 1. El backend lo presenta
+        # con blits (engine/framebuffer.py) o con texturas (engine/texture_backend.py)
+        self.backend = self._create_backend()
+        self.window = self.backend.window
+        self.screen = self.backend.surface
         self.clock = pygame.time.Clock()
         self.running = True
         
         self.state = GameState()
+
+        # Fuentes de la interfaz: se cargan una vez y las comparten todas las escenas (engine/fonts.py)
+        fonts.preload(FONT_PRELOAD)
         
         # --- PROPIEDADES DE TRANSICIÓN Y CLICK RESTAURADAS ---
         self.can_click = True           # Evita interacciones mientras la transición está activa
-        self.transition_alpha = 0       # Opacidad del fundido (0=transparente, 255=negro total)
-        self.transition_speed = 350     # Velocidad de la transición (píxeles de alpha / segundo)
+        self.transitions = TransitionCompositor((SCREEN_WIDTH, SCREEN_HEIGHT)) # Efecto entre escenas (ver engine/transitions.py)
         self.is_transitioning = False   
         self.transition_target_scene = None 
+        self.scene_loader = None        # Carga por pasos de la escena entrante (ver engine/scene_loader.py)
+        self.scene_load_error = None
         self._current_music_file = None # Rastrea el archivo de música actual
+        self.full_redraw_pending = True # La pantalla no refleja solo la escena (p. ej. quedó el fundido)
+        self.frame_stats = FrameStats() # Histogramas de tiempo por frame (activo / en espera)
+
+        # Tiempo de vida de los assets por escena (conteo de referencias sobre ASSET_MANIFEST)
+        self.asset_manager = AssetManager(image_cache, transform_cache, load_asset)
+        self.asset_manager.acquire('SHARED', SHARED_ASSET_MANIFEST, preload=True)
 
+        # Escenas suspendidas (keep_alive) para no reconstruirlas en cada transición
+        self.scene_pool = ScenePool(SCENE_POOL_SIZE, on_evict=self._on_scene_evicted)
+        self.current_scene_key = None
+        self.current_scene = None
+
+        # Precarga en segundo plano de las escenas siguientes (next_scenes)
+        self.prefetcher = Prefetcher(image_cache, decode_asset, self._scene_manifest) if PREFETCH_ENABLED else None
         
         # Inicialización de la primera escena
-        self.current_scene = self.load_scene('TITLE')
+        self._switch_scene('TITLE')
         self._play_music('TITLE') # <--- Inicia la música de la primera escena
+        self._prefetch_next_scenes()
+
 
+    def _create_backend(self):
+        """Crea la ventana y el backend de dibujo según RENDER_BACKEND."""
+        if RENDER_BACKEND == 'texture':
+            try:
+                return TextureBackend(CAPTION, WINDOW_SIZE, SCREEN_SIZE, TEXTURE_RENDERER_DRIVER)
+            except (pygame.error, RuntimeError) as e:
+                print(f"⚠ No se pudo crear el backend de texturas ({e}). Usando superficies.")
+        elif RENDER_BACKEND != 'surface':
+            print(f"⚠ Backend de dibujo desconocido '{RENDER_BACKEND}'. Usando superficies.")
+        window = pygame.display.set_mode(WINDOW_SIZE)
+        pygame.display.set_caption(CAPTION)
+        return Framebuffer(window, SCREEN_SIZE)
 
     def _play_music(self, scene_key):
         """Carga y reproduce la música de fondo apropiada para la escena."""
@@ -147,20 +177,133 @@ class Game:
         print(f"Cargando escena: {class_name} desde {module_path}")
         return SceneClass(self)
 
+    def _scene_manifest(self, scene_key):
+        """ASSET_MANIFEST del módulo de una escena (lista vacía si no declara uno)."""
+        module = importlib.import_module(SCENE_MAP[scene_key])
+        return getattr(module, 'ASSET_MANIFEST', [])
+
+    def _prefetch_next_scenes(self):
+        """Pide precargar las escenas vecinas de la actual que no estén ya en el pool."""
+        if not self.prefetcher or not self.current_scene:
+            return
+        keys = [k for k in self.current_scene.next_scenes
+                if k in SCENE_MAP and k not in self.scene_pool.scenes]
+        self.prefetcher.prefetch(keys)
+
+    def _begin_scene_load(self, scene_key):
+        """
+        Prepara la escena entrante: la reutiliza desde el pool si estaba guardada
+        (ya está cargada) o la construye y devuelve un SceneLoader con sus load_steps.
+        """
+        scene = self.scene_pool.resume(scene_key)
+        if scene is not None:
+            print(f"Reanudando escena: {scene_key}")
+            return SceneLoader(scene)
+        scene = self.load_scene(scene_key)
+        return SceneLoader(scene, scene.load_steps())
+
+    def _activate_scene(self, scene_key, scene):
+        """
+        Suspende (o descarta) la escena saliente y pone `scene` como la actual.
+        Los assets de la saliente se liberan salvo que quede guardada en el pool.
+        """
+        # Primero se toman los assets de la entrante: los que comparte con la
+        # saliente no llegan a quedar sin dueño (ni se sacan del caché)
+        self.asset_manager.acquire(scene_key, self._scene_manifest(scene_key))
+
+        if self.current_scene:
+            self.current_scene.on_exit()
+            old_key = self.current_scene_key
+            if not self.scene_pool.suspend(old_key, self.current_scene) and old_key != scene_key:
+                self.asset_manager.release(old_key)
+
+        self.current_scene = scene
+        self.current_scene_key = scene_key
+        scene.on_enter()
+        scene.mark_dirty()
+
+        total, exclusive = self.asset_manager.footprint(scene_key)
+        print(f"Assets de {scene_key}: {total / (1024 * 1024):.1f} MB "
+              f"({exclusive / (1024 * 1024):.1f} MB exclusivos)")
+
+    def _on_scene_evicted(self, scene_key, scene):
+        """El pool descartó una escena suspendida: ya se pueden liberar sus assets."""
+        if scene_key != self.current_scene_key:
+            self.asset_manager.release(scene_key)
+
+    def _switch_scene(self, scene_key):
+        """Cambio inmediato de escena (arranque y errores): carga todo de una vez."""
+        loader = self._begin_scene_load(scene_key)
+        loader.finish()
+        self._activate_scene(scene_key, loader.scene)
+
+    def _advance_scene_load(self):
+        """Avanza la carga de la escena entrante dentro del presupuesto del frame."""
+        if self.scene_loader is None or self.scene_loader.done:
+            return
+        try:
+            self.scene_loader.advance(SCENE_LOAD_BUDGET_MS / 1000.0)
+        except Exception as e:
+            self.scene_loader = None
+            self.scene_load_error = e
+
+    def _draw_loading_progress(self):
+        """Barra de progreso sobre el negro, solo si la carga dura más que el fundido."""
+        bar_width = SCREEN_WIDTH // 3
+        bar = pygame.Rect(0, 0, bar_width, px(8))
+        bar.center = (SCREEN_WIDTH // 2, int(SCREEN_HEIGHT * 0.9))
+        pygame.draw.rect(self.screen, (60, 60, 60), bar, border_radius=px(4))
+        filled = bar.copy()
+        filled.width = int(bar_width * self.scene_loader.progress)
+        if filled.width > 0:
+            pygame.draw.rect(self.screen, (230, 230, 230), filled, border_radius=px(4))
+
+    def _begin_transition(self, next_scene_key):
+        """Empieza la transición: arranca la carga de la escena entrante y captura la saliente."""
+        self.is_transitioning = True
+        self.transition_target_scene = next_scene_key
+        self.current_scene.next_scene = None
+        if self.prefetcher:
+            pooled = next_scene_key in self.scene_pool.scenes
+            self.prefetcher.on_transition(next_scene_key, count=not pooled)
+        self.can_click = False # Desactiva el click inmediatamente al inicio
+
+        # Se empieza a preparar la escena entrante ya mismo (se carga durante el fundido)
+        try:
+            self.scene_loader = self._begin_scene_load(next_scene_key)
+        except Exception as e:
+            self.scene_loader = None
+            self.scene_load_error = e
+
+        # El efecto lo elige la escena entrante (si no, el de settings)
+        incoming = self.scene_loader.scene if self.scene_loader is not None else None
+        effect = getattr(incoming, 'transition', None) or TRANSITION_EFFECT
+        duration = getattr(incoming, 'transition_duration', None)
+        if duration is None:
+            duration = TRANSITION_DURATION
+        self.transitions.begin(self.current_scene, effect, duration)
+
     def _handle_transition(self, dt):
-        """Maneja el efecto de transición (Fade-to-Black/Fade-In)."""
+        """Avanza la transición: fase de salida (y carga), cambio de escena, fase de entrada."""
         if self.is_transitioning:
             
-            # Fase 1: FADE-OUT (Oscureciendo la pantalla)
+            # Fase 1: SALIDA (tapando la escena saliente)
             if self.transition_target_scene:
-                self.transition_alpha += self.transition_speed * dt
-                if self.transition_alpha >= 255:
-                    self.transition_alpha = 255
+                # La escena entrante se va cargando por pasos mientras se oscurece
+                self._advance_scene_load()
+
+                if self.transitions.advance(dt):
+
+                    # Si la carga dura más que el fundido, se espera tapado
+                    if self.scene_loader is not None and not self.scene_loader.done:
+                        return
                     
-                    # Carga la nueva escena A MITAD de la transición (pantalla negra total)
+                    # Activa la nueva escena A MITAD de la transición (saliente ya tapada)
                     try:
                         new_scene_key = self.transition_target_scene
-                        self.current_scene = self.load_scene(new_scene_key)
+                        if self.scene_loader is None:
+                            raise self.scene_load_error or RuntimeError("la escena no se pudo preparar")
+                        self._activate_scene(new_scene_key, self.scene_loader.scene)
                         
                         # === CAMBIAR MÚSICA TRAS LA CARGA DE ESCENA ===
                         self._play_music(new_scene_key) 
@@ -168,29 +311,95 @@ class Game:
 
                     except Exception as e:
                         print(f"Error CRÍTICO al cargar la escena {self.transition_target_scene}: {e}. Volviendo a TITLE.")
-                        self.current_scene = self.load_scene('TITLE') 
+                        self._switch_scene('TITLE')
                         self._play_music('TITLE')
                         
-                    self.transition_target_scene = None # Prepara para Fade-In
+                    self.scene_loader = None
+                    self.scene_load_error = None
+                    self.transition_target_scene = None # Prepara para la entrada
+                    self.transitions.capture_incoming(self.current_scene)
             
-            # Fase 2: FADE-IN (Aclarando la pantalla)
+            # Fase 2: ENTRADA (mostrando la escena nueva)
             else:
-                self.transition_alpha -= self.transition_speed * dt
-                if self.transition_alpha <= 0:
-                    self.transition_alpha = 0
+                if self.transitions.advance(dt):
                     self.is_transitioning = False
                     # Re-habilitamos el click una vez finalizada la transición
                     self.can_click = True
+                    # La escena nueva ya está en pantalla: precargar sus vecinas
+                    self._prefetch_next_scenes()
+
+
+    # ===========================
+    # RECTÁNGULOS SUCIOS
+    # ===========================
+    def _can_draw_dirty(self):
+        """True si este frame se puede dibujar por zonas (sin transición ni fundido en pantalla)."""
+        return (DIRTY_RECTS_ENABLED
+                and self.backend.partial_updates
+                and self.current_scene is not None
+                and self.current_scene.dirty_rects
+                and not self.is_transitioning
+                and not self.full_redraw_pending)
+
+    def _draw_dirty_rects(self):
+        """
+        Redibuja solo las zonas marcadas por la escena y las envía con display.update.
+        Devuelve False si hace falta un frame completo (la escena marcó toda la pantalla).
+        """
+        rects = self.current_scene.dirty.take()
+        if rects is None:
+            return False
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.current_scene.draw(self.screen)
+        self.screen.set_clip(None)
+        self.backend.present(rects)
+        return True
+
+    # ===========================
+    # RITMO DE FRAMES
+    # ===========================
+    def _is_idle(self):
+        """True si no hay nada que animar: la escena está quieta y no hay transición ni carga."""
+        return (IDLE_PACING_ENABLED
+                and self.current_scene is not None
+                and not self.is_transitioning
+                and self.scene_loader is None
+                and not self.full_redraw_pending
+                and self.current_scene.is_idle())
 
+    def _wait_for_events(self):
+        """Duerme hasta que llegue un evento (o venza IDLE_WAIT_TIMEOUT_MS) y devuelve los eventos."""
+        event = pygame.event.wait(IDLE_WAIT_TIMEOUT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
 
     def run(self):
+        frame_start = time.perf_counter()
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0 # Tiempo en segundos
+            mode = "idle" if self._is_idle() else "active"
+            if mode == "idle":
+                events = self._wait_for_events()
+                self.clock.tick()
+                # El tiempo dormido no cuenta como tiempo de animación
+                dt = 1.0 / FPS
+            else:
+                dt = self.clock.tick(FPS) / 1000.0 # Tiempo en segundos
+                events = pygame.event.get()
+            work_start = time.perf_counter()
+            interval = work_start - frame_start
+            frame_start = work_start
             
             # Manejar eventos
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in events:
+                event = self.backend.map_event(event)
+                # Con el backend de texturas queda abierta la ventana oculta de pygame.display:
+                # al cerrar la del juego SDL solo manda WINDOWCLOSE (QUIT llega al cerrar la última)
+                if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                     self.running = False
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                    self.full_redraw_pending = True
                 
                 # Solo procesar input si NO hay transición activa y se permite el click
                 if not self.is_transitioning and self.can_click:
@@ -202,37 +411,82 @@ class Game:
                 if self.current_scene:
                     self.current_scene.update(dt)
 
+            # Cambios del estado de este frame: se notifican todos juntos antes de dibujar
+            self.state.flush()
+
             # 2. Comprobar si hay cambio de escena (INICIA la transición)
             if self.current_scene and self.current_scene.next_scene and not self.is_transitioning:
-                
-                next_scene_key = self.current_scene.next_scene
-                
-                self.is_transitioning = True
-                self.transition_target_scene = next_scene_key
-                self.current_scene.next_scene = None
-                self.can_click = False # Desactiva el click inmediatamente al inicio
-
-            # 3. Dibujar self.current_scene
-            self.screen.fill((0, 0, 0)) # Limpiar pantalla
-            if self.current_scene:
-                self.current_scene.draw(self.screen)
-            
+                self._begin_transition(self.current_scene.next_scene)
+
+            # 3. Dibujar self.current_scene (solo las zonas que cambiaron, si se puede)
+            if self._can_draw_dirty() and self._draw_dirty_rects():
+                self.frame_stats.add(mode, interval, time.perf_counter() - work_start)
+                continue
+
             # 4. Manejo de Transición
             self._handle_transition(dt)
+
+            if self.is_transitioning:
+                # 5. Transición: solo se combinan las capturas (la escena no se dibuja)
+                self.transitions.draw(self.screen)
+
+                # 6. Progreso de carga si la escena entrante todavía no terminó (solo sobre el negro)
+                if self.transitions.covered and self.scene_loader is not None and not self.scene_loader.done:
+                    self._draw_loading_progress()
+                self.backend.present()
+            elif self.backend.textured and self.current_scene:
+                self.current_scene.dirty.take() # se redibuja todo igual
+                self.current_scene.draw_textures(self.backend)
+            else:
+                self.screen.fill((0, 0, 0)) # Limpiar pantalla
+                if self.current_scene:
+                    self.current_scene.dirty.take() # se redibuja todo igual
+                    self.current_scene.draw(self.screen)
+                self.backend.present()
+
+            # Con la transición en pantalla, el próximo frame parcial no alcanzaría para limpiarla
+            self.full_redraw_pending = self.is_transitioning
+            self.frame_stats.add(mode, interval, time.perf_counter() - work_start)
             
-            # 5. Dibujar Overlay de Transición (el fundido a negro)
-            if self.transition_alpha > 0:
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                overlay.fill((0, 0, 0))
-                overlay.set_alpha(int(self.transition_alpha))
-                self.screen.blit(overlay, (0, 0))
-
-            pygame.display.flip()
-            
+        if FRAME_STATS_REPORT:
+            print("Tiempos por frame:")
+            self.frame_stats.print_report()
+
         # Al salir del bucle principal, detenemos la música y cerramos Pygame.
         pygame.mixer.music.stop()
         pygame.quit()
         
+# ======================================================
+# HORNEADO DE ASSETS (python main.py bake)
+# ======================================================
+
+def collect_asset_manifest():
+    """Junta los ASSET_MANIFEST de todas las escenas de SCENE_MAP y del Player."""
+    entries = []
+    module_paths = list(SCENE_MAP.values()) + ['game.player']
+    for module_path in module_paths:
+        module = importlib.import_module(module_path)
+        entries.extend(getattr(module, 'ASSET_MANIFEST', []))
+    return entries
+
+def bake(workers=None):
+    """Genera en BAKED_PATH las variantes a resolución de pantalla de todos los assets usados."""
+    entries = collect_asset_manifest()
+    print(f"Horneando {len(entries)} variantes en '{BAKED_PATH}'...")
+    manifest = bake_assets(entries, ASSETS_PATH, BAKED_PATH, workers=workers)
+    print(f"✅ {len(manifest)} variantes horneadas.")
+
+    # El guion también se compila acá, validando los campos de las condiciones
+    fields = {k for k in vars(GameState()) if not k.startswith('_')}
+    try:
+        compiled = compile_file(NARRATIVE_SCRIPT_PATH, NARRATIVE_COMPILED_PATH, fields)
+        print(f"✅ Guion compilado en '{NARRATIVE_COMPILED_PATH}' ({len(compiled)} bytes).")
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo compilar el guion {NARRATIVE_SCRIPT_PATH}: {e}")
+
 if __name__ == '__main__':
-    game = Game()
-    game.run()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == 'bake':
+        bake(int(sys.argv[2]) if len(sys.argv) > 2 else None)
+    else:
+        game = Game()
+        game.run()
\ No newline at end of file
@@ -1,11 +1,32 @@
 import pygame
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image, scale_image, px, fonts, FONT_BUTTON
 from engine.scene_manager import Scene
 from engine.ui import Button
 from game.player import Player, CHARACTER_HEIGHT
+from game.state import OUTFIT_FIELDS
+from engine.background import ScrollingBackground
+from engine.camera import Camera
 
 GROUND_Y = SCREEN_HEIGHT * 0.9
 
+# Altura de las prendas arrastrables (0.35x del arte original de 1080 px)
+ITEM_HEIGHT = px(378)
+
+CLOTHES_ASSETS = [
+    "black and white sweater.png",
+    "shirt charly garcia.png",
+    "shirt soda estereo.png",
+    "shirt spider punk.png",
+    "starry sweater.png",
+    "stripped sweater.png"
+]
+
+# Assets propios de la escena y el tamaño al que se dibujan (ver `python main.py bake`)
+ASSET_MANIFEST = [
+    ("images/rooms", "closet.png", SCREEN_HEIGHT),
+    ("images/rooms", "open closet.png", SCREEN_HEIGHT),
+] + [("clothes", name, ITEM_HEIGHT) for name in CLOTHES_ASSETS]
+
 class DraggableItem:
     """Clase simple para manejar un item de vestuario arrastrable."""
     def __init__(self, asset_name, asset_type, image, center_pos):
@@ -44,24 +65,56 @@ class DraggableItem:
 
 
 class ClosetScene(Scene):
+    # Se reutiliza al volver desde la habitación (ver engine/scene_pool.py)
+    keep_alive = True
+    next_scenes = ('ROOM',)
+    transition = 'crossfade' # desde la habitación, el armario aparece fundido
+    transition_duration = 0.6
+
     def __init__(self, game):
         super().__init__(game)
         self.state = self.game.state
         self.closet_open = False
 
+        # Botones
+        font = fonts.get(*FONT_BUTTON) # compartida con las otras escenas (engine/fonts.py)
+        self.btn_toggle_closet = Button(
+            rect=(SCREEN_WIDTH - px(220), SCREEN_HEIGHT // 2 - px(50), px(180), px(50)),
+            text="Abrir armario",
+            font=font,
+            callback=self.toggle_closet
+        )
+        self.btn_go_room = Button(
+            rect=(px(40), SCREEN_HEIGHT - px(70), px(150), px(50)),
+            text="Volver al cuarto",
+            font=font,
+            callback=self.go_room
+        )
+        self.buttons = [self.btn_toggle_closet, self.btn_go_room]
+
+        # Items arrastrables (se crean en load_steps)
+        self.draggable_items = []
+        self.dragging_item = None
+
+    def load_steps(self):
+        """Carga fondos, personaje y prendas; se reparte en varios frames durante el fundido."""
         # Fondos
         try:
-            self.background_closed_img = load_image("images/rooms", "closet.png")
-            self.background_open_img = load_image("images/rooms", "open closet.png")
+            self.background_closed_img = load_image("images/rooms", "closet.png", scale_height=SCREEN_HEIGHT)
+            self.background_open_img = load_image("images/rooms", "open closet.png", scale_height=SCREEN_HEIGHT)
         except Exception as e:
             print(f"Error al cargar fondos: {e}")
             self.background_closed_img = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
             self.background_closed_img.fill((50, 50, 50))
             self.background_open_img = self.background_closed_img
 
-        self.background_closed = self._scale_background(self.background_closed_img)
-        self.background_open = self._scale_background(self.background_open_img)
-        self.bg_x = (SCREEN_WIDTH - self.background_closed.get_width()) // 2
+        yield 0.3
+
+        self.background_closed = ScrollingBackground(self._scale_background(self.background_closed_img))
+        self.background_open = ScrollingBackground(self._scale_background(self.background_open_img))
+        # Cámara fija centrada en el fondo (si es más angosto que la pantalla, queda centrado igual)
+        self.camera = Camera((SCREEN_WIDTH, SCREEN_HEIGHT), (self.background_closed.width, SCREEN_HEIGHT))
+        self.camera.center_on((self.background_closed.width / 2, SCREEN_HEIGHT / 2))
 
         # Player
         outfit = self.state.get_outfit_assets()
@@ -70,32 +123,20 @@ class ClosetScene(Scene):
         self.player = Player(
             body=outfit.get('body', default_body),
             head=outfit.get('head', default_head),
-            hat=outfit.get('hat')
+            hat=outfit.get('hat'),
+            clothes=outfit.get('clothes')
         )
         self.player.x = SCREEN_WIDTH // 4
         self.player.y = GROUND_Y
-
-        # Botones
-        font = pygame.font.Font(None, 32)
-        self.btn_toggle_closet = Button(
-            rect=(SCREEN_WIDTH - 220, SCREEN_HEIGHT // 2 - 50, 180, 50),
-            text="Abrir armario",
-            font=font,
-            callback=self.toggle_closet
-        )
-        self.btn_go_room = Button(
-            rect=(40, SCREEN_HEIGHT - 70, 150, 50),
-            text="Volver al cuarto",
-            font=font,
-            callback=self.go_room
-        )
-        self.buttons = [self.btn_toggle_closet, self.btn_go_room]
+        yield 0.4
 
         # Items arrastrables
-        self.draggable_items = self._setup_draggable_items()
-        self.dragging_item = None
+        for i, asset_name in enumerate(CLOTHES_ASSETS):
+            self.draggable_items.append(self._create_draggable_item(i, asset_name))
+            yield 0.4 + 0.6 * (i + 1) / len(CLOTHES_ASSETS)
 
     def _scale_background(self, img):
+        # Los fondos ya vienen a la altura de la pantalla; solo se agrandan si son angostos
         original_width = img.get_width()
         original_height = img.get_height()
         scale_ratio = SCREEN_HEIGHT / original_height
@@ -103,40 +144,48 @@ class ClosetScene(Scene):
             scale_ratio = SCREEN_WIDTH / original_width
         new_width = int(original_width * scale_ratio)
         new_height = int(original_height * scale_ratio)
-        return pygame.transform.scale(img, (new_width, new_height))
-
-    def _setup_draggable_items(self):
-        items = []
-        clothes_assets = [
-            "black and white sweater.png",
-            "shirt charly garcia.png",
-            "shirt soda estereo.png",
-            "shirt spider punk.png",
-            "starry sweater.png",
-            "stripped sweater.png"
-        ]
+        return scale_image(img, (new_width, new_height), smooth=False)
+
+    def _create_draggable_item(self, i, asset_name):
         center_x = SCREEN_WIDTH * 0.75
         center_y = SCREEN_HEIGHT * 0.55
-        stack_offset = 20
-        item_scale = 0.35
-
-        for i, asset_name in enumerate(clothes_assets):
-            body_img = load_image('clothes', asset_name)
-            scaled_img = pygame.transform.scale(
-                body_img,
-                (int(body_img.get_width() * item_scale), int(body_img.get_height() * item_scale))
-            )
-            pos_x = center_x + (i % 3) * stack_offset - stack_offset
-            pos_y = center_y + (i // 3) * stack_offset
-            item = DraggableItem(asset_name, 'body', scaled_img, (pos_x, pos_y))
-            items.append(item)
-        return items
+        stack_offset = px(20)
+
+        scaled_img = load_image('clothes', asset_name, scale_height=ITEM_HEIGHT)
+        pos_x = center_x + (i % 3) * stack_offset - stack_offset
+        pos_y = center_y + (i // 3) * stack_offset
+        return DraggableItem(asset_name, 'body', scaled_img, (pos_x, pos_y))
 
     def toggle_closet(self):
         self.closet_open = not self.closet_open
         new_text = "Cerrar armario" if self.closet_open else "Abrir armario"
-        self.btn_toggle_closet.text = new_text
-        self.btn_toggle_closet.text_surface = self.btn_toggle_closet.font.render(new_text, True, (20, 20, 20))
+        self.btn_toggle_closet.set_text(new_text)
+
+    def on_enter(self):
+        """Al volver al armario: refresca el outfit y lo deja cerrado."""
+        self._apply_outfit()
+        self.state.subscribe(self._apply_outfit, OUTFIT_FIELDS)
+        if self.closet_open:
+            self.toggle_closet()
+        if self.dragging_item:
+            self.dragging_item.is_dragging = False
+            self.dragging_item.reset_position()
+            self.dragging_item = None
+        for btn in self.buttons:
+            btn.hover = False
+
+    def on_exit(self):
+        self.state.unsubscribe(self._apply_outfit)
+
+    def _apply_outfit(self, changed=None):
+        """Viste al jugador según el estado (también se llama al cambiar el outfit)."""
+        outfit = self.state.get_outfit_assets()
+        self.player.set_outfit(
+            body=outfit.get('body', 'cat body.png'),
+            head=outfit.get('head', 'cat head.png'),
+            hat=outfit.get('hat'),
+            clothes=outfit.get('clothes')
+        )
 
     def go_room(self):
         self.change_scene("ROOM")
@@ -168,15 +217,12 @@ class ClosetScene(Scene):
         item = self.dragging_item
         if not item:
             return
-        player_body_rect = pygame.Rect(0, 0, 100, 150)
+        player_body_rect = pygame.Rect(0, 0, px(100), px(150))
         player_body_rect.center = (int(self.player.x), int(self.player.y - CHARACTER_HEIGHT * 0.4))
 
         if item.asset_type == 'body' and item.rect.colliderect(player_body_rect):
+            # El jugador se vuelve a vestir en el flush del estado (ver _apply_outfit)
             self.state.set_outfit_part('body', item.asset_name)
-            self.player.body_asset = item.asset_name
-            self.player._load_parts()
-            self.player.image = self.player._create_composite_image()
-            self.player.rect = self.player.image.get_rect(midbottom=(self.player.x, self.player.y))
 
         item.reset_position()
 
@@ -185,15 +231,15 @@ class ClosetScene(Scene):
 
     def draw(self, screen):
         background = self.background_open if self.closet_open else self.background_closed
-        screen.blit(background, (self.bg_x, 0))
+        background.draw(screen, self.camera.x)
         self.player.draw(screen)
 
         if self.closet_open:
             player_body_x = int(self.player.x)
             player_body_y = int(self.player.y - CHARACTER_HEIGHT * 0.4)
-            target_surface = pygame.Surface((120, 180), pygame.SRCALPHA)
+            target_surface = pygame.Surface((px(120), px(180)), pygame.SRCALPHA)
             target_surface.fill((255, 100, 100, 100))
-            screen.blit(target_surface, (player_body_x - 60, player_body_y - 90))
+            screen.blit(target_surface, (player_body_x - px(60), player_body_y - px(90)))
             for item in self.draggable_items:
                 item.draw(screen)
 
@@ -1,47 +1,20 @@
 import pygame
-import random
 from engine.scene_manager import Scene
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image, get_scaled, px, text_cache, fonts, FONT_LABEL, FONT_INPUT
 from game.particles import StarField
 from game.sparks import SparkBurst 
+from engine.particles import AreaEmitter
+from engine.render_queue import LAYER_BACKGROUND, LAYER_WORLD, LAYER_EFFECTS, LAYER_UI
 
 
 # =====================================================================
 # ✨ SparkleEmitter
 # =====================================================================
-class SparkleEmitter:
+class SparkleEmitter(AreaEmitter):
+    """Destellos que aparecen alrededor del personaje, suben y se desvanecen."""
     def __init__(self, area_rect, count=10, color=(255,255,255)):
-        self.particles = []
-        self.area = area_rect
-        self.base_count = count
-        self.color = color
-
-    def update(self, dt):
-        while len(self.particles) < self.base_count:
-            x = random.randint(self.area.left, self.area.right)
-            y = random.randint(self.area.top, self.area.bottom)
-            size = random.randint(3,6)
-            speed = random.uniform(-10,-30)
-            life = random.uniform(1.4,2.3)
-
-            self.particles.append({
-                "x":x,"y":y,"size":size,
-                "alpha":255,"speed":speed,
-                "time":0,"life":life
-            })
-
-        for p in self.particles:
-            p["time"] += dt
-            p["y"] += p["speed"]*dt
-            p["alpha"] = max(0, 255*(1-(p["time"]/p["life"])) )
-
-        self.particles = [p for p in self.particles if p["alpha"]>0]
-
-    def draw(self, screen):
-        for p in self.particles:
-            surf = pygame.Surface((p["size"],p["size"]),pygame.SRCALPHA)
-            surf.fill((*self.color,int(p["alpha"])) )
-            screen.blit(surf,(p["x"],p["y"]))
+        super().__init__(area_rect, count=count, sizes=(px(3),px(4),px(5),px(6)), color=color,
+                         speed=(px(-10),px(-30)), lifetime=(1.4,2.3))
 
 
 
@@ -55,9 +28,10 @@ class TextBox:
         self.color_active = pygame.Color('dodgerblue2')
         self.color = self.color_inactive
         self.text = initial_text
-        self.font = font
+        self.font = fonts.resolve(font)
         self.active = False
-        self.txt_surface = self.font.render(self.text,True,pygame.Color('white'))
+        # El nombre cambia con cada tecla: se arma con glifos cacheados (engine/text.py)
+        self.glyphs = text_cache.atlas(self.font,(255,255,255))
 
     def handle_event(self,event):
         if event.type==pygame.MOUSEBUTTONDOWN:
@@ -73,12 +47,17 @@ class TextBox:
             else:
                 if len(self.text)<15:
                     self.text+=event.unicode
-            self.txt_surface=self.font.render(self.text,True,pygame.Color('white'))
 
     def draw(self,screen):
-        screen.blit(self.txt_surface,(self.rect.x+5,self.rect.y+5))
+        self.glyphs.draw(screen,self.text,(self.rect.x+px(5),self.rect.y+px(5)))
         pygame.draw.rect(screen,self.color,self.rect,2)
 
+    def render(self,queue,layer=LAYER_UI):
+        for sheet,dest,area in self.glyphs.blit_items(self.text,(self.rect.x+px(5),self.rect.y+px(5))):
+            queue.submit(sheet,dest,layer,area)
+        color,rect=self.color,self.rect.copy()
+        queue.submit_draw(lambda screen: pygame.draw.rect(screen,color,rect,2),layer,rect)
+
 
 
 # =====================================================================
@@ -90,10 +69,22 @@ CHARACTER_PARTS = {
     "hat":  ['None','hat graduation.png','hat santa claus.png','hat wizard.png'],
 }
 
-CHARACTER_HEIGHT  = 250
-CHARACTER_CENTER_X = (SCREEN_WIDTH//2)-200
+CHARACTER_HEIGHT  = px(250)
+CHARACTER_CENTER_X = (SCREEN_WIDTH//2)-px(200)
 CHARACTER_BOTTOM_Y = SCREEN_HEIGHT*0.9
-ARROW_SIZE = (40,40)
+ARROW_SIZE = (px(40),px(40))
+
+# Assets propios de la escena y el tamaño al que se dibujan (ver `python main.py bake`);
+# False al final: variante sin filtrar, como get_scaled(..., smooth=False)
+ASSET_MANIFEST = [
+    ('ui','background customize.png',(SCREEN_WIDTH,SCREEN_HEIGHT),False),
+    ('ui','arrow left.png',ARROW_SIZE,False),
+    ('ui','arrow right.png',ARROW_SIZE,False),
+    ('ui','button continue.png',(px(200),px(60)),False),
+] + [
+    ({"body":"bodies","head":"heads","hat":"hats"}[part],name,CHARACTER_HEIGHT)
+    for part,names in CHARACTER_PARTS.items() for name in names if name!='None'
+]
 
 
 
@@ -101,36 +92,30 @@ ARROW_SIZE = (40,40)
 # 🎨 CUSTOMIZE SCENE FINAL
 # =====================================================================
 class CustomizeScene(Scene):
+    next_scenes = ('ROOM',)
+
     def __init__(self,game):
         super().__init__(game)
-        self.font = pygame.font.Font(None,36)
-
-        self.background_img = pygame.transform.scale(
-            load_image('ui','background customize.png'),
-            (SCREEN_WIDTH,SCREEN_HEIGHT)
-        )
+        self.font = fonts.get(*FONT_LABEL)
+        self.label_surface = text_cache.render(self.font,"INGRESA TU NOMBRE:",(255,255,255))
 
         self.stars = StarField("images/ui/stars.gif",count=18,scale=1.1)
 
-        sparkle_area = pygame.Rect(CHARACTER_CENTER_X-60,450,300,200)
+        sparkle_area = pygame.Rect(CHARACTER_CENTER_X-px(60),px(450),px(300),px(200))
         self.sparkles = SparkleEmitter(sparkle_area,count=10)
 
         self.spark_burst = SparkBurst()
 
-        self.arrow_left_img  = pygame.transform.scale(load_image('ui','arrow left.png'),ARROW_SIZE)
-        self.arrow_right_img = pygame.transform.scale(load_image('ui','arrow right.png'),ARROW_SIZE)
-
-        self.confirm_button_rect = pygame.Rect(SCREEN_WIDTH-250,SCREEN_HEIGHT-100,200,60)
-        self.confirm_button_img  = pygame.transform.scale(load_image('ui','button continue.png'),(200,60))
+        self.confirm_button_rect = pygame.Rect(SCREEN_WIDTH-px(250),SCREEN_HEIGHT-px(100),px(200),px(60))
 
         self.choices={'body':0,'head':0,'hat':0}
 
         self.textbox = TextBox(
-            (SCREEN_WIDTH//2)+100,
+            (SCREEN_WIDTH//2)+px(100),
             SCREEN_HEIGHT//2,
-            300,
-            50,
-            font=pygame.font.Font(None,40),
+            px(300),
+            px(50),
+            font=FONT_INPUT,
             initial_text="Tu Nombre"
         )
 
@@ -138,16 +123,34 @@ class CustomizeScene(Scene):
 
 
 
+    # ---------------------------------------------------
+    def load_steps(self):
+        # imágenes de la escena, una por paso (ver engine/scene_loader.py)
+        self.background_img = get_scaled('ui','background customize.png',(SCREEN_WIDTH,SCREEN_HEIGHT),smooth=False)
+        yield 0.25
+        self.arrow_left_img  = get_scaled('ui','arrow left.png',ARROW_SIZE,smooth=False)
+        yield 0.4
+        self.arrow_right_img = get_scaled('ui','arrow right.png',ARROW_SIZE,smooth=False)
+        yield 0.55
+        self.confirm_button_img  = get_scaled('ui','button continue.png',(px(200),px(60)),smooth=False)
+        yield 0.7
+
+        # partes elegidas al entrar, para que el primer frame no tenga que cargarlas
+        for part in ('body','head'):
+            load_image(self._get_asset_path_key(part),CHARACTER_PARTS[part][self.choices[part]],scale_height=CHARACTER_HEIGHT)
+            yield 0.85 if part=='body' else 1.0
+
+
     # ---------------------------------------------------
     def _setup_selectors(self):
         w,h = ARROW_SIZE
         return {
-            'hat':  {'left':pygame.Rect(CHARACTER_CENTER_X-150,150,w,h),
-                     'right':pygame.Rect(CHARACTER_CENTER_X+150,150,w,h)},
-            'head': {'left':pygame.Rect(CHARACTER_CENTER_X-150,300,w,h),
-                     'right':pygame.Rect(CHARACTER_CENTER_X+150,300,w,h)},
-            'body': {'left':pygame.Rect(CHARACTER_CENTER_X-150,450,w,h),
-                     'right':pygame.Rect(CHARACTER_CENTER_X+150,450,w,h)},
+            'hat':  {'left':pygame.Rect(CHARACTER_CENTER_X-px(150),px(150),w,h),
+                     'right':pygame.Rect(CHARACTER_CENTER_X+px(150),px(150),w,h)},
+            'head': {'left':pygame.Rect(CHARACTER_CENTER_X-px(150),px(300),w,h),
+                     'right':pygame.Rect(CHARACTER_CENTER_X+px(150),px(300),w,h)},
+            'body': {'left':pygame.Rect(CHARACTER_CENTER_X-px(150),px(450),w,h),
+                     'right':pygame.Rect(CHARACTER_CENTER_X+px(150),px(450),w,h)},
         }
 
 
@@ -214,70 +217,60 @@ class CustomizeScene(Scene):
 
 
     # ----------------------------------------------------
-    def draw(self,screen):
-        screen.blit(self.background_img,(0,0))
-        self.stars.draw(screen)
+    def render(self,queue):
+        queue.submit(self.background_img,(0,0),LAYER_BACKGROUND)
+        self.stars.render(queue,LAYER_BACKGROUND+1)
 
-        self._draw_composed_character(screen)
+        self._render_composed_character(queue)
 
-        self.sparkles.draw(screen)
-        self.spark_burst.draw(screen)
+        self.sparkles.render(queue,LAYER_EFFECTS)
+        self.spark_burst.render(queue,LAYER_EFFECTS)
 
         for p,rc in self.selector_rects.items():
-            screen.blit(self.arrow_left_img,rc['left'])
-            screen.blit(self.arrow_right_img,rc['right'])
+            queue.submit(self.arrow_left_img,rc['left'].topleft,LAYER_UI)
+            queue.submit(self.arrow_right_img,rc['right'].topleft,LAYER_UI)
 
-        screen.blit(self.confirm_button_img,self.confirm_button_rect)
-        screen.blit(
-            self.font.render("INGRESA TU NOMBRE:",True,(255,255,255)),
-            (self.textbox.rect.x,self.textbox.rect.y-40)
-        )
+        queue.submit(self.confirm_button_img,self.confirm_button_rect.topleft,LAYER_UI)
+        queue.submit(self.label_surface,(self.textbox.rect.x,self.textbox.rect.y-px(40)),LAYER_UI)
 
-        self.textbox.draw(screen)
+        self.textbox.render(queue,LAYER_UI)
 
 
     # =================================================================
-    def _draw_composed_character(self, screen):
+    def _render_composed_character(self, queue):
         x=CHARACTER_CENTER_X
         y=CHARACTER_BOTTOM_Y
         parts=[]
 
+        # Todas las partes comparten el mismo lienzo original, así que escalarlas
+        # a la misma altura equivale a aplicarles el mismo factor que al cuerpo.
+
         # cuerpo
         body=CHARACTER_PARTS['body'][self.choices['body']]
-        body_img=load_image(self._get_asset_path_key('body'),body)
-        sc=CHARACTER_HEIGHT/body_img.get_height()
-        body_img=pygame.transform.scale(body_img,(int(body_img.get_width()*sc),CHARACTER_HEIGHT))
+        body_img=load_image(self._get_asset_path_key('body'),body,scale_height=CHARACTER_HEIGHT)
         body_rect=body_img.get_rect(midbottom=(x,y))
         parts.append((body_img,body_rect))
 
         # cabeza
         head=CHARACTER_PARTS['head'][self.choices['head']]
-        head_img=load_image('heads',head)
-        head_img=pygame.transform.scale(
-            head_img,
-            (int(head_img.get_width()*sc),int(head_img.get_height()*sc))
-        )
+        head_img=load_image('heads',head,scale_height=CHARACTER_HEIGHT)
         # 50 es la compensación de la cabeza respecto al cuello (body_rect.top)
-        head_rect=head_img.get_rect(midbottom=(x,body_rect.top+50))
+        head_rect=head_img.get_rect(midbottom=(x,body_rect.top+px(50)))
         parts.append((head_img,head_rect))
 
         # SOMBRERO corregido
         hat = CHARACTER_PARTS['hat'][self.choices['hat']]
         if hat != "None":
-            hat_img = load_image('hats', hat)
-            hat_img = pygame.transform.scale(
-                hat_img,
-                (int(hat_img.get_width()*sc), int(hat_img.get_height()*sc))
-            )
+            hat_img = load_image('hats', hat, scale_height=CHARACTER_HEIGHT)
 
             # VALORES MÁS GRANDES PARA BAJAR AÚN MÁS EL SOMBRERO
             HAT_OFFSETS = {
-                "hat graduation.png": 110, # Antes 70 -> Ahora 110
-                "hat santa claus.png": 80,  # Antes 50 -> Ahora 80
-                "hat wizard.png": 130, # Antes 90 -> Ahora 130
+                "hat graduation.png": px(110), # Antes 70 -> Ahora 110
+                "hat santa claus.png": px(80),  # Antes 50 -> Ahora 80
+                "hat wizard.png": px(130), # Antes 90 -> Ahora 130
             }
 
-            offset = HAT_OFFSETS.get(hat, 110) 
+            offset = HAT_OFFSETS.get(hat, px(110)) 
 
             # alineación correcta (¡sin flotación!)
             # midbottom de la cabeza (head_rect.top) más el offset positivo
@@ -287,6 +280,5 @@ class CustomizeScene(Scene):
 
             parts.append((hat_img, hat_rect))
 
-        # dibujar todo
-        for img,rect in parts:
-            screen.blit(img,rect)
\ No newline at end of file
+        # encolar todo (en orden: cuerpo, cabeza, sombrero)
+        queue.submit_many([(img,rect.topleft) for img,rect in parts],LAYER_WORLD)
\ No newline at end of file
@@ -1,30 +1,40 @@
 import pygame
 from engine.scene_manager import Scene
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image, WHITE
+from engine.render_queue import LAYER_BACKGROUND, LAYER_UI
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, get_scaled, WHITE, px, text_cache, fonts, FONT_FOOTER
+
+# Assets propios de la escena y el tamaño al que se dibujan (ver `python main.py bake`);
+# False al final: variante sin filtrar, como get_scaled(..., smooth=False)
+ASSET_MANIFEST = [
+    ("", "Egresaditos portada.gif", (SCREEN_WIDTH, SCREEN_HEIGHT), False),
+    ("ui", "button rewind.png", (px(280), px(100)), False),
+    ("ui", "button rewind.png", (px(300), px(110)), False),
+]
 
 class EndingScene(Scene):
+    next_scenes = ('TITLE',)
+    dirty_rects = True  # la pantalla solo cambia con el hover del botón
+    transition = 'wipe'
+
     def __init__(self, game):
         super().__init__(game)
 
         # Usaremos la misma fuente que TitleScene
-        self.font = pygame.font.Font(None, 48)
+        self.font = fonts.get(*FONT_FOOTER)
         self.footer_text = "¡Gracias por jugar!"
-        self.footer_surface = self.font.render(self.footer_text, True, WHITE)
+        self.footer_surface = text_cache.render(self.font, self.footer_text, WHITE)
         self.footer_rect = self.footer_surface.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT*0.95))
 
         # Cargar fondo: Se usa el mismo que en TitleScene
-        self.bg = load_image("", "Egresaditos portada.gif")
-        self.bg = pygame.transform.scale(self.bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.bg = get_scaled("", "Egresaditos portada.gif", (SCREEN_WIDTH, SCREEN_HEIGHT), smooth=False)
 
         # Botón Rewind (Reinicio)
-        self.btn_rewind_original = load_image("ui","button rewind.png")
-        
         # Tamaño del botón de reinicio (un poco más pequeño que el de Play)
-        BUTTON_WIDTH = 280
-        BUTTON_HEIGHT = 100
+        BUTTON_WIDTH = px(280)
+        BUTTON_HEIGHT = px(100)
         
-        self.btn_rewind = pygame.transform.scale(self.btn_rewind_original, (BUTTON_WIDTH, BUTTON_HEIGHT))
-        self.btn_rewind_hover = pygame.transform.scale(self.btn_rewind_original, (BUTTON_WIDTH + 20, BUTTON_HEIGHT + 10)) # Ligeramente más grande para hover
+        self.btn_rewind = get_scaled("ui", "button rewind.png", (BUTTON_WIDTH, BUTTON_HEIGHT), smooth=False)
+        self.btn_rewind_hover = get_scaled("ui", "button rewind.png", (BUTTON_WIDTH + px(20), BUTTON_HEIGHT + px(10)), smooth=False) # Ligeramente más grande para hover
         self.btn_rewind_rect = self.btn_rewind.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT*0.78))
         self.is_hovering = False
         
@@ -40,24 +50,32 @@ class EndingScene(Scene):
         
         # 2. Manejo de Hover (para detectar si el mouse está sobre el botón)
         if event.type == pygame.MOUSEMOTION:
-            self.is_hovering = self.btn_rewind_rect.collidepoint(event.pos)
+            is_hovering = self.btn_rewind_rect.collidepoint(event.pos)
+            if is_hovering != self.is_hovering:
+                self.is_hovering = is_hovering
+                # Solo cambia el botón: se redibuja su zona (la versión hover es la más grande)
+                self.mark_dirty(self.btn_rewind_hover.get_rect(center=self.btn_rewind_rect.center))
+
+    def is_idle(self):
+        # Nada se anima: solo cambia el hover del botón, que llega como evento
+        return True
 
     def update(self, dt):
         # No se necesita actualización compleja en la escena de final (por ahora)
         pass
 
-    def draw(self, screen):
+    def render(self, queue):
         # Dibujar fondo
-        screen.blit(self.bg, (0, 0))
+        queue.submit(self.bg, (0, 0), LAYER_BACKGROUND)
         
         # Dibujar el mensaje de agradecimiento
-        screen.blit(self.footer_surface, self.footer_rect)
+        queue.submit(self.footer_surface, self.footer_rect.topleft, LAYER_UI)
 
         # Dibujar botón de Rewind (con efecto hover)
         if self.is_hovering:
             # Dibujar la versión más grande (hover) centrada
             hover_rect = self.btn_rewind_hover.get_rect(center=self.btn_rewind_rect.center)
-            screen.blit(self.btn_rewind_hover, hover_rect)
+            queue.submit(self.btn_rewind_hover, hover_rect.topleft, LAYER_UI)
         else:
             # Dibujar la versión normal
-            screen.blit(self.btn_rewind, self.btn_rewind_rect)
\ No newline at end of file
+            queue.submit(self.btn_rewind, self.btn_rewind_rect.topleft, LAYER_UI)
\ No newline at end of file
@@ -2,24 +2,33 @@
 
 import pygame
 from engine.scene_manager import Scene
+from engine.background import ScrollingBackground
+from engine.camera import Camera
 from game.player import Player
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, get_scaled, px
 
 # --- CONSTANTES DE LA ESCENA ---
-CHARACTER_HEIGHT = 200
+CHARACTER_HEIGHT = px(200)
 CHARACTER_DEFAULT_X = int(SCREEN_WIDTH * 0.25)
 CHARACTER_GROUND_Y = int(SCREEN_HEIGHT * 0.98)
 FRIDGE_HOTSPOT_X = int(SCREEN_WIDTH * 0.8)
 BACKPACK_HOTSPOT_X = int(SCREEN_WIDTH * 0.6)
 
+# Assets propios de la escena y el tamaño al que se dibujan (ver `python main.py bake`)
+ASSET_MANIFEST = [
+    ("images/rooms", "kitchen.png", (SCREEN_WIDTH, SCREEN_HEIGHT)),
+]
+
 class KitchenScene(Scene):
+    next_scenes = ('ROOM',)
 
     def __init__(self, game):
         super().__init__(game)
         
         # ... (Fondo: kitchen.png, UI, Hotspots se mantienen) ...
-        img = load_image("images/rooms", "kitchen.png")
-        self.background_img = pygame.transform.smoothscale(img, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background_img = get_scaled("images/rooms", "kitchen.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background = ScrollingBackground(self.background_img)
+        self.camera = Camera((SCREEN_WIDTH, SCREEN_HEIGHT), (self.background.width, SCREEN_HEIGHT))
 
         # --- Inicialización del personaje (carga outfit y posición) ---
         initial_x = self.game.state.player_x if self.game.state.player_x != 0.0 else CHARACTER_DEFAULT_X
@@ -54,11 +63,11 @@ class KitchenScene(Scene):
         # --- Movimiento Local del Jugador ---
         keys = pygame.key.get_pressed()
         self.player.handle_input(keys)
-        self.player.update(dt, world_min_x=50, world_max_x=SCREEN_WIDTH - 50) 
+        self.player.update(dt, world_min_x=px(50), world_max_x=SCREEN_WIDTH - px(50)) 
         
         # ... (Detección de Hotspots se mantiene) ...
 
     # ================================================================
     def draw(self, screen):
-        # ... (Dibujo de fondo, jugador (camera_x=0), UI y Menús se mantiene) ...
-        pass
\ No newline at end of file
+        self.background.draw(screen, self.camera.x)
+        # ... (Dibujo de jugador (con self.camera), UI y Menús se mantiene) ...
\ No newline at end of file
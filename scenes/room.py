@@ -1,11 +1,16 @@
 import pygame
 import os
 # Importamos explícitamente load_image, SCREEN_WIDTH y SCREEN_HEIGHT, y get_asset_path (aunque no se use directamente, es bueno tenerlo si lo usas en otro lado)
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image, get_asset_path
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image, scale_image, get_asset_path, CAMERA_SMOOTHING, px, get_scaled, fonts, FONT_BUTTON, FONT_NARRATOR, narrative_script
 from engine.scene_manager import Scene
 from engine.ui import Button
 from engine.narrator import Narrator
+from engine.dialogue import DialogueBox
+from engine.background import ScrollingBackground
+from engine.camera import Camera
+from engine.render_queue import LAYER_BACKGROUND, LAYER_WORLD, LAYER_UI
 from game.player import Player 
+from game.state import OUTFIT_FIELDS
 
 # La carga se realiza directamente en __init__ para garantizar
 # que load_image() sea llamada con los DOS argumentos requeridos.
@@ -13,45 +18,98 @@ from game.player import Player
 # La posición Y en el suelo (0.9 de la altura de la pantalla, como en Player)
 GROUND_Y = SCREEN_HEIGHT * 0.9
 
+# Assets propios de la escena y el tamaño al que se dibujan (ver `python main.py bake`)
+ASSET_MANIFEST = [
+    ("images/rooms", "day room.png", SCREEN_HEIGHT),
+    ("ui", "dialogue.png", (SCREEN_WIDTH, SCREEN_HEIGHT)),
+]
+
+# Zona del texto dentro del recuadro de dialogue.png
+DIALOGUE_TEXT_RECT = (px(170), px(440), px(940), px(240))
+
 class RoomScene(Scene):
+    # Se reutiliza al volver del armario o la cocina (ver engine/scene_pool.py)
+    keep_alive = True
+    next_scenes = ('CLOSET_OUTFIT', 'KITCHEN')
+
     def __init__(self, game):
         super().__init__(game)
         
         self.state = self.game.state
 
-        # Fondo: CARGA DIRECTA CON DOS ARGUMENTOS
+        # ===========================
+        # BOTONES
+        # ===========================
+        font = fonts.get(*FONT_BUTTON) # compartida con las otras escenas (engine/fonts.py)
+        
+        # Botón Armario: a la derecha de la escena
+        self.btn_open_closet = Button(
+            rect=(SCREEN_WIDTH - px(220), SCREEN_HEIGHT // 2 - px(50), px(180), px(50)),
+            text="Abrir armario",
+            font=font,
+            callback=self.go_closet
+        )
+
+        # Botón Cocina: a la izquierda de la escena
+        self.btn_go_kitchen = Button(
+            rect=(px(40), SCREEN_HEIGHT // 2 - px(50), px(180), px(50)),
+            text="Ir a cocina",
+            font=font,
+            callback=self.go_kitchen
+        )
+
+        self.buttons = [self.btn_open_closet, self.btn_go_kitchen]
+
+        # ===========================
+        # NARRADOR
+        # ===========================
+        # Las líneas salen de la sección ROOM del guion (narrative/script.json) al entrar
+        # y se escriben de a una letra en la caja de diálogo (ver engine/dialogue.py)
+        font = fonts.get(*FONT_NARRATOR)
+        self.narrator = Narrator(font, script=narrative_script, box=DialogueBox(font, DIALOGUE_TEXT_RECT))
+
+        # Cámara que sigue al jugador por la habitación (ver engine/camera.py)
+        self.camera = Camera((SCREEN_WIDTH, SCREEN_HEIGHT), smoothing=CAMERA_SMOOTHING)
+
+
+    # ===========================
+    # CARGA POR PASOS (ver engine/scene_loader.py)
+    # ===========================
+    def load_steps(self):
+        """Carga el fondo y el personaje; se reparte en varios frames durante el fundido."""
+        # Fondo: se carga ya escalado a la altura de la pantalla (mantiene el aspecto)
         try:
-            self.background_img = load_image("images/rooms", "day room.png")
+            self.background_img = load_image("images/rooms", "day room.png", scale_height=SCREEN_HEIGHT)
         except Exception as e:
             print(f"Error al cargar 'day room.png': {e}. Usando fondo de emergencia.")
             self.background_img = pygame.Surface((10, 10))
             self.background_img.fill((0, 0, 0)) # Fondo negro de emergencia
+        yield 0.4
         
         # =================================================================
         # CORRECCIÓN DE FONDO: Ajustar la escala manteniendo la proporción 
         # y asegurando que cubra toda la altura.
         # =================================================================
-        original_width = self.background_img.get_width()
-        original_height = self.background_img.get_height()
-        
-        # Calcular el factor de escala basado en la altura de la pantalla (mantiene el aspecto)
-        scale_ratio = SCREEN_HEIGHT / original_height
-        
-        # Si la imagen original es más angosta que la pantalla, la escalamos para que sea 2x el ancho de la pantalla (para scrolling)
-        if original_width * scale_ratio < SCREEN_WIDTH:
-            scale_ratio = (SCREEN_WIDTH * 2) / original_width
-        
-        new_width = int(original_width * scale_ratio)
+        new_width = self.background_img.get_width()
         new_height = SCREEN_HEIGHT # La altura siempre será la de la pantalla
+        
+        # Si la imagen es más angosta que la pantalla, la escalamos para que sea 2x el ancho de la pantalla (para scrolling)
+        if new_width < SCREEN_WIDTH:
+            new_width = SCREEN_WIDTH * 2
 
-        self.background = pygame.transform.scale(
+        # Fondo cortado en franjas: solo se dibuja lo que se ve (ver engine/background.py)
+        self.background = ScrollingBackground(scale_image(
             self.background_img, 
-            (new_width, new_height) 
-        )
+            (new_width, new_height),
+            smooth=False
+        ))
         
-        # La posición inicial del fondo: se centra la parte visible del fondo
-        self.bg_x = - (new_width - SCREEN_WIDTH) // 2 
+        # La cámara arranca centrada en el fondo
+        self.camera.set_world_size(self.background.width, SCREEN_HEIGHT)
+        self.camera.center_on((self.background.width / 2, SCREEN_HEIGHT / 2))
         
+        yield 0.6
+
         # ===========================
         # PERSONAJE
         # ===========================
@@ -60,41 +118,44 @@ class RoomScene(Scene):
         self.player = Player(
             body=outfit.get('body'),
             head=outfit.get('head'),
-            hat=outfit.get('hat')
+            hat=outfit.get('hat'),
+            clothes=outfit.get('clothes')
         )
         # Posición inicial del jugador (centrado en la vista de la cámara)
         self.player.x = SCREEN_WIDTH // 2
         # AÑADIDO: Aumentamos la velocidad para que el movimiento se sienta más ágil y suave
-        self.player.speed = 400 
-        
-        # ===========================
-        # BOTONES
-        # ===========================
-        font = pygame.font.Font(None, 32)
-        
-        # Botón Armario: a la derecha de la escena
-        self.btn_open_closet = Button(
-            rect=(SCREEN_WIDTH - 220, SCREEN_HEIGHT // 2 - 50, 180, 50),
-            text="Abrir armario",
-            font=font,
-            callback=self.go_closet
-        )
+        self.player.speed = px(400)
+        yield 0.9
 
-        # Botón Cocina: a la izquierda de la escena
-        self.btn_go_kitchen = Button(
-            rect=(40, SCREEN_HEIGHT // 2 - 50, 180, 50),
-            text="Ir a cocina",
-            font=font,
-            callback=self.go_kitchen
-        )
+        # Recuadro de la caja de diálogo (del tamaño de la pantalla)
+        self.narrator.box.set_frame(get_scaled("ui", "dialogue.png", (SCREEN_WIDTH, SCREEN_HEIGHT)))
+        yield 1.0
 
-        self.buttons = [self.btn_open_closet, self.btn_go_kitchen]
 
-        # ===========================
-        # NARRADOR
-        # ===========================
-        self.narrator = Narrator("narrative/script.json")
+    # ===========================
+    # CICLO DE VIDA (POOL DE ESCENAS)
+    # ===========================
+    def on_enter(self):
+        """Al volver a la habitación, el outfit puede haber cambiado en el armario."""
+        self._apply_outfit()
+        self.state.subscribe(self._apply_outfit, OUTFIT_FIELDS)
+        for btn in self.buttons:
+            btn.hover = False
+        self.narrator.enter('ROOM', self.state)
 
+    def on_exit(self):
+        self.state.unsubscribe(self._apply_outfit)
+        self.narrator.clear()
+
+    def _apply_outfit(self, changed=None):
+        """Viste al jugador según el estado (también se llama al cambiar el outfit)."""
+        outfit = self.state.get_outfit_assets()
+        self.player.set_outfit(
+            body=outfit.get('body'),
+            head=outfit.get('head'),
+            hat=outfit.get('hat'),
+            clothes=outfit.get('clothes')
+        )
 
     # ===========================
     # CAMBIO DE ESCENAS
@@ -131,6 +192,9 @@ class RoomScene(Scene):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_w or event.key == pygame.K_UP:
                 self.player.start_jump()
+            # 3. Diálogo: ESPACIO / ENTER completa la página o pasa a la siguiente
+            elif event.key in (pygame.K_SPACE, pygame.K_RETURN):
+                self.narrator.skip()
     
     # ===========================
     # UPDATE
@@ -151,38 +215,35 @@ class RoomScene(Scene):
         
         # Limita la posición X del jugador
         min_x = SCREEN_WIDTH // 4 
-        max_x = self.background.get_width() - SCREEN_WIDTH // 4 
+        max_x = self.background.width - SCREEN_WIDTH // 4 
         self.player.x = max(min(self.player.x, max_x), min_x)
 
         # --- ACTUALIZACIÓN DE SALTO Y GRAVEDAD ---
         # Pasamos dt para calcular la velocidad y gravedad correctamente.
         self.player.update(dt) 
         
-        # Calcula la posición del fondo (simulando que la cámara sigue al jugador)
-        self.bg_x = SCREEN_WIDTH // 2 - self.player.x
-        
-        # Limita la posición del fondo para que no se vea el borde negro
-        max_bg_x = SCREEN_WIDTH - self.background.get_width()
-        self.bg_x = max(min(0, self.bg_x), max_bg_x)
+        # La cámara sigue al jugador (sin salirse del fondo, para que no se vea el borde negro)
+        self.camera.follow((self.player.x, SCREEN_HEIGHT / 2), dt)
         
-        # --- Narrador ---
+        # --- Narrador (con SHIFT apretado el texto se escribe más rápido) ---
+        self.narrator.box.fast_forward(keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT])
         self.narrator.update(dt)
 
 
     # ===========================
-    # DRAW
+    # RENDER (ver engine/render_queue.py)
     # ===========================
-    def draw(self, screen):
-        # Dibuja el fondo
-        screen.blit(self.background, (self.bg_x, 0))
+    def render(self, queue):
+        # Fondo
+        self.background.render(queue, self.camera.x, LAYER_BACKGROUND)
 
-        # Dibuja el personaje
-        self.player.draw(screen)
+        # Personaje (en coordenadas del mundo; no se encola si no se ve)
+        self.player.render(queue, self.camera, LAYER_WORLD)
 
-        # Dibuja los botones 
+        # Botones
         for btn in self.buttons:
-            btn.draw(screen)
+            btn.render(queue, LAYER_UI)
 
-        # Dibuja el narrador
-        narrator_pos = (40, SCREEN_HEIGHT - 140)
-        self.narrator.draw(screen, narrator_pos)
\ No newline at end of file
+        # Narrador
+        narrator_pos = (px(40), SCREEN_HEIGHT - px(140))
+        self.narrator.render(queue, narrator_pos, LAYER_UI)
\ No newline at end of file
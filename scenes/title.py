@@ -1,8 +1,20 @@
 import pygame
 from engine.scene_manager import Scene
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, load_image, WHITE
+from engine.render_queue import LAYER_BACKGROUND, LAYER_UI
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, get_scaled, WHITE, px
+
+# Assets propios de la escena y el tamaño al que se dibujan (ver `python main.py bake`);
+# False al final: variante sin filtrar, como get_scaled(..., smooth=False)
+ASSET_MANIFEST = [
+    ("", "Egresaditos portada.gif", (SCREEN_WIDTH, SCREEN_HEIGHT), False),
+    ("ui", "button play.png", (px(330), px(120)), False),
+    ("ui", "button play.png", (px(350), px(130)), False),
+]
 
 class TitleScene(Scene):
+    next_scenes = ('CUSTOMIZE',)
+    dirty_rects = True  # la pantalla solo cambia con el hover del botón
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -10,13 +22,11 @@ class TitleScene(Scene):
         # Asumo que 'Egresaditos portada.gif' es un frame estático si no usamos librerías de GIF/Video.
         # Si prefieres usar la imagen estática 'Egresaditos portada.gif', asegúrate de que solo se cargue el primer frame.
         # Si no, podrías usar otra imagen si la portada.gif trae problemas.
-        self.bg = load_image("", "Egresaditos portada.gif")
-        self.bg = pygame.transform.scale(self.bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.bg = get_scaled("", "Egresaditos portada.gif", (SCREEN_WIDTH, SCREEN_HEIGHT), smooth=False)
 
         # Botón Play
-        self.btn_play_original = load_image("ui","button play.png")
-        self.btn_play = pygame.transform.scale(self.btn_play_original, (330, 120))
-        self.btn_play_hover = pygame.transform.scale(self.btn_play_original, (350, 130)) # Ligeramente más grande para hover
+        self.btn_play = get_scaled("ui", "button play.png", (px(330), px(120)), smooth=False)
+        self.btn_play_hover = get_scaled("ui", "button play.png", (px(350), px(130)), smooth=False) # Ligeramente más grande para hover
         self.btn_play_rect = self.btn_play.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT*0.78))
         self.is_hovering = False
         
@@ -33,21 +43,29 @@ class TitleScene(Scene):
         
         # 2. Manejo de Hover (para detectar si el mouse está sobre el botón)
         if event.type == pygame.MOUSEMOTION:
-            self.is_hovering = self.btn_play_rect.collidepoint(event.pos)
+            is_hovering = self.btn_play_rect.collidepoint(event.pos)
+            if is_hovering != self.is_hovering:
+                self.is_hovering = is_hovering
+                # Solo cambia el botón: se redibuja su zona (la versión hover es la más grande)
+                self.mark_dirty(self.btn_play_hover.get_rect(center=self.btn_play_rect.center))
+
+    def is_idle(self):
+        # Nada se anima: solo cambia el hover del botón, que llega como evento
+        return True
 
     def update(self, dt):
         # No se necesita actualización compleja en la escena de título (por ahora)
         pass
 
-    def draw(self, screen):
+    def render(self, queue):
         # Dibujar fondo
-        screen.blit(self.bg, (0, 0))
+        queue.submit(self.bg, (0, 0), LAYER_BACKGROUND)
         
         # Dibujar botón de Play (con efecto hover)
         if self.is_hovering:
             # Dibujar la versión más grande (hover) centrada
             hover_rect = self.btn_play_hover.get_rect(center=self.btn_play_rect.center)
-            screen.blit(self.btn_play_hover, hover_rect)
+            queue.submit(self.btn_play_hover, hover_rect.topleft, LAYER_UI)
         else:
             # Dibujar la versión normal
-            screen.blit(self.btn_play, self.btn_play_rect)
\ No newline at end of file
+            queue.submit(self.btn_play, self.btn_play_rect.topleft, LAYER_UI)
\ No newline at end of file
@@ -1,67 +1,127 @@
 import pygame
+from engine.scene_manager import Scene
 from engine.ui import Button
+from engine.text_layout import TextLayout
+from engine.render_queue import LAYER_BACKGROUND, LAYER_UI
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, px, text_cache, fonts, FONT_BUTTON, FONT_LABEL, FONT_LETTER
 
-class WriteLetterScene:
-    def __init__(self, manager, state):
-        self.manager = manager
-        self.screen = manager.screen
-        self.state = state
+# Esta escena todavía no usa imágenes de assets/
+ASSET_MANIFEST = []
+
+TEXT_COLOR = (20, 20, 20)
+STICKERS = ['estrella', 'corazon', 'nota']
+
+class WriteLetterScene(Scene):
+    next_scenes = ('ENDING',)
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.state = self.game.state
+
+        self.font = fonts.get(*FONT_LETTER)
+        self.title_surface = text_cache.render(fonts.get(*FONT_LABEL), "Escribí tu carta", TEXT_COLOR)
+
+        # Caja de la carta: el texto se acomoda a su ancho y se desplaza si no entra
+        self.box = pygame.Rect(px(40), px(100), SCREEN_WIDTH - px(120), px(260))
+        self.text_origin = (self.box.x + px(10), self.box.y + px(10))
+        self.text_height = self.box.height - px(20)
+        self.layout = TextLayout(self.font, self.box.width - px(20), TEXT_COLOR)
+        self.scroll = 0
 
-    def start(self):
-        self.font = pygame.font.SysFont(None, 24)
-        self.title = pygame.font.SysFont(None, 36)
         self.input_text = self.state.letter or "Querido profesor..."
-        self.cursor = 0
-        self.btn_save = Button((WIDTH-220, HEIGHT-80, 200, 50), "Guardar sobre", self.font, self.save_letter)
-        # sticker options (just names, el usuario puede poner imágenes en assets)
-        self.stickers = ['estrella','corazon','nota']
-        self.chosen_stickers = []
+        self._relayout()
+
+        self.btn_save = Button(
+            rect=(SCREEN_WIDTH - px(220), SCREEN_HEIGHT - px(80), px(200), px(50)),
+            text="Guardar sobre",
+            font=FONT_BUTTON,
+            callback=self.save_letter
+        )
+
+        # Opciones de stickers (solo nombres, el usuario puede poner imágenes en assets)
+        self.stickers = STICKERS
+        self.sticker_rects = [pygame.Rect(px(60 + 60 * i), px(420), px(48), px(32)) for i in range(len(STICKERS))]
+        self.sticker_labels = [text_cache.render(self.font, s[0].upper(), (30, 30, 30)) for s in STICKERS]
+        self.chosen_stickers = list(self.state.letter_stickers)
+        self._update_chosen()
+
+        # Lo que no cambia (fondo, caja, botones de stickers) se dibuja una sola vez:
+        # es un solo blit por frame y, con texturas, se sube una sola vez
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill((255, 250, 245))
+        pygame.draw.rect(self.background, (245, 245, 245), self.box)
+        for rect in self.sticker_rects:
+            pygame.draw.rect(self.background, (220, 220, 220), rect)
 
     def save_letter(self):
         self.state.letter = self.input_text
-        self.state.stickers = self.chosen_stickers
+        self.state.letter_stickers = list(self.chosen_stickers)
         self.state.save()
-        from scenes.ending import EndingScene
-        self.manager.push(EndingScene(self.manager, self.state))
+        self.change_scene('ENDING')
+
+    # ===========================
+    # TEXTO
+    # ===========================
+    def _relayout(self):
+        """Acomoda solo los párrafos que cambiaron y mantiene visible el final de la carta."""
+        self.layout.set_text(self.input_text)
+        _, cursor_y = self.layout.end_position()
+        line_height = self.layout.line_height
+        if cursor_y + line_height > self.scroll + self.text_height:
+            self.scroll = cursor_y + line_height - self.text_height
+            self.scroll = -(-self.scroll // line_height) * line_height  # renglones enteros
+        elif cursor_y < self.scroll:
+            self.scroll = cursor_y
+
+    def _update_chosen(self):
+        self.chosen_surface = text_cache.render(self.font, "Stickers: " + ",".join(self.chosen_stickers), (30, 30, 30))
+
+    # ===========================
+    # INPUT
+    # ===========================
+    def handle_input(self, event):
+        if self.btn_save.handle_event(event):
+            if event.type == pygame.MOUSEBUTTONDOWN and getattr(self.game, 'can_click', False):
+                self.btn_save.callback()
+            return
 
-    def handle_event(self, event):
-        self.btn_save.handle_event(event)
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_BACKSPACE:
                 self.input_text = self.input_text[:-1]
-            elif event.key == pygame.K_RETURN:
+            elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                 self.input_text += "\n"
-            else:
+            elif event.unicode and event.unicode.isprintable():
                 self.input_text += event.unicode
+            else:
+                return
+            self._relayout()
+
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx,my = event.pos
-            # sticker pick areas
-            if 60 < mx < 260 and 420 < my < 460:
-                idx = (mx-60)//60
-                if 0 <= idx < len(self.stickers):
-                    self.chosen_stickers.append(self.stickers[idx])
-
-    def update(self, dt):
-        pass
-
-    def render(self, surf):
-        surf.fill((255,250,245))
-        t = self.title.render("Escribí tu carta", True, (20,20,20))
-        surf.blit(t, (40,40))
-        # input box
-        box = pygame.Rect(40, 100, WIDTH-120, 260)
-        pygame.draw.rect(surf, (245,245,245), box)
-        lines = self.input_text.split('\n')
-        y = 110
-        for l in lines:
-            surf.blit(self.font.render(l, True, (20,20,20)), (50, y))
-            y += 24
-        # sticker palette
-        x = 60
-        for s in self.stickers:
-            pygame.draw.rect(surf, (220,220,220), (x, 420, 48, 32))
-            surf.blit(self.font.render(s[0].upper(), True, (30,30,30)), (x+14, 426))
-            x += 60
-        # chosen stickers preview
-        surf.blit(self.font.render("Stickers: " + ",".join(self.chosen_stickers), True, (30,30,30)), (40, 360))
-        self.btn_save.draw(surf)
\ No newline at end of file
+            for name, rect in zip(self.stickers, self.sticker_rects):
+                if rect.collidepoint(event.pos):
+                    self.chosen_stickers.append(name)
+                    self._update_chosen()
+
+    def is_idle(self):
+        # Todo cambia con eventos (teclas, clicks); no hay animaciones
+        return True
+
+    # ===========================
+    # RENDER (ver engine/render_queue.py)
+    # ===========================
+    def render(self, queue):
+        queue.submit(self.background, (0, 0), LAYER_BACKGROUND)
+        queue.submit(self.title_surface, (px(40), px(40)), LAYER_UI)
+
+        # Caja de texto: solo los renglones visibles, cada uno con su superficie cacheada
+        x, y = self.text_origin
+        for surface, line_y in self.layout.visible(self.scroll, self.text_height):
+            queue.submit(surface, (x, y + line_y), LAYER_UI)
+
+        # Paleta de stickers
+        for rect, label in zip(self.sticker_rects, self.sticker_labels):
+            queue.submit(label, label.get_rect(center=rect.center).topleft, LAYER_UI)
+
+        # Stickers elegidos
+        queue.submit(self.chosen_surface, (px(40), px(370)), LAYER_UI)
+        self.btn_save.render(queue, LAYER_UI)
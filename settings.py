@@ -1,29 +1,165 @@
 import pygame
 import os
+from engine.image_cache import ImageCache, TransformCache
+from engine.bake import BakedAssets, size_spec, scale_variant
+from engine.raw_cache import RawImageCache
+from engine.pixel_format import classify, apply_format
+from engine.text import TextCache
+from engine.fonts import FontRegistry
+from engine.narrative import NarrativeScript
 
 # ==============================
 # CONFIGURACIÓN DE LA PANTALLA
 # ==============================
-SCREEN_WIDTH = 1280
-SCREEN_HEIGHT = 720
+# Resolución de diseño: las posiciones y tamaños de las escenas están pensados para 1280x720.
+# La ventana siempre tiene este tamaño.
+DESIGN_WIDTH = 1280
+DESIGN_HEIGHT = 720
+WINDOW_SIZE = (DESIGN_WIDTH, DESIGN_HEIGHT)
+
+# Escala de render (modo rendimiento): con 0.5 o 0.75 el juego dibuja en un framebuffer
+# más chico que se agranda a la ventana una vez por frame, y los assets se cargan a
+# ese tamaño (menos memoria). 1.0 = resolución completa.
+RENDER_SCALE = 1.0
+
+def px(value):
+    """Convierte una medida en píxeles de diseño (1280x720) a píxeles de render."""
+    return int(round(value * RENDER_SCALE))
+
+# Tamaño del framebuffer donde dibujan las escenas
+SCREEN_WIDTH = px(DESIGN_WIDTH)
+SCREEN_HEIGHT = px(DESIGN_HEIGHT)
 SCREEN_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT) # Añadido
 CAPTION = "Egresaditos – La Última Semana" # Actualizado
 FPS = 60 # Frames per second (Añadido)
 
+# Backend de dibujo: 'surface' (blits por software sobre la ventana, ver engine/framebuffer.py)
+# o 'texture' (pygame._sdl2: los assets se suben una vez como texturas, ver engine/texture_backend.py)
+RENDER_BACKEND = 'surface'
+# Renderer de SDL para el backend 'texture': None = el que elija SDL (GPU si hay), 'software' = sin GPU
+TEXTURE_RENDERER_DRIVER = None
+
+# Cantidad máxima de escenas suspendidas (keep_alive) que se guardan entre transiciones
+SCENE_POOL_SIZE = 3
+
+# Tiempo máximo por frame (ms) para cargar por pasos la escena entrante durante el fundido
+SCENE_LOAD_BUDGET_MS = 4
+
+# Precargar en un hilo secundario los assets de las escenas siguientes
+PREFETCH_ENABLED = True
+
+# Redibujar solo las zonas que cambiaron en las escenas que lo soportan (dirty_rects = True).
+# Si las zonas cubren más de esta fracción de la pantalla se dibuja el frame completo.
+DIRTY_RECTS_ENABLED = True
+DIRTY_RECTS_MAX_COVERAGE = 0.5
+
+# Ancho (px) de las franjas en que se cortan los fondos que se desplazan (engine/background.py)
+BACKGROUND_CHUNK_WIDTH = 256
+
+# Suavizado de la cámara que sigue al jugador (0 = sin suavizado; más alto = la alcanza más rápido)
+CAMERA_SMOOTHING = 8.0
+
+# Transición por defecto entre escenas (cada escena puede elegir otra, ver Scene.transition)
+TRANSITION_EFFECT = 'fade'
+TRANSITION_DURATION = 1.4 # segundos (salida + entrada)
+
+# Si la escena está quieta (Scene.is_idle), el bucle espera eventos en vez de
+# dibujar a FPS; igual se despierta cada IDLE_WAIT_TIMEOUT_MS.
+IDLE_PACING_ENABLED = True
+IDLE_WAIT_TIMEOUT_MS = 250
+
+# Caja de diálogo (engine/dialogue.py): letras por segundo y multiplicador al adelantar
+DIALOGUE_CHARS_PER_SECOND = 40
+DIALOGUE_FAST_FORWARD = 4
+
+# Imprimir al salir los histogramas de tiempo por frame (engine/frame_stats.py)
+FRAME_STATS_REPORT = False
+
 # ==============================
 # RUTAS Y CARGA DE ASSETS
 # ==============================
 ASSETS_PATH = "assets" # Root assets folder (debe estar en el directorio de ejecución)
 
+# Variantes pre-escaladas generadas con `python main.py bake`
+BAKED_PATH = os.path.join("build", "baked")
+
+# Caché en disco de píxeles ya decodificados y escalados (arranque rápido)
+RAW_CACHE_PATH = os.path.join("build", "rawcache")
+RAW_CACHE_ENABLED = True
+
+# Guion del narrador y su versión compilada (se regenera sola si el JSON cambia, ver engine/narrative.py)
+NARRATIVE_SCRIPT_PATH = os.path.join("narrative", "script.json")
+NARRATIVE_COMPILED_PATH = os.path.join("build", "narrative", "script.bin")
+
+# Elegir el formato de cada imagen según su transparencia (convert, colorkey o convert_alpha,
+# ver engine/pixel_format.py). Con False todo se carga con convert_alpha como antes.
+PIXEL_FORMAT_AUTO = True
+
+# Presupuesto de memoria del caché de imágenes decodificadas (bytes)
+IMAGE_CACHE_BUDGET = 256 * 1024 * 1024
+
+# Presupuesto de memoria del caché de variantes escaladas (bytes)
+TRANSFORM_CACHE_BUDGET = 128 * 1024 * 1024
+
+# Presupuesto de memoria del caché de personajes compuestos (game/player.py)
+PLAYER_COMPOSITE_CACHE_BUDGET = 16 * 1024 * 1024
+
+# Presupuesto de memoria del caché de textos renderizados (bytes)
+TEXT_CACHE_BUDGET = 4 * 1024 * 1024
+
+# Cachés compartidos por todas las escenas (ver engine/image_cache.py)
+image_cache = ImageCache(IMAGE_CACHE_BUDGET, convert=lambda key, image: prepare_image(image, *key))
+transform_cache = TransformCache(TRANSFORM_CACHE_BUDGET)
+baked_assets = BakedAssets(BAKED_PATH, ASSETS_PATH)
+raw_cache = RawImageCache(RAW_CACHE_PATH, enabled=RAW_CACHE_ENABLED)
+text_cache = TextCache(TEXT_CACHE_BUDGET)  # font.render cacheado y hojas de glifos (engine/text.py)
+fonts = FontRegistry()  # una pygame.font.Font por (cara, tamaño, estilo) (engine/fonts.py)
+narrative_script = NarrativeScript(NARRATIVE_SCRIPT_PATH, NARRATIVE_COMPILED_PATH)  # se abre al primer uso
+
 def get_asset_path(*paths):
     """Construye una ruta relativa a la carpeta de assets."""
     return os.path.join(ASSETS_PATH, *paths)
 
-def load_image(subfolder, filename, scale_height=None):
+def prepare_image(image, subfolder, filename, size=None, smooth=True):
+    """
+    Convierte una imagen decodificada al formato de pantalla más barato que la
+    dibuja igual: convert() si es opaca, colorkey + RLEACCEL si su transparencia
+    es todo o nada, convert_alpha() solo si hace falta (ver engine/pixel_format.py).
+    La clasificación se toma del manifiesto de horneado si la variante está
+    horneada; si no, se analiza la imagen.
+
+    Las imágenes sin escalar (size=None) no usan colorkey: suelen ser el origen
+    de un smoothscale, que mezclaría el color clave con los bordes.
+    """
+    if not PIXEL_FORMAT_AUTO:
+        return image.convert_alpha()
+    pixel_format = baked_assets.pixel_format(subfolder, filename, size, smooth) if size is not None else None
+    if pixel_format is None:
+        pixel_format = classify(image, allow_colorkey=size is not None)
+    return apply_format(image, *pixel_format)
+
+def load_image(subfolder, filename, scale_height=None, smooth=False):
     """
     Carga una imagen, verifica su existencia y opcionalmente la reescala por altura.
     La subcarpeta es la carpeta dentro de 'assets/' (ej: 'bodies', 'clothes').
+    El resultado se guarda en `image_cache`: la superficie devuelta es compartida
+    y no debe modificarse. Las variantes escaladas se buscan antes en el caché
+    crudo y en los assets horneados. Por altura se escala sin filtrar, como
+    siempre; `smooth=True` pide la variante suavizada.
     """
+    if smooth or scale_height is None:
+        key = (subfolder, filename, scale_height)
+    else:
+        key = (subfolder, filename, scale_height, False)
+    cached = image_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if scale_height is not None:
+        image = _load_variant(subfolder, filename, scale_height, smooth)
+        if image is not None:
+            return image_cache.put(key, image)
+
     path = get_asset_path(subfolder, filename)
     
     # 1. Verificar si existe (de tu código)
@@ -45,13 +181,129 @@ def load_image(subfolder, filename, scale_height=None):
 
     # 3. Escalado (Mantenido - crucial para el personaje)
     if scale_height is not None:
-        aspect_ratio = image.get_width() / image.get_height()
-        new_width = int(scale_height * aspect_ratio)
-        image = pygame.transform.scale(image, (new_width, scale_height))
+        image = scale_variant(image, scale_height, smooth)
+        raw_cache.store(path, size_spec(scale_height, smooth), image)
         
+    return image_cache.put(key, prepare_image(image, subfolder, filename, scale_height, smooth))
+
+def _load_variant(subfolder, filename, size, smooth=True):
+    """
+    Busca una variante ya escalada de una imagen: primero en el caché crudo
+    (mmap, sin descompresión) y después entre los assets horneados.
+    Devuelve None si no hay ninguna vigente.
+    """
+    source = get_asset_path(subfolder, filename)
+    spec = size_spec(size, smooth)
+    image = raw_cache.load(source, spec, convert=lambda raw: prepare_image(raw, subfolder, filename, size, smooth))
+    if image is not None:
+        return image
+
+    baked = baked_assets.find(subfolder, filename, size, smooth)
+    if baked is None:
+        return None
+    try:
+        image = pygame.image.load(baked)
+    except pygame.error as e:
+        print(f"ERROR: No se pudo cargar la imagen horneada: {baked} - {e}")
+        baked_assets.discard(subfolder, filename, size, smooth)
+        return None
+    raw_cache.store(source, spec, image)
+    return prepare_image(image, subfolder, filename, size, smooth)
+
+def decode_asset(subfolder, filename, size, smooth=True):
+    """
+    Decodifica una entrada de ASSET_MANIFEST al tamaño final SIN convert_alpha,
+    para poder usarse desde un hilo secundario (ver engine/prefetch.py).
+    Escala con el filtro de la variante (`smooth`), así lo precargado es igual
+    a lo que cargaría la escena. Devuelve None si la imagen no existe o no se
+    puede leer.
+    """
+    source = get_asset_path(subfolder, filename)
+    spec = size_spec(size, smooth)
+    image = raw_cache.load(source, spec, convert=False)
+    if image is not None:
+        return image
+
+    try:
+        baked = baked_assets.find(subfolder, filename, size, smooth)
+        if baked is not None:
+            return pygame.image.load(baked)
+        if not os.path.exists(source):
+            return None
+        image = pygame.image.load(source)
+    except pygame.error:
+        return None
+
+    image = scale_variant(image, size, smooth)
+    raw_cache.store(source, spec, image)
     return image
 
+def scale_image(image, size, smooth=True):
+    """
+    Escala una superficie a `size` usando el caché de transformaciones.
+    `smooth=True` usa smoothscale; `smooth=False` usa scale (más rápido, sin filtrado).
+    """
+    return transform_cache.scale(image, size, smooth)
+
+def get_scaled(subfolder, filename, size, smooth=True):
+    """
+    Carga una imagen y la devuelve escalada a `size` (ancho, alto).
+    Cada variante se calcula una sola vez por proceso y se comparte entre escenas.
+    El filtro es parte de la variante: la suavizada y la sin filtrar (`smooth=False`)
+    tienen claves distintas en los cachés y en los assets horneados, así una
+    escena nunca recibe la que pidió la otra. En el ASSET_MANIFEST, las
+    variantes sin filtrar llevan un False al final: (subfolder, filename, size, False).
+    """
+    size = (int(size[0]), int(size[1]))
+    key = (subfolder, filename, size) if smooth else (subfolder, filename, size, False)
+    cached = image_cache.get(key)
+    if cached is not None:
+        return cached
+
+    image = _load_variant(subfolder, filename, size, smooth)
+    if image is None:
+        # Se escala directo desde el archivo, como load_image: ni el original a
+        # resolución completa ni la copia escalada sin convertir quedan en los cachés
+        path = get_asset_path(subfolder, filename)
+        if not os.path.exists(path):
+            print(f"⚠ Image not found → {path}")
+            placeholder = pygame.Surface(size)
+            placeholder.fill((255, 50, 50))
+            return placeholder
+        try:
+            image = pygame.image.load(path)
+        except pygame.error as e:
+            print(f"ERROR: No se pudo cargar la imagen: {path} - {e}")
+            placeholder = pygame.Surface(size)
+            placeholder.fill((255, 0, 0))
+            return placeholder
+        image = scale_variant(image, size, smooth)
+        raw_cache.store(path, size_spec(size, smooth), image)
+        image = prepare_image(image, subfolder, filename, size, smooth)
+    return image_cache.put(key, image)
+
+def load_asset(subfolder, filename, size, smooth=True):
+    """
+    Carga una entrada de ASSET_MANIFEST ya pasada por manifest_key (ver
+    engine/prefetch.py): `size` es una altura (int) o un tamaño (ancho, alto),
+    igual que en `python main.py bake`; `smooth=False` es la variante sin filtrar.
+    """
+    if isinstance(size, int):
+        return load_image(subfolder, filename, scale_height=size, smooth=smooth)
+    return get_scaled(subfolder, filename, size, smooth)
+
 # ==============================
 # COLORES Y ESTILO
 # ==============================
-WHITE = (255, 255, 255) # Añadido
\ No newline at end of file
+WHITE = (255, 255, 255) # Añadido
+
+# Fuentes de la interfaz: (cara, tamaño[, estilo]) para fonts.get / Button / TextBox.
+# Cara None = fuente por defecto de pygame.
+FONT_BUTTON = (None, px(32))
+FONT_LABEL = (None, px(36))
+FONT_INPUT = (None, px(40))
+FONT_FOOTER = (None, px(48))
+FONT_NARRATOR = (None, px(40))
+FONT_LETTER = (None, px(28))
+# Se cargan al iniciar el juego, así ninguna escena crea fuentes en su constructor
+FONT_PRELOAD = (FONT_BUTTON, FONT_LABEL, FONT_INPUT, FONT_FOOTER, FONT_NARRATOR, FONT_LETTER)
\ No newline at end of file